@@ -1,8 +1,10 @@
+import pickle
+
 import pandas as pd
 import pytest
 
 from statsforecast import StatsForecast
-from statsforecast.utils import AirPassengersDF as df
+from statsforecast.utils import AirPassengersDF as df, generate_series
 from statsforecast.models import (
     AutoARIMA,
     AutoETS,
@@ -101,3 +103,140 @@ def test_fit_predict(n_jobs):
     sf.fit(df=AirPassengersPanel)
     df_predict = sf.predict(h=7)
     pd.testing.assert_frame_equal(df_fcst, df_predict)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_forecast_chunk_size(chunk_size):
+    series = generate_series(5, equal_ends=False)
+    models = [
+        Naive(),
+        SeasonalNaive(season_length=7),
+        HistoricAverage(),
+        AutoETS(season_length=7),
+    ]
+    sf = StatsForecast(models=models, freq="D", n_jobs=1)
+    expected = sf.forecast(df=series, h=7, level=[80], fitted=True)
+    expected_fitted = sf.forecast_fitted_values()
+    sf = StatsForecast(models=models, freq="D", n_jobs=2, chunk_size=chunk_size)
+    actual = sf.forecast(df=series, h=7, level=[80], fitted=True)
+    pd.testing.assert_frame_equal(actual, expected)
+    pd.testing.assert_frame_equal(sf.forecast_fitted_values(), expected_fitted)
+    assert list(sf.forecast_times_.keys()) == [repr(m) for m in models]
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_invalid_chunk_size(chunk_size):
+    with pytest.raises(ValueError, match="chunk_size"):
+        StatsForecast(models=[Naive()], freq="D", chunk_size=chunk_size)
+
+
+def test_persistent_pool():
+    series = generate_series(4, equal_ends=True)
+    models = [Naive(), AutoETS(season_length=7)]
+    sf = StatsForecast(models=models, freq="D", n_jobs=1)
+    expected_fcst = sf.forecast(df=series, h=7)
+    expected_cv = sf.cross_validation(df=series, h=7, n_windows=2)
+    with StatsForecast(models=models, freq="D", n_jobs=2) as sf:
+        sf.fit(df=series)
+        pool = sf._pool
+        pd.testing.assert_frame_equal(sf.predict(h=7), expected_fcst)
+        pd.testing.assert_frame_equal(sf.forecast(df=series, h=7), expected_fcst)
+        cv = sf.cross_validation(df=series, h=7, n_windows=2)
+        pd.testing.assert_frame_equal(cv, expected_cv)
+        assert sf._pool is pool
+        # the pool isn't part of the pickled object
+        copy = pickle.loads(pickle.dumps(sf))
+        # and the copy doesn't keep the pools it creates alive
+        assert not copy._keep_pool
+        copy.predict(h=7)
+        assert not hasattr(copy, "_pool")
+    assert not hasattr(sf, "_pool")
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_shared_memory(chunk_size):
+    series = generate_series(5, n_static_features=1, equal_ends=True)
+    models = [Naive(), AutoETS(season_length=7)]
+    sf = StatsForecast(models=models, freq="D", n_jobs=1)
+    expected = sf.forecast(df=series, h=7, level=[80], fitted=True)
+    expected_fitted = sf.forecast_fitted_values()
+    expected_cv = sf.cross_validation(df=series, h=7, n_windows=2, fitted=True)
+    expected_cv_fitted = sf.cross_validation_fitted_values()
+    sf = StatsForecast(
+        models=models,
+        freq="D",
+        n_jobs=2,
+        chunk_size=chunk_size,
+        shared_memory=True,
+    )
+    actual = sf.forecast(df=series, h=7, level=[80], fitted=True)
+    pd.testing.assert_frame_equal(actual, expected)
+    pd.testing.assert_frame_equal(sf.forecast_fitted_values(), expected_fitted)
+    actual_cv = sf.cross_validation(df=series, h=7, n_windows=2, fitted=True)
+    pd.testing.assert_frame_equal(actual_cv, expected_cv)
+    pd.testing.assert_frame_equal(
+        sf.cross_validation_fitted_values(), expected_cv_fitted
+    )
+
+
+@pytest.mark.parametrize("shared_memory", [False, True])
+def test_cost_scheduling(shared_memory):
+    series = generate_series(9, min_length=20, max_length=200, equal_ends=True)
+    models = [Naive(), AutoETS(season_length=7)]
+    sf = StatsForecast(models=models, freq="D", n_jobs=1)
+    expected = sf.forecast(df=series, h=7, level=[80], fitted=True)
+    expected_fitted = sf.forecast_fitted_values()
+    expected_cv = sf.cross_validation(df=series, h=7, n_windows=2)
+    sf = StatsForecast(
+        models=models,
+        freq="D",
+        n_jobs=2,
+        shared_memory=shared_memory,
+        scheduling="cost",
+    )
+    # the second call uses the times measured by the first one
+    for _ in range(2):
+        actual = sf.forecast(df=series, h=7, level=[80], fitted=True)
+        pd.testing.assert_frame_equal(actual, expected)
+        pd.testing.assert_frame_equal(sf.forecast_fitted_values(), expected_fitted)
+    pd.testing.assert_frame_equal(
+        sf.cross_validation(df=series, h=7, n_windows=2), expected_cv
+    )
+    point_cols = [c for c in expected.columns if "-lo-" not in c and "-hi-" not in c]
+    pd.testing.assert_frame_equal(
+        sf.fit(df=series).predict(h=7), expected[point_cols]
+    )
+    pd.testing.assert_frame_equal(
+        sf.fit_predict(df=series, h=7, level=[80]), expected
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_threads_backend(chunk_size):
+    series = generate_series(5, n_static_features=1, equal_ends=True)
+    models = [Naive(), AutoETS(season_length=7)]
+    sf = StatsForecast(models=models, freq="D", n_jobs=1)
+    expected = sf.forecast(df=series, h=7, level=[80], fitted=True)
+    expected_fitted = sf.forecast_fitted_values()
+    expected_cv = sf.cross_validation(df=series, h=7, n_windows=2, fitted=True)
+    expected_cv_fitted = sf.cross_validation_fitted_values()
+    with pytest.warns(UserWarning, match="hold the GIL"):
+        sf = StatsForecast(
+            models=models,
+            freq="D",
+            n_jobs=2,
+            chunk_size=chunk_size,
+            backend="threads",
+        )
+    with sf:
+        actual = sf.forecast(df=series, h=7, level=[80], fitted=True)
+        pd.testing.assert_frame_equal(actual, expected)
+        pd.testing.assert_frame_equal(sf.forecast_fitted_values(), expected_fitted)
+        actual_cv = sf.cross_validation(df=series, h=7, n_windows=2, fitted=True)
+        pd.testing.assert_frame_equal(actual_cv, expected_cv)
+        pd.testing.assert_frame_equal(
+            sf.cross_validation_fitted_values(), expected_cv_fitted
+        )
+        pd.testing.assert_frame_equal(
+            sf.fit(df=series).predict(h=7, level=[80]), expected
+        )
@@ -0,0 +1,105 @@
+import warnings
+from time import perf_counter
+
+import fire
+import numpy as np
+import pandas as pd
+
+from statsforecast.models import ARIMA, AutoARIMA
+
+warnings.filterwarnings('ignore')
+
+
+def generate_series(n_series, length, season_length, seed=0):
+    # stationary ARMA(1, 1)(1, 0) processes plus a seasonal pattern and a level
+    rng = np.random.default_rng(seed)
+    burn = 10 * season_length
+    series = []
+    for _ in range(n_series):
+        phi, Phi, theta = rng.uniform(0.2, 0.7), rng.uniform(0.1, 0.5), rng.uniform(-0.5, 0.5)
+        e = rng.normal(size=length + burn)
+        y = np.zeros(length + burn)
+        for t in range(season_length + 1, length + burn):
+            y[t] = (
+                phi * y[t - 1]
+                + Phi * y[t - season_length]
+                - phi * Phi * y[t - season_length - 1]
+                + e[t]
+                + theta * e[t - 1]
+            )
+        t = np.arange(length)
+        y = y[burn:] + 3 * np.sin(2 * np.pi * t / season_length) + rng.uniform(10, 100)
+        series.append(y)
+    return series
+
+
+def refit(model, y, season_length):
+    # exact fit of the selected order, to split the time of the selection
+    arma = model['arma']
+    coef = model['coef']
+    arima = ARIMA(
+        order=(arma[0], arma[5], arma[1]),
+        season_length=season_length,
+        seasonal_order=(arma[2], arma[6], arma[3]),
+        include_mean='intercept' in coef,
+        include_drift='drift' in coef,
+    )
+    start = perf_counter()
+    arima.fit(y=y)
+    return perf_counter() - start
+
+
+def main(
+    n_series: int = 10,
+    length: int = 3000,
+    season_length: int = 24,
+    selection_length: int = 500,
+    stepwise: bool = True,
+):
+    series = generate_series(n_series, length, season_length)
+    modes = {
+        'default': AutoARIMA(season_length=season_length, stepwise=stepwise),
+        'fast': AutoARIMA(
+            season_length=season_length,
+            stepwise=stepwise,
+            selection_length=selection_length,
+        ),
+    }
+    results = []
+    for i, y in enumerate(series):
+        for mode, model in modes.items():
+            start = perf_counter()
+            fitted = model.new().fit(y=y).model_
+            total_time = perf_counter() - start
+            fit_time = refit(fitted, y, season_length)
+            arma = fitted['arma']
+            results.append(
+                {
+                    'serie': i,
+                    'mode': mode,
+                    'order': f'({arma[0]},{arma[5]},{arma[1]})({arma[2]},{arma[6]},{arma[3]})',
+                    'time (s)': total_time,
+                    'selection time (s)': max(total_time - fit_time, 0.0),
+                    'loglik': fitted['loglik'],
+                    'aicc': fitted['aicc'],
+                }
+            )
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False, float_format='{:.2f}'.format))
+    wide = results.pivot(index='serie', columns='mode')
+    summary = pd.DataFrame(
+        {
+            'time (s)': wide['time (s)'].sum(),
+            'selection time (s)': wide['selection time (s)'].sum(),
+        }
+    )
+    print(summary.to_string(float_format='{:.2f}'.format))
+    gap = wide['loglik']['default'] - wide['loglik']['fast']
+    same_order = (wide['order']['default'] == wide['order']['fast']).mean()
+    print(f'loglik gap (default - fast): mean {gap.mean():.2f}, max {gap.max():.2f}')
+    print(f'same order in {100 * same_order:.0f}% of the series')
+    results.to_csv(f'arima-fast-{length}-{season_length}.csv', index=False)
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,84 @@
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from statsforecast.models import (
+    ADIDA,
+    CrostonClassic,
+    CrostonOptimized,
+    CrostonSBA,
+    HistoricAverage,
+    IMAPA,
+    Naive,
+    RandomWalkWithDrift,
+    SeasonalNaive,
+    SeasonalWindowAverage,
+    TSB,
+    WindowAverage,
+)
+
+
+def generate_data(n_series, min_length=50, max_length=100, intermittent=False, seed=0):
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(min_length, max_length, size=n_series)
+    indptr = np.append(0, sizes.cumsum())
+    y = rng.random(indptr[-1], dtype=np.float32)
+    if intermittent:
+        y = np.where(rng.random(indptr[-1]) < 0.3, np.ceil(10 * y), 0).astype(np.float32)
+    return y, indptr
+
+
+def time_models(models, y, indptr, h):
+    times = []
+    for model in models:
+        # compile the kernels
+        model.forecast_batch(y=y[:indptr[2]], indptr=indptr[:3], h=h)
+        start = perf_counter()
+        for i in range(indptr.size - 1):
+            model.forecast(y=y[indptr[i] : indptr[i + 1]], h=h)
+        serie_time = perf_counter() - start
+        start = perf_counter()
+        model.forecast_batch(y=y, indptr=indptr, h=h)
+        batch_time = perf_counter() - start
+        times.append(
+            {
+                'model': repr(model),
+                'n_series': indptr.size - 1,
+                'serie_by_serie (s)': serie_time,
+                'batch (s)': batch_time,
+                'speedup': serie_time / batch_time,
+            }
+        )
+    return times
+
+
+def main():
+    models = [
+        HistoricAverage(),
+        Naive(),
+        RandomWalkWithDrift(),
+        SeasonalNaive(season_length=7),
+        WindowAverage(window_size=7),
+        SeasonalWindowAverage(season_length=7, window_size=4),
+    ]
+    intermittent_models = [
+        ADIDA(),
+        CrostonClassic(),
+        CrostonOptimized(),
+        CrostonSBA(),
+        IMAPA(),
+        TSB(alpha_d=0.2, alpha_p=0.2),
+    ]
+    results = []
+    for n_series in [10_000, 100_000, 1_000_000]:
+        y, indptr = generate_data(n_series)
+        results.extend(time_models(models, y, indptr, h=14))
+    for n_series in [10_000, 100_000]:
+        y, indptr = generate_data(n_series, intermittent=True)
+        results.extend(time_models(intermittent_models, y, indptr, h=14))
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False, float_format='{:.2f}'.format))
+
+
+if __name__ == '__main__':
+    main()
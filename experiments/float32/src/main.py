@@ -0,0 +1,118 @@
+import os
+from time import perf_counter
+
+import fire
+import numpy as np
+import pandas as pd
+from utilsforecast.losses import mase, smape
+
+from statsforecast import StatsForecast
+from statsforecast.models import (
+    GARCH,
+    MFLES,
+    AutoARIMA,
+    AutoCES,
+    AutoETS,
+    AutoTBATS,
+    AutoTheta,
+    SeasonalNaive,
+)
+
+os.environ['NIXTLA_ID_AS_COL'] = '1'
+
+
+def get_data(dataset, group, n_series=None):
+    # M3 is bundled with fcompdata, M4 must be downloaded first with
+    # `from fcompdata.download import download_m4; download_m4(group.lower())`
+    if dataset == 'M3':
+        from fcompdata import M3 as data
+    elif dataset == 'M4':
+        from fcompdata import M4 as data
+    else:
+        raise ValueError(f'dataset {dataset} not found')
+    series = list(data.subset(group.lower()))[:n_series]
+    train = pd.DataFrame({
+        'unique_id': np.repeat([s.sn for s in series], [len(s.x) for s in series]),
+        'ds': np.hstack([np.arange(1, len(s.x) + 1) for s in series]),
+        'y': np.hstack([s.x for s in series]),
+    })
+    test = pd.DataFrame({
+        'unique_id': np.repeat([s.sn for s in series], [len(s.xx) for s in series]),
+        'ds': np.hstack([np.arange(len(s.x) + 1, len(s.x) + len(s.xx) + 1) for s in series]),
+        'y': np.hstack([s.xx for s in series]),
+    })
+    return train, test, series[0].h, series[0].period
+
+
+def nbytes(obj):
+    # memory of the arrays kept by a fitted model
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sum(nbytes(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(nbytes(v) for v in obj)
+    if hasattr(obj, '__dict__'):
+        return nbytes(vars(obj))
+    return 0
+
+
+def main(
+    dataset: str = 'M3',
+    group: str = 'Monthly',
+    n_series: int = None,
+    models: str = 'SeasonalNaive,AutoETS,AutoCES,AutoTheta,AutoARIMA,AutoTBATS,MFLES,GARCH',
+):
+    train, test, horizon, seasonality = get_data(dataset, group, n_series)
+    all_models = {
+        'SeasonalNaive': SeasonalNaive(season_length=seasonality),
+        'AutoETS': AutoETS(season_length=seasonality),
+        'AutoCES': AutoCES(season_length=seasonality),
+        'AutoTheta': AutoTheta(season_length=seasonality),
+        'AutoARIMA': AutoARIMA(season_length=seasonality),
+        'AutoTBATS': AutoTBATS(season_length=seasonality),
+        'MFLES': MFLES(season_length=seasonality),
+        'GARCH': GARCH(),
+    }
+    names = models.split(',') if isinstance(models, str) else list(models)
+    # compile the kernels for both precisions before timing them
+    warmup_df = train[train['unique_id'].isin(train['unique_id'].unique()[:10])]
+    for dtype in ['float64', 'float32']:
+        StatsForecast(models=[all_models[name] for name in names], freq=1, dtype=dtype).fit(warmup_df).predict(h=horizon)
+    results = []
+    fcsts = {}
+    for dtype in ['float64', 'float32']:
+        for name in names:
+            model = all_models[name]
+            sf = StatsForecast(models=[model], freq=1, dtype=dtype)
+            start = perf_counter()
+            fcst = sf.fit(train).predict(h=horizon)
+            elapsed = perf_counter() - start
+            fcst = fcst.rename(columns={repr(model): name})
+            fcsts[dtype, name] = fcst[name].to_numpy()
+            fcst = fcst.merge(test, on=['unique_id', 'ds'])
+            results.append({
+                'group': group,
+                'model': name,
+                'dtype': dtype,
+                'time (s)': elapsed,
+                'series (MB)': sf.ga.data.nbytes / 2**20,
+                'fitted models (MB)': nbytes(list(sf.fitted_[:, 0])) / 2**20,
+                'sMAPE': 100 * smape(fcst, [name])[name].mean(),
+                'MASE': mase(fcst, [name], seasonality, train)[name].mean(),
+            })
+    results = pd.DataFrame(results)
+    # largest change of the forecasts relative to the level of their serie
+    level = train['y'].abs().groupby(train['unique_id']).mean()
+    level = level.loc[fcst['unique_id']].to_numpy()
+    results['max diff. (% of level)'] = [
+        100 * np.max(np.abs(fcsts['float32', name] - fcsts['float64', name]) / level) if dtype == 'float32' else np.nan
+        for name, dtype in zip(results['model'], results['dtype'])
+    ]
+    print(f'{dataset} {group}: {train["unique_id"].nunique():,} series, horizon {horizon}')
+    print(results.to_markdown(index=False, floatfmt='.3f'))
+    results.to_csv(f'{dataset}-{group}-float32.csv', index=False)
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -1,4 +1,4 @@
 __version__ = "1.7.6"
-__all__ = ["StatsForecast"]
-from .core import StatsForecast
+__all__ = ["StatsForecast", "warmup"]
+from .core import StatsForecast, warmup
 from .distributed import fugue  # noqa
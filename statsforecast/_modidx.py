@@ -13,7 +13,11 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'statsforecast/adapters/prophet.py'),
                                                 'statsforecast.adapters.prophet.AutoARIMAProphet.predict': ( 'src/adapters.prophet.html#autoarimaprophet.predict',
                                                                                                              'statsforecast/adapters/prophet.py')},
-            'statsforecast.arima': { 'statsforecast.arima.ARIMASummary': ('src/arima.html#arimasummary', 'statsforecast/arima.py'),
+            'statsforecast.arima': { 'statsforecast.arima.ARIMACache': ('src/arima.html#arimacache', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.ARIMACache.__init__': ( 'src/arima.html#arimacache.__init__',
+                                                                                  'statsforecast/arima.py'),
+                                     'statsforecast.arima.ARIMACache.get': ('src/arima.html#arimacache.get', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.ARIMASummary': ('src/arima.html#arimasummary', 'statsforecast/arima.py'),
                                      'statsforecast.arima.ARIMASummary.__init__': ( 'src/arima.html#arimasummary.__init__',
                                                                                     'statsforecast/arima.py'),
                                      'statsforecast.arima.ARIMASummary.__repr__': ( 'src/arima.html#arimasummary.__repr__',
@@ -32,16 +36,25 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/arima.py'),
                                      'statsforecast.arima.AutoARIMA.summary': ( 'src/arima.html#autoarima.summary',
                                                                                 'statsforecast/arima.py'),
+                                     'statsforecast.arima._cov_times_z': ('src/arima.html#_cov_times_z', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._fit_candidate': ('src/arima.html#_fit_candidate', 'statsforecast/arima.py'),
                                      'statsforecast.arima._make_arima': ('src/arima.html#_make_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._state_cov_predict': ( 'src/arima.html#_state_cov_predict',
+                                                                                 'statsforecast/arima.py'),
+                                     'statsforecast.arima._state_predict': ('src/arima.html#_state_predict', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima': ('src/arima.html#arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima2': ('src/arima.html#arima2', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_css': ('src/arima.html#arima_css', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_gradtrans': ('src/arima.html#arima_gradtrans', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_like': ('src/arima.html#arima_like', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.arima_like_grad': ('src/arima.html#arima_like_grad', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_string': ('src/arima.html#arima_string', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_transpar': ('src/arima.html#arima_transpar', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.arima_transpar_jac': ( 'src/arima.html#arima_transpar_jac',
+                                                                                 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_undopars': ('src/arima.html#arima_undopars', 'statsforecast/arima.py'),
                                      'statsforecast.arima.auto_arima_f': ('src/arima.html#auto_arima_f', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.cached': ('src/arima.html#cached', 'statsforecast/arima.py'),
                                      'statsforecast.arima.change_drift_name': ( 'src/arima.html#change_drift_name',
                                                                                 'statsforecast/arima.py'),
                                      'statsforecast.arima.checkarima': ('src/arima.html#checkarima', 'statsforecast/arima.py'),
@@ -56,22 +69,28 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.forecast_arima': ('src/arima.html#forecast_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.forward_arima': ('src/arima.html#forward_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.getQ0': ('src/arima.html#getq0', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.getQ0_jac': ('src/arima.html#getq0_jac', 'statsforecast/arima.py'),
                                      'statsforecast.arima.inclu2': ('src/arima.html#inclu2', 'statsforecast/arima.py'),
                                      'statsforecast.arima.invpartrans': ('src/arima.html#invpartrans', 'statsforecast/arima.py'),
                                      'statsforecast.arima.is_constant': ('src/arima.html#is_constant', 'statsforecast/arima.py'),
                                      'statsforecast.arima.kalman_forecast': ('src/arima.html#kalman_forecast', 'statsforecast/arima.py'),
                                      'statsforecast.arima.make_arima': ('src/arima.html#make_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.map_fits': ('src/arima.html#map_fits', 'statsforecast/arima.py'),
                                      'statsforecast.arima.myarima': ('src/arima.html#myarima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.ndiffs': ('src/arima.html#ndiffs', 'statsforecast/arima.py'),
                                      'statsforecast.arima.newmodel': ('src/arima.html#newmodel', 'statsforecast/arima.py'),
                                      'statsforecast.arima.nsdiffs': ('src/arima.html#nsdiffs', 'statsforecast/arima.py'),
                                      'statsforecast.arima.partrans': ('src/arima.html#partrans', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.partrans_jac': ('src/arima.html#partrans_jac', 'statsforecast/arima.py'),
                                      'statsforecast.arima.predict_arima': ('src/arima.html#predict_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.print_statsforecast_ARIMA': ( 'src/arima.html#print_statsforecast_arima',
                                                                                         'statsforecast/arima.py'),
+                                     'statsforecast.arima.regress_xreg': ('src/arima.html#regress_xreg', 'statsforecast/arima.py'),
                                      'statsforecast.arima.search_arima': ('src/arima.html#search_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.seas_heuristic': ('src/arima.html#seas_heuristic', 'statsforecast/arima.py'),
-                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py')},
+                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.update_arima': ('src/arima.html#update_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.warm_start_init': ('src/arima.html#warm_start_init', 'statsforecast/arima.py')},
             'statsforecast.ces': { 'statsforecast.ces._simulate_pred_intervals': ( 'src/ces.html#_simulate_pred_intervals',
                                                                                    'statsforecast/ces.py'),
                                    'statsforecast.ces.auto_ces': ('src/ces.html#auto_ces', 'statsforecast/ces.py'),
@@ -80,7 +99,9 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ces.cesfcst': ('src/ces.html#cesfcst', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesforecast': ('src/ces.html#cesforecast', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesmodel': ('src/ces.html#cesmodel', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.cessimulate': ('src/ces.html#cessimulate', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesupdate': ('src/ces.html#cesupdate', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.cesupdatestates': ('src/ces.html#cesupdatestates', 'statsforecast/ces.py'),
                                    'statsforecast.ces.forecast_ces': ('src/ces.html#forecast_ces', 'statsforecast/ces.py'),
                                    'statsforecast.ces.forward_ces': ('src/ces.html#forward_ces', 'statsforecast/ces.py'),
                                    'statsforecast.ces.initparamces': ('src/ces.html#initparamces', 'statsforecast/ces.py'),
@@ -90,10 +111,13 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsfcast_C': ('src/ces.html#pegelsfcast_c', 'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsresid_ces': ('src/ces.html#pegelsresid_ces', 'statsforecast/ces.py'),
-                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py')},
+                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.update_ces': ('src/ces.html#update_ces', 'statsforecast/ces.py')},
             'statsforecast.core': { 'statsforecast.core.GroupedArray': ('src/core/core.html#groupedarray', 'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.__eq__': ( 'src/core/core.html#groupedarray.__eq__',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.__getitem__': ( 'src/core/core.html#groupedarray.__getitem__',
+                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._get_cols': ( 'src/core/core.html#groupedarray._get_cols',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._output_fcst': ( 'src/core/core.html#groupedarray._output_fcst',
@@ -108,8 +132,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._single_threaded_predict': ( 'src/core/core.html#groupedarray._single_threaded_predict',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._single_threaded_update': ( 'src/core/core.html#groupedarray._single_threaded_update',
+                                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.cross_validation': ( 'src/core/core.html#groupedarray.cross_validation',
                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.data': ( 'src/core/core.html#groupedarray.data',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.extend': ( 'src/core/core.html#groupedarray.extend',
+                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.fit': ('src/core/core.html#groupedarray.fit', 'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.fit_predict': ( 'src/core/core.html#groupedarray.fit_predict',
                                                                                      'statsforecast/core.py'),
@@ -121,8 +151,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.split_fm': ( 'src/core/core.html#groupedarray.split_fm',
                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.split_ranges': ( 'src/core/core.html#groupedarray.split_ranges',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.split_ranges_by_cost': ( 'src/core/core.html#groupedarray.split_ranges_by_cost',
+                                                                                              'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.take': ( 'src/core/core.html#groupedarray.take',
                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.take_range': ( 'src/core/core.html#groupedarray.take_range',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.update': ( 'src/core/core.html#groupedarray.update',
+                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.ParallelBackend': ('src/core/core.html#parallelbackend', 'statsforecast/core.py'),
                                     'statsforecast.core.ParallelBackend.cross_validation': ( 'src/core/core.html#parallelbackend.cross_validation',
                                                                                              'statsforecast/core.py'),
@@ -137,43 +175,102 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.StatsForecast.forecast_fitted_values': ( 'src/core/core.html#statsforecast.forecast_fitted_values',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._LocalArrays': ('src/core/core.html#_localarrays', 'statsforecast/core.py'),
+                                    'statsforecast.core._LocalArrays.__init__': ( 'src/core/core.html#_localarrays.__init__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._LocalArrays.add_empty': ( 'src/core/core.html#_localarrays.add_empty',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._LocalArrays.attach': ( 'src/core/core.html#_localarrays.attach',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._LocalArrays.to_numpy': ( 'src/core/core.html#_localarrays.to_numpy',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._LocalArrays.unlink': ( 'src/core/core.html#_localarrays.unlink',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._ModelOutput': ('src/core/core.html#_modeloutput', 'statsforecast/core.py'),
+                                    'statsforecast.core._ModelOutput.__init__': ( 'src/core/core.html#_modeloutput.__init__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._ModelOutput.write': ( 'src/core/core.html#_modeloutput.write',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._ModelOutput.write_fitted': ( 'src/core/core.html#_modeloutput.write_fitted',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays': ('src/core/core.html#_sharedarrays', 'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.__getstate__': ( 'src/core/core.html#_sharedarrays.__getstate__',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.__init__': ( 'src/core/core.html#_sharedarrays.__init__',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.__setstate__': ( 'src/core/core.html#_sharedarrays.__setstate__',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays._create': ( 'src/core/core.html#_sharedarrays._create',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.add_empty': ( 'src/core/core.html#_sharedarrays.add_empty',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.attach': ( 'src/core/core.html#_sharedarrays.attach',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.to_numpy': ( 'src/core/core.html#_sharedarrays.to_numpy',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.unlink': ( 'src/core/core.html#_sharedarrays.unlink',
+                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast': ('src/core/core.html#_statsforecast', 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__enter__': ( 'src/core/core.html#_statsforecast.__enter__',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__exit__': ( 'src/core/core.html#_statsforecast.__exit__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__getstate__': ( 'src/core/core.html#_statsforecast.__getstate__',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__init__': ( 'src/core/core.html#_statsforecast.__init__',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__repr__': ( 'src/core/core.html#_statsforecast.__repr__',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._cross_validation_parallel': ( 'src/core/core.html#_statsforecast._cross_validation_parallel',
                                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._cross_validation_parallel_shared': ( 'src/core/core.html#_statsforecast._cross_validation_parallel_shared',
+                                                                                                             'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_parallel': ( 'src/core/core.html#_statsforecast._fit_parallel',
                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_predict_parallel': ( 'src/core/core.html#_statsforecast._fit_predict_parallel',
                                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._forecast_parallel': ( 'src/core/core.html#_statsforecast._forecast_parallel',
                                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_parallel_chunks': ( 'src/core/core.html#_statsforecast._forecast_parallel_chunks',
+                                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_parallel_shared': ( 'src/core/core.html#_statsforecast._forecast_parallel_shared',
+                                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._forecast_serie': ( 'src/core/core.html#_statsforecast._forecast_serie',
                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._get_arrays': ( 'src/core/core.html#_statsforecast._get_arrays',
+                                                                                       'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_cap_size': ( 'src/core/core.html#_statsforecast._get_cap_size',
                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_gas_Xs': ( 'src/core/core.html#_statsforecast._get_gas_xs',
                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_pool': ( 'src/core/core.html#_statsforecast._get_pool',
                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._get_ranges': ( 'src/core/core.html#_statsforecast._get_ranges',
+                                                                                       'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._make_future_df': ( 'src/core/core.html#_statsforecast._make_future_df',
                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._new_pool': ( 'src/core/core.html#_statsforecast._new_pool',
+                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._parse_X_level': ( 'src/core/core.html#_statsforecast._parse_x_level',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._predict_parallel': ( 'src/core/core.html#_statsforecast._predict_parallel',
                                                                                              'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._prepare_fit': ( 'src/core/core.html#_statsforecast._prepare_fit',
                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._prepare_fit_panel': ( 'src/core/core.html#_statsforecast._prepare_fit_panel',
+                                                                                              'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._set_prediction_intervals': ( 'src/core/core.html#_statsforecast._set_prediction_intervals',
                                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._update_parallel': ( 'src/core/core.html#_statsforecast._update_parallel',
+                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_exog': ( 'src/core/core.html#_statsforecast._validate_exog',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_model_names': ( 'src/core/core.html#_statsforecast._validate_model_names',
                                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_sizes_for_prediction_intervals': ( 'src/core/core.html#_statsforecast._validate_sizes_for_prediction_intervals',
                                                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.close': ( 'src/core/core.html#_statsforecast.close',
+                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation': ( 'src/core/core.html#_statsforecast.cross_validation',
                                                                                             'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation_fitted_values': ( 'src/core/core.html#_statsforecast.cross_validation_fitted_values',
@@ -186,6 +283,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.forecast_fitted_values': ( 'src/core/core.html#_statsforecast.forecast_fitted_values',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_iter': ( 'src/core/core.html#_statsforecast.forecast_iter',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.load': ( 'src/core/core.html#_statsforecast.load',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.plot': ( 'src/core/core.html#_statsforecast.plot',
@@ -194,14 +293,29 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.save': ( 'src/core/core.html#_statsforecast.save',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.update': ( 'src/core/core.html#_statsforecast.update',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._batches_by_id': ('src/core/core.html#_batches_by_id', 'statsforecast/core.py'),
+                                    'statsforecast.core._cross_validation_shared': ( 'src/core/core.html#_cross_validation_shared',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._estimate_costs': ('src/core/core.html#_estimate_costs', 'statsforecast/core.py'),
+                                    'statsforecast.core._forecast_shared': ('src/core/core.html#_forecast_shared', 'statsforecast/core.py'),
                                     'statsforecast.core._get_n_jobs': ('src/core/core.html#_get_n_jobs', 'statsforecast/core.py'),
                                     'statsforecast.core._id_as_idx': ('src/core/core.html#_id_as_idx', 'statsforecast/core.py'),
+                                    'statsforecast.core._iter_source': ('src/core/core.html#_iter_source', 'statsforecast/core.py'),
+                                    'statsforecast.core._load_panel': ('src/core/core.html#_load_panel', 'statsforecast/core.py'),
                                     'statsforecast.core._maybe_warn_sort_df': ( 'src/core/core.html#_maybe_warn_sort_df',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._maybe_warn_threads': ( 'src/core/core.html#_maybe_warn_threads',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._warm_worker': ('src/core/core.html#_warm_worker', 'statsforecast/core.py'),
+                                    'statsforecast.core._warmup_serie': ('src/core/core.html#_warmup_serie', 'statsforecast/core.py'),
                                     'statsforecast.core._warn_df_constructor': ( 'src/core/core.html#_warn_df_constructor',
                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core._warn_id_as_idx': ('src/core/core.html#_warn_id_as_idx', 'statsforecast/core.py'),
-                                    'statsforecast.core.make_backend': ('src/core/core.html#make_backend', 'statsforecast/core.py')},
+                                    'statsforecast.core.make_backend': ('src/core/core.html#make_backend', 'statsforecast/core.py'),
+                                    'statsforecast.core.save_panel': ('src/core/core.html#save_panel', 'statsforecast/core.py'),
+                                    'statsforecast.core.warmup': ('src/core/core.html#warmup', 'statsforecast/core.py')},
             'statsforecast.distributed.fugue': { 'statsforecast.distributed.fugue.FugueBackend': ( 'src/core/distributed.fugue.html#fuguebackend',
                                                                                                    'statsforecast/distributed/fugue.py'),
                                                  'statsforecast.distributed.fugue.FugueBackend.__getstate__': ( 'src/core/distributed.fugue.html#fuguebackend.__getstate__',
@@ -248,14 +362,18 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets._compute_pred_intervals': ( 'src/ets.html#_compute_pred_intervals',
                                                                                   'statsforecast/ets.py'),
                                    'statsforecast.ets._compute_sigmah': ('src/ets.html#_compute_sigmah', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._ets_pred_intervals': ('src/ets.html#_ets_pred_intervals', 'statsforecast/ets.py'),
                                    'statsforecast.ets.admissible': ('src/ets.html#admissible', 'statsforecast/ets.py'),
                                    'statsforecast.ets.check_param': ('src/ets.html#check_param', 'statsforecast/ets.py'),
                                    'statsforecast.ets.cospi': ('src/ets.html#cospi', 'statsforecast/ets.py'),
                                    'statsforecast.ets.ets_f': ('src/ets.html#ets_f', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.ets_search': ('src/ets.html#ets_search', 'statsforecast/ets.py'),
                                    'statsforecast.ets.ets_target_fn': ('src/ets.html#ets_target_fn', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etscalc': ('src/ets.html#etscalc', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etsforecast': ('src/ets.html#etsforecast', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etsmodel': ('src/ets.html#etsmodel', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.etsmodel_fit': ('src/ets.html#etsmodel_fit', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.etsmodel_result': ('src/ets.html#etsmodel_result', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etssimulate': ('src/ets.html#etssimulate', 'statsforecast/ets.py'),
                                    'statsforecast.ets.forecast': ('src/ets.html#forecast', 'statsforecast/ets.py'),
                                    'statsforecast.ets.forecast_ets': ('src/ets.html#forecast_ets', 'statsforecast/ets.py'),
@@ -272,7 +390,8 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets.restrict_to_bounds': ('src/ets.html#restrict_to_bounds', 'statsforecast/ets.py'),
                                    'statsforecast.ets.sinpi': ('src/ets.html#sinpi', 'statsforecast/ets.py'),
                                    'statsforecast.ets.switch': ('src/ets.html#switch', 'statsforecast/ets.py'),
-                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py')},
+                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.update_ets': ('src/ets.html#update_ets', 'statsforecast/ets.py')},
             'statsforecast.feature_engineering': { 'statsforecast.feature_engineering.mstl_decomposition': ( 'src/feature_engineering.html#mstl_decomposition',
                                                                                                              'statsforecast/feature_engineering.py')},
             'statsforecast.garch': { 'statsforecast.garch.garch_cons': ('src/garch.html#garch_cons', 'statsforecast/garch.py'),
@@ -331,6 +450,8 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.ADIDA.fit': ('src/core/models.html#adida.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.ADIDA.forecast': ( 'src/core/models.html#adida.forecast',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.ADIDA.forecast_batch': ( 'src/core/models.html#adida.forecast_batch',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.ADIDA.predict': ( 'src/core/models.html#adida.predict',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ADIDA.predict_in_sample': ( 'src/core/models.html#adida.predict_in_sample',
@@ -350,9 +471,14 @@ d = { 'settings': { 'branch': 'main',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.predict_in_sample': ( 'src/core/models.html#arima.predict_in_sample',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.update': ('src/core/models.html#arima.update', 'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.warm_start': ( 'src/core/models.html#arima.warm_start',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA': ('src/core/models.html#autoarima', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.__init__': ( 'src/core/models.html#autoarima.__init__',
                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA._cache': ( 'src/core/models.html#autoarima._cache',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.fit': ( 'src/core/models.html#autoarima.fit',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.forecast': ( 'src/core/models.html#autoarima.forecast',
@@ -363,6 +489,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.predict_in_sample': ( 'src/core/models.html#autoarima.predict_in_sample',
                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA.update': ( 'src/core/models.html#autoarima.update',
+                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA.warm_start': ( 'src/core/models.html#autoarima.warm_start',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES': ('src/core/models.html#autoces', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.__init__': ( 'src/core/models.html#autoces.__init__',
                                                                                  'statsforecast/models.py'),
@@ -375,6 +505,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.predict_in_sample': ( 'src/core/models.html#autoces.predict_in_sample',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.AutoCES.update': ( 'src/core/models.html#autoces.update',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS': ('src/core/models.html#autoets', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.__init__': ( 'src/core/models.html#autoets.__init__',
                                                                                  'statsforecast/models.py'),
@@ -387,6 +519,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.predict_in_sample': ( 'src/core/models.html#autoets.predict_in_sample',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS.update': ( 'src/core/models.html#autoets.update',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoMFLES': ('src/core/models.html#automfles', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoMFLES.__init__': ( 'src/core/models.html#automfles.__init__',
                                                                                    'statsforecast/models.py'),
@@ -420,6 +554,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.predict_in_sample': ( 'src/core/models.html#autotheta.predict_in_sample',
                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.AutoTheta.update': ( 'src/core/models.html#autotheta.update',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel': ( 'src/core/models.html#constantmodel',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel.__init__': ( 'src/core/models.html#constantmodel.__init__',
@@ -442,6 +578,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.CrostonClassic.forecast': ( 'src/core/models.html#crostonclassic.forecast',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models.CrostonClassic.forecast_batch': ( 'src/core/models.html#crostonclassic.forecast_batch',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models.CrostonClassic.predict': ( 'src/core/models.html#crostonclassic.predict',
                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.CrostonClassic.predict_in_sample': ( 'src/core/models.html#crostonclassic.predict_in_sample',
@@ -454,6 +592,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models.CrostonOptimized.forecast': ( 'src/core/models.html#crostonoptimized.forecast',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.CrostonOptimized.forecast_batch': ( 'src/core/models.html#crostonoptimized.forecast_batch',
+                                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.CrostonOptimized.predict': ( 'src/core/models.html#crostonoptimized.predict',
                                                                                          'statsforecast/models.py'),
                                       'statsforecast.models.CrostonOptimized.predict_in_sample': ( 'src/core/models.html#crostonoptimized.predict_in_sample',
@@ -465,6 +605,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.CrostonSBA.forecast': ( 'src/core/models.html#crostonsba.forecast',
                                                                                     'statsforecast/models.py'),
+                                      'statsforecast.models.CrostonSBA.forecast_batch': ( 'src/core/models.html#crostonsba.forecast_batch',
+                                                                                          'statsforecast/models.py'),
                                       'statsforecast.models.CrostonSBA.predict': ( 'src/core/models.html#crostonsba.predict',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.CrostonSBA.predict_in_sample': ( 'src/core/models.html#crostonsba.predict_in_sample',
@@ -497,6 +639,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.forecast': ( 'src/core/models.html#historicaverage.forecast',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models.HistoricAverage.forecast_batch': ( 'src/core/models.html#historicaverage.forecast_batch',
+                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.predict': ( 'src/core/models.html#historicaverage.predict',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.predict_in_sample': ( 'src/core/models.html#historicaverage.predict_in_sample',
@@ -513,6 +657,8 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.IMAPA.fit': ('src/core/models.html#imapa.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.IMAPA.forecast': ( 'src/core/models.html#imapa.forecast',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.IMAPA.forecast_batch': ( 'src/core/models.html#imapa.forecast_batch',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.IMAPA.predict': ( 'src/core/models.html#imapa.predict',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.IMAPA.predict_in_sample': ( 'src/core/models.html#imapa.predict_in_sample',
@@ -547,6 +693,8 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.Naive.fit': ('src/core/models.html#naive.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forecast': ( 'src/core/models.html#naive.forecast',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.Naive.forecast_batch': ( 'src/core/models.html#naive.forecast_batch',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forward': ( 'src/core/models.html#naive.forward',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.Naive.predict': ( 'src/core/models.html#naive.predict',
@@ -565,6 +713,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.forecast': ( 'src/core/models.html#randomwalkwithdrift.forecast',
                                                                                              'statsforecast/models.py'),
+                                      'statsforecast.models.RandomWalkWithDrift.forecast_batch': ( 'src/core/models.html#randomwalkwithdrift.forecast_batch',
+                                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.predict': ( 'src/core/models.html#randomwalkwithdrift.predict',
                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.predict_in_sample': ( 'src/core/models.html#randomwalkwithdrift.predict_in_sample',
@@ -601,6 +751,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.forecast': ( 'src/core/models.html#seasonalnaive.forecast',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalNaive.forecast_batch': ( 'src/core/models.html#seasonalnaive.forecast_batch',
+                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.predict': ( 'src/core/models.html#seasonalnaive.predict',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.predict_in_sample': ( 'src/core/models.html#seasonalnaive.predict_in_sample',
@@ -613,6 +765,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.forecast': ( 'src/core/models.html#seasonalwindowaverage.forecast',
                                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalWindowAverage.forecast_batch': ( 'src/core/models.html#seasonalwindowaverage.forecast_batch',
+                                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.predict': ( 'src/core/models.html#seasonalwindowaverage.predict',
                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.predict_in_sample': ( 'src/core/models.html#seasonalwindowaverage.predict_in_sample',
@@ -668,6 +822,8 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.TSB.__init__': ('src/core/models.html#tsb.__init__', 'statsforecast/models.py'),
                                       'statsforecast.models.TSB.fit': ('src/core/models.html#tsb.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.TSB.forecast': ('src/core/models.html#tsb.forecast', 'statsforecast/models.py'),
+                                      'statsforecast.models.TSB.forecast_batch': ( 'src/core/models.html#tsb.forecast_batch',
+                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.TSB.predict': ('src/core/models.html#tsb.predict', 'statsforecast/models.py'),
                                       'statsforecast.models.TSB.predict_in_sample': ( 'src/core/models.html#tsb.predict_in_sample',
                                                                                       'statsforecast/models.py'),
@@ -682,6 +838,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.forecast': ( 'src/core/models.html#windowaverage.forecast',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.WindowAverage.forecast_batch': ( 'src/core/models.html#windowaverage.forecast_batch',
+                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.predict': ( 'src/core/models.html#windowaverage.predict',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.predict_in_sample': ( 'src/core/models.html#windowaverage.predict_in_sample',
@@ -707,13 +865,19 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models._add_fitted_pi': ( 'src/core/models.html#_add_fitted_pi',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._adida': ('src/core/models.html#_adida', 'statsforecast/models.py'),
+                                      'statsforecast.models._adida_batch': ('src/core/models.html#_adida_batch', 'statsforecast/models.py'),
+                                      'statsforecast.models._arima_cache': ('src/core/models.html#_arima_cache', 'statsforecast/models.py'),
                                       'statsforecast.models._chunk_forecast': ( 'src/core/models.html#_chunk_forecast',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models._chunk_sums': ('src/core/models.html#_chunk_sums', 'statsforecast/models.py'),
                                       'statsforecast.models._croston_classic': ( 'src/core/models.html#_croston_classic',
                                                                                  'statsforecast/models.py'),
+                                      'statsforecast.models._croston_classic_batch': ( 'src/core/models.html#_croston_classic_batch',
+                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._croston_optimized': ( 'src/core/models.html#_croston_optimized',
                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models._croston_optimized_batch': ( 'src/core/models.html#_croston_optimized_batch',
+                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models._croston_sba': ('src/core/models.html#_croston_sba', 'statsforecast/models.py'),
                                       'statsforecast.models._demand': ('src/core/models.html#_demand', 'statsforecast/models.py'),
                                       'statsforecast.models._expand_fitted_demand': ( 'src/core/models.html#_expand_fitted_demand',
@@ -724,8 +888,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._historic_average': ( 'src/core/models.html#_historic_average',
                                                                                   'statsforecast/models.py'),
+                                      'statsforecast.models._historic_average_batch': ( 'src/core/models.html#_historic_average_batch',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models._imapa': ('src/core/models.html#_imapa', 'statsforecast/models.py'),
+                                      'statsforecast.models._imapa_batch': ('src/core/models.html#_imapa_batch', 'statsforecast/models.py'),
                                       'statsforecast.models._intervals': ('src/core/models.html#_intervals', 'statsforecast/models.py'),
+                                      'statsforecast.models._naive_batch': ('src/core/models.html#_naive_batch', 'statsforecast/models.py'),
+                                      'statsforecast.models._nonzero_intervals': ( 'src/core/models.html#_nonzero_intervals',
+                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models._optimized_ses_forecast': ( 'src/core/models.html#_optimized_ses_forecast',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models._predict_mstl_components': ( 'src/core/models.html#_predict_mstl_components',
@@ -735,12 +905,20 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models._probability': ('src/core/models.html#_probability', 'statsforecast/models.py'),
                                       'statsforecast.models._random_walk_with_drift': ( 'src/core/models.html#_random_walk_with_drift',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models._random_walk_with_drift_batch': ( 'src/core/models.html#_random_walk_with_drift_batch',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_exponential_smoothing': ( 'src/core/models.html#_seasonal_exponential_smoothing',
                                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models._seasonal_naive_batch': ( 'src/core/models.html#_seasonal_naive_batch',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_ses_optimized': ( 'src/core/models.html#_seasonal_ses_optimized',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_window_average': ( 'src/core/models.html#_seasonal_window_average',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models._seasonal_window_average_batch': ( 'src/core/models.html#_seasonal_window_average_batch',
+                                                                                               'statsforecast/models.py'),
+                                      'statsforecast.models._segment_sigma': ( 'src/core/models.html#_segment_sigma',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models._ses': ('src/core/models.html#_ses', 'statsforecast/models.py'),
                                       'statsforecast.models._ses_fcst_mse': ( 'src/core/models.html#_ses_fcst_mse',
                                                                               'statsforecast/models.py'),
@@ -750,10 +928,14 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models._ses_optimized': ( 'src/core/models.html#_ses_optimized',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._tsb': ('src/core/models.html#_tsb', 'statsforecast/models.py'),
+                                      'statsforecast.models._tsb_batch': ('src/core/models.html#_tsb_batch', 'statsforecast/models.py'),
                                       'statsforecast.models._window_average': ( 'src/core/models.html#_window_average',
-                                                                                'statsforecast/models.py')},
+                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models._window_average_batch': ( 'src/core/models.html#_window_average_batch',
+                                                                                      'statsforecast/models.py')},
             'statsforecast.mstl': {'statsforecast.mstl.mstl': ('src/mstl.html#mstl', 'statsforecast/mstl.py')},
-            'statsforecast.tbats': { 'statsforecast.tbats._compute_sigmah': ('src/tbats.html#_compute_sigmah', 'statsforecast/tbats.py'),
+            'statsforecast.tbats': { 'statsforecast.tbats._boxcox': ('src/tbats.html#_boxcox', 'statsforecast/tbats.py'),
+                                     'statsforecast.tbats._compute_sigmah': ('src/tbats.html#_compute_sigmah', 'statsforecast/tbats.py'),
                                      'statsforecast.tbats.calcLikelihoodTBATS': ( 'src/tbats.html#calclikelihoodtbats',
                                                                                   'statsforecast/tbats.py'),
                                      'statsforecast.tbats.calcTBATSFaster': ('src/tbats.html#calctbatsfaster', 'statsforecast/tbats.py'),
@@ -768,6 +950,8 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.tbats.makeTBATSGMatrix': ('src/tbats.html#maketbatsgmatrix', 'statsforecast/tbats.py'),
                                      'statsforecast.tbats.makeTBATSWMatrix': ('src/tbats.html#maketbatswmatrix', 'statsforecast/tbats.py'),
                                      'statsforecast.tbats.makeXMatrix': ('src/tbats.html#makexmatrix', 'statsforecast/tbats.py'),
+                                     'statsforecast.tbats.nelder_mead_tbats': ( 'src/tbats.html#nelder_mead_tbats',
+                                                                                'statsforecast/tbats.py'),
                                      'statsforecast.tbats.tbats_forecast': ('src/tbats.html#tbats_forecast', 'statsforecast/tbats.py'),
                                      'statsforecast.tbats.tbats_model': ('src/tbats.html#tbats_model', 'statsforecast/tbats.py'),
                                      'statsforecast.tbats.tbats_model_generator': ( 'src/tbats.html#tbats_model_generator',
@@ -799,7 +983,10 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.theta.thetafcst': ('src/theta.html#thetafcst', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetaforecast': ('src/theta.html#thetaforecast', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetamodel': ('src/theta.html#thetamodel', 'statsforecast/theta.py'),
-                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py')},
+                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.thetaupdatestates': ( 'src/theta.html#thetaupdatestates',
+                                                                                'statsforecast/theta.py'),
+                                     'statsforecast.theta.update_theta': ('src/theta.html#update_theta', 'statsforecast/theta.py')},
             'statsforecast.utils': { 'statsforecast.utils.ConformalIntervals': ( 'src/utils.html#conformalintervals',
                                                                                  'statsforecast/utils.py'),
                                      'statsforecast.utils.ConformalIntervals.__init__': ( 'src/utils.html#conformalintervals.__init__',
@@ -808,10 +995,13 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/utils.py'),
                                      'statsforecast.utils._calculate_sigma': ('src/utils.html#_calculate_sigma', 'statsforecast/utils.py'),
                                      'statsforecast.utils._ensure_float': ('src/utils.html#_ensure_float', 'statsforecast/utils.py'),
+                                     'statsforecast.utils._level_quantiles': ('src/utils.html#_level_quantiles', 'statsforecast/utils.py'),
                                      'statsforecast.utils._naive': ('src/utils.html#_naive', 'statsforecast/utils.py'),
                                      'statsforecast.utils._old_kw_to_pos': ('src/utils.html#_old_kw_to_pos', 'statsforecast/utils.py'),
                                      'statsforecast.utils._quantiles': ('src/utils.html#_quantiles', 'statsforecast/utils.py'),
                                      'statsforecast.utils._repeat_val': ('src/utils.html#_repeat_val', 'statsforecast/utils.py'),
                                      'statsforecast.utils._repeat_val_seas': ('src/utils.html#_repeat_val_seas', 'statsforecast/utils.py'),
+                                     'statsforecast.utils._samples_quantiles': ( 'src/utils.html#_samples_quantiles',
+                                                                                 'statsforecast/utils.py'),
                                      'statsforecast.utils._seasonal_naive': ('src/utils.html#_seasonal_naive', 'statsforecast/utils.py'),
                                      'statsforecast.utils.generate_series': ('src/utils.html#generate_series', 'statsforecast/utils.py')}}}
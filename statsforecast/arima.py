@@ -6,17 +6,18 @@ __all__ = ['predict_arima', 'arima_string', 'forecast_arima', 'fitted_arima', 'a
 
 # %% ../nbs/src/arima.ipynb 4
 import math
+import threading
 import warnings
-from collections import namedtuple
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from typing import Optional, Dict, Union, Tuple
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 from numba import njit
 from scipy.optimize import minimize
-from scipy.stats import norm
+from scipy.special import ndtri
 
 from .mstl import mstl
 from .utils import CACHE, NOGIL
@@ -73,6 +74,25 @@ def arima_gradtrans(x, arma):
 
 # %% ../nbs/src/arima.ipynb 10
 @njit(nogil=NOGIL, cache=CACHE)
+def partrans_jac(p, raw):
+    # exact jacobian of partrans, jac[i, j] is the derivative of new[j] with respect to raw[i]
+    new = np.tanh(raw[:p])
+    jac = np.zeros((p, p))
+    for i in range(p):
+        jac[i, i] = 1.0 - new[i] * new[i]
+    work = new.copy()
+    work_jac = jac.copy()
+    for j in range(1, p):
+        a = new[j]
+        for k in range(j):
+            work[k] -= a * new[j - k - 1]
+            work_jac[:, k] -= jac[:, j] * new[j - k - 1] + a * jac[:, j - k - 1]
+        new[:j] = work[:j]
+        jac[:, :j] = work_jac[:, :j]
+    return jac
+
+# %% ../nbs/src/arima.ipynb 12
+@njit(nogil=NOGIL, cache=CACHE)
 def arima_undopars(x, arma):
     mp, mq, msp = arma[:3]
     res = x.copy()
@@ -83,7 +103,7 @@ def arima_undopars(x, arma):
         partrans(msp, x[v:], res[v:])
     return res
 
-# %% ../nbs/src/arima.ipynb 12
+# %% ../nbs/src/arima.ipynb 14
 @njit(nogil=NOGIL, cache=CACHE)
 def tsconv(a, b):
     na = len(a)
@@ -98,7 +118,7 @@ def tsconv(a, b):
 
     return ab
 
-# %% ../nbs/src/arima.ipynb 14
+# %% ../nbs/src/arima.ipynb 16
 @njit(nogil=NOGIL, cache=CACHE)
 def inclu2(np_, xnext, xrow, ynext, d, rbar, thetab):
     for i in range(np_):
@@ -127,7 +147,7 @@ def inclu2(np_, xnext, xrow, ynext, d, rbar, thetab):
         else:
             ithisr = ithisr + np_ - i - 1
 
-# %% ../nbs/src/arima.ipynb 15
+# %% ../nbs/src/arima.ipynb 17
 @njit(nogil=NOGIL, cache=CACHE)
 def invpartrans(p, phi, new):
     if p > 100:
@@ -145,7 +165,7 @@ def invpartrans(p, phi, new):
     for j in range(p):
         new[j] = math.atanh(new[j])
 
-# %% ../nbs/src/arima.ipynb 16
+# %% ../nbs/src/arima.ipynb 18
 @njit(nogil=NOGIL, cache=CACHE)
 def ARIMA_invtrans(x, arma):
     mp, mq, msp = arma[:3]
@@ -157,7 +177,7 @@ def ARIMA_invtrans(x, arma):
         invpartrans(msp, x[v:], y[v:])
     return y
 
-# %% ../nbs/src/arima.ipynb 18
+# %% ../nbs/src/arima.ipynb 20
 @njit(nogil=NOGIL, cache=CACHE)
 def getQ0(phi, theta):
     p = len(phi)
@@ -270,8 +290,9 @@ def getQ0(phi, theta):
                 ind -= 1
                 res[ind] = V[ind]
                 if j != 0:
+                    # like R's getQ0, adds the element stored at indn
                     indn -= 1
-                    res[ind] += res[ind]
+                    res[ind] += res[indn]
 
     # Unpack to a full matrix
     ind = np_
@@ -287,7 +308,43 @@ def getQ0(phi, theta):
     res = res.reshape((r, r))
     return res
 
-# %% ../nbs/src/arima.ipynb 20
+# %% ../nbs/src/arima.ipynb 23
+@njit(nogil=NOGIL, cache=CACHE)
+def getQ0_jac(phi, theta, Q0, dphi, dtheta):
+    # derivatives of the stationary covariance Q0 = T Q0 T' + R R' along the directions
+    # (dphi[k], dtheta[k]). they solve dQ0 = T dQ0 T' + C, with
+    # C = dT Q0 T' + T Q0 dT' + dR R' + R dR', so dQ0 = sum_i T^i C T'^i, which is
+    # accumulated by doubling the powers of T
+    p = len(phi)
+    q = len(theta)
+    r = max(p, q + 1)
+    k = dphi.shape[0]
+    T = np.zeros((r, r))
+    T[:p, 0] = phi
+    for i in range(r - 1):
+        T[i, i + 1] = 1.0
+    R = np.zeros(r)
+    R[0] = 1.0
+    R[1 : q + 1] = theta
+    u = T @ Q0[:, 0].copy()
+    dQ0 = np.empty((k, r, r))
+    dp = np.zeros(r)
+    dR = np.zeros(r)
+    for m in range(k):
+        dp[:p] = dphi[m]
+        dR[1 : q + 1] = dtheta[m]
+        dQ0[m] = np.outer(dp, u) + np.outer(u, dp) + np.outer(dR, R) + np.outer(R, dR)
+    A = T
+    for _ in range(64):
+        if np.abs(A).max() < 1e-12:
+            break
+        At = A.T.copy()
+        for m in range(k):
+            dQ0[m] += A @ dQ0[m] @ At
+        A = A @ A
+    return dQ0
+
+# %% ../nbs/src/arima.ipynb 25
 @njit(nogil=NOGIL, cache=CACHE)
 def arima_transpar(params_in, arma, trans):
     # TODO check trans=True results
@@ -326,7 +383,49 @@ def arima_transpar(params_in, arma, trans):
 
     return phi, theta
 
-# %% ../nbs/src/arima.ipynb 23
+# %% ../nbs/src/arima.ipynb 28
+@njit(nogil=NOGIL, cache=CACHE)
+def arima_transpar_jac(params_in, arma, trans):
+    # derivatives of the phi and theta of arima_transpar, dphi[i, j] is the
+    # derivative of phi[j] with respect to params_in[i]
+    mp, mq, msp, msq, ns = arma[:5]
+    p = mp + ns * msp
+    q = mq + ns * msq
+    n = len(params_in)
+
+    params = params_in.copy()
+    jac = np.identity(n)
+    if trans:
+        if mp > 0:
+            partrans(mp, params_in, params)
+            jac[:mp, :mp] = partrans_jac(mp, params_in)
+        v = mp + mq
+        if msp > 0:
+            partrans(msp, params_in[v:], params[v:])
+            jac[v : v + msp, v : v + msp] = partrans_jac(msp, params_in[v:])
+    dphi = np.zeros((n, p))
+    dtheta = np.zeros((n, q))
+    dphi[:, :mp] = jac[:, :mp]
+    if ns > 0:
+        dtheta[:, :mq] = jac[:, mp : mp + mq]
+        for j in range(msp):
+            sj = mp + mq + j
+            dphi[:, (j + 1) * ns - 1] += jac[:, sj]
+            for i in range(mp):
+                dphi[:, (j + 1) * ns + i] -= (
+                    jac[:, i] * params[sj] + params[i] * jac[:, sj]
+                )
+
+        for j in range(msq):
+            sj = mp + mq + msp + j
+            dtheta[:, (j + 1) * ns - 1] += jac[:, sj]
+            for i in range(mq):
+                dtheta[:, (j + 1) * ns + i] += (
+                    jac[:, i + mp] * params[sj] + params[i + mp] * jac[:, sj]
+                )
+    return dphi, dtheta
+
+# %% ../nbs/src/arima.ipynb 30
 @njit(nogil=NOGIL, cache=CACHE)
 def arima_css(y, arma, phi, theta, ncond):
     n = len(y)
@@ -370,7 +469,7 @@ def arima_css(y, arma, phi, theta, ncond):
 
     return res, resid
 
-# %% ../nbs/src/arima.ipynb 25
+# %% ../nbs/src/arima.ipynb 32
 @njit(nogil=NOGIL, cache=CACHE)
 def _make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
     # check nas phi
@@ -423,7 +522,7 @@ def make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(np.float64).eps):
     res = _make_arima(phi, theta, delta, kappa, tol)
     return dict(zip(keys, res))
 
-# %% ../nbs/src/arima.ipynb 27
+# %% ../nbs/src/arima.ipynb 34
 @njit(nogil=NOGIL, cache=CACHE)
 def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
     n = len(y)
@@ -560,7 +659,215 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
         rsResid = None
     return ssq, sumlog, nu, rsResid
 
-# %% ../nbs/src/arima.ipynb 29
+# %% ../nbs/src/arima.ipynb 36
+@njit(nogil=NOGIL, cache=CACHE)
+def _state_predict(a, phi, delta, r, out):
+    # out = T a
+    p = len(phi)
+    d = len(delta)
+    for i in range(r):
+        tmp = a[i + 1] if i < r - 1 else 0.0
+        if i < p:
+            tmp += phi[i] * a[0]
+        out[i] = tmp
+    if d > 0:
+        for i in range(r + 1, r + d):
+            out[i] = a[i - 1]
+        tmp = a[0]
+        for i in range(d):
+            tmp += delta[i] * a[r + i]
+        out[r] = tmp
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _state_cov_predict(X, phi, delta, r, mm, out):
+    # out = T X T' for a symmetric X, using mm to store T X
+    rd = X.shape[0]
+    p = len(phi)
+    d = len(delta)
+    for i in range(r):
+        for j in range(rd):
+            tmp = X[i + 1, j] if i < r - 1 else 0.0
+            if i < p:
+                tmp += phi[i] * X[0, j]
+            mm[i, j] = tmp
+    if d > 0:
+        for j in range(rd):
+            tmp = X[0, j]
+            for k in range(d):
+                tmp += delta[k] * X[r + k, j]
+            mm[r, j] = tmp
+        for i in range(r + 1, rd):
+            for j in range(rd):
+                mm[i, j] = X[i - 1, j]
+    # (T X T')[i, j] = (T X)[j, :] T[i, :]'
+    for i in range(r):
+        for j in range(rd):
+            tmp = mm[j, i + 1] if i < r - 1 else 0.0
+            if i < p:
+                tmp += phi[i] * mm[j, 0]
+            out[i, j] = tmp
+    if d > 0:
+        for j in range(rd):
+            tmp = mm[j, 0]
+            for k in range(d):
+                tmp += delta[k] * mm[j, r + k]
+            out[r, j] = tmp
+        for i in range(r + 1, rd):
+            for j in range(rd):
+                out[i, j] = mm[j, i - 1]
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _cov_times_z(X, delta, r, out):
+    # out = X Z, where Z = (1, 0, ..., 0, delta)
+    d = len(delta)
+    for i in range(X.shape[0]):
+        tmp = X[i, 0]
+        for j in range(d):
+            tmp += X[i, r + j] * delta[j]
+        out[i] = tmp
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def arima_like_grad(y, phi, theta, delta, a, P, Pn, dphi, dtheta, dPn, dy):
+    # arima_like starting from the covariance Pn (up=0) that also computes the
+    # derivatives of ssq and sumlog along the k directions given by the derivatives of
+    # phi (dphi[k]), theta (dtheta[k]), the initial covariance (dPn[k]) and the serie (dy[k]).
+    # the directions that don't change phi, theta nor Pn (the regressors) only move
+    # the state, so the derivatives of the covariances are only computed for the others.
+    # a, P and Pn are modified in place like in arima_like
+    n = len(y)
+    rd = len(a)
+    p = len(phi)
+    q = len(theta)
+    d = len(delta)
+    r = rd - d
+    k = dy.shape[0]
+
+    has_cov = np.empty(k, dtype=np.bool_)
+    for m in range(k):
+        has_cov[m] = (
+            np.any(dphi[m] != 0.0) or np.any(dtheta[m] != 0.0) or np.any(dPn[m] != 0.0)
+        )
+    R = np.empty(q + 1)
+    R[0] = 1.0
+    R[1:] = theta
+
+    ssq = 0.0
+    sumlog = 0.0
+    nu = 0
+    dssq = np.zeros(k)
+    dsumlog = np.zeros(k)
+
+    da = np.zeros((k, rd))
+    dP = np.zeros((k, rd, rd))
+    dPnew = dPn.copy()
+    anew = np.empty(rd)
+    danew = np.empty((k, rd))
+    M = np.empty(rd)
+    dM = np.zeros((k, rd))
+    dgain = np.zeros(k)
+    dresid = np.empty(k)
+    mm = np.empty((rd, rd))
+    u = np.empty(rd)
+
+    for l in range(n):
+        _state_predict(a, phi, delta, r, anew)
+        for m in range(k):
+            _state_predict(da[m], phi, delta, r, danew[m])
+            for i in range(p):
+                danew[m, i] += dphi[m, i] * a[0]
+        if l > 0:
+            # Pnew = T P T' + V
+            _state_cov_predict(P, phi, delta, r, mm, Pn)
+            for i in range(q + 1):
+                for j in range(q + 1):
+                    Pn[i, j] += R[i] * R[j]
+            # dPnew = T dP T' + dT P T' + T P dT' + dV, with (dT P T')[i, j] = dphi[i] (T P)[j, 0]
+            _state_predict(P[0], phi, delta, r, u)
+            for m in range(k):
+                if not has_cov[m]:
+                    continue
+                dPnew_m = dPnew[m]
+                _state_cov_predict(dP[m], phi, delta, r, mm, dPnew_m)
+                for i in range(p):
+                    for j in range(rd):
+                        dPnew_m[i, j] += dphi[m, i] * u[j]
+                        dPnew_m[j, i] += u[j] * dphi[m, i]
+                for i in range(1, q + 1):
+                    for j in range(q + 1):
+                        dPnew_m[i, j] += dtheta[m, i - 1] * R[j]
+                        dPnew_m[j, i] += R[j] * dtheta[m, i - 1]
+
+        if not math.isnan(y[l]):
+            resid = y[l] - anew[0]
+            for i in range(d):
+                resid -= delta[i] * anew[r + i]
+            _cov_times_z(Pn, delta, r, M)
+            gain = M[0]
+            for j in range(d):
+                gain += delta[j] * M[r + j]
+            if gain == 0.0:
+                ssq = math.inf
+                break
+            for m in range(k):
+                dresid[m] = dy[m, l] - danew[m, 0]
+                for i in range(d):
+                    dresid[m] -= delta[i] * danew[m, r + i]
+                if has_cov[m]:
+                    _cov_times_z(dPnew[m], delta, r, dM[m])
+                    dgain[m] = dM[m, 0]
+                    for j in range(d):
+                        dgain[m] += delta[j] * dM[m, r + j]
+            if gain < 1e4:
+                nu += 1
+                ssq += resid * resid / gain
+                sumlog += math.log(gain)
+                for m in range(k):
+                    dssq[m] += (
+                        2.0 * resid * dresid[m] - resid * resid * dgain[m] / gain
+                    ) / gain
+                    dsumlog[m] += dgain[m] / gain
+            for i in range(rd):
+                a[i] = anew[i] + M[i] * resid / gain
+            for i in range(rd):
+                for j in range(rd):
+                    P[i, j] = Pn[i, j] - M[i] * M[j] / gain
+            for m in range(k):
+                for i in range(rd):
+                    da[m, i] = (
+                        danew[m, i]
+                        + (
+                            dM[m, i] * resid
+                            + M[i] * dresid[m]
+                            - M[i] * resid * dgain[m] / gain
+                        )
+                        / gain
+                    )
+                if not has_cov[m]:
+                    continue
+                dP_m = dP[m]
+                dPnew_m = dPnew[m]
+                for i in range(rd):
+                    for j in range(rd):
+                        dP_m[i, j] = (
+                            dPnew_m[i, j]
+                            - (
+                                dM[m, i] * M[j]
+                                + M[i] * dM[m, j]
+                                - M[i] * M[j] * dgain[m] / gain
+                            )
+                            / gain
+                        )
+        else:
+            a[:] = anew
+            P[:] = Pn
+            da[:] = danew
+            dP[:] = dPnew
+    return ssq, sumlog, nu, dssq, dsumlog
+
+# %% ../nbs/src/arima.ipynb 38
 @njit(nogil=NOGIL, cache=CACHE)
 def diff1d(x, lag, differences):
     y = x.copy()
@@ -592,7 +899,7 @@ def diff(x, lag, differences):
         raise ValueError(x.ndim)
     return y[~nan_mask]
 
-# %% ../nbs/src/arima.ipynb 30
+# %% ../nbs/src/arima.ipynb 39
 def fixed_params_from_dict(
     fixed_dict: dict, order: tuple, seasonal: dict, intercept: bool, n_ex: int
 ):
@@ -616,7 +923,80 @@ def fixed_params_from_dict(
     )  # prevent adding non-existing keys
     return list(full_dict.values())
 
-# %% ../nbs/src/arima.ipynb 32
+# %% ../nbs/src/arima.ipynb 41
+class ARIMACache:
+    """Results of the unit root tests and of the regression on the regressors,
+    keyed by their inputs.
+
+    `auto_arima_f` uses one for all its candidate models. It can also be kept
+    between fits, in which case the results are reused when the inputs repeat.
+    Each function keeps at most `maxsize` results. The initial covariance
+    matrices aren't kept, since the optimizer rarely evaluates the same
+    coefficients twice and they're large for long seasonal periods.
+    """
+
+    def __init__(self, maxsize=1_000):
+        self.maxsize = maxsize
+        self.results = defaultdict(dict)
+        self.hits = 0
+        self.misses = 0
+        # the cache of AutoARIMA(reuse_cache=True) can be used by several threads
+        self.lock = threading.Lock()
+
+    def get(self, fn, *args, **kwargs):
+        key = tuple(
+            (
+                (arg.shape, arg.dtype.str, arg.tobytes())
+                if isinstance(arg, np.ndarray)
+                else arg
+            )
+            for arg in args
+        )
+        key += tuple(sorted(kwargs.items()))
+        results = self.results[fn.__name__]
+        with self.lock:
+            if key in results:
+                self.hits += 1
+                # moved to the end so that the least recently used result is evicted first
+                res = results[key] = results.pop(key)
+                return res
+            self.misses += 1
+        res = fn(*args, **kwargs)
+        with self.lock:
+            if key not in results and len(results) >= self.maxsize:
+                del results[next(iter(results))]
+            results[key] = res
+        return res
+
+
+def cached(cache, fn, *args, **kwargs):
+    if cache is None:
+        return fn(*args, **kwargs)
+    return cache.get(fn, *args, **kwargs)
+
+
+def regress_xreg(x, xreg, d, period, D, orig_xreg):
+    # regression of the differenced serie on the differenced regressors,
+    # used to initialise the coefficients of the regressors
+    vt = None
+    if not orig_xreg:
+        _, _, vt = np.linalg.svd(xreg[(~np.isnan(xreg)).all(1)])
+        xreg = np.matmul(xreg, vt)
+    dx = x
+    dxreg = xreg
+    if d > 0:
+        dx = diff(dx, 1, d)
+        dxreg = diff(dxreg, 1, d)
+    if period > 1 and D > 0:
+        dx = diff(dx, period, D)
+        dxreg = diff(dxreg, period, D)
+    # statsmodels is slow to import, so it's only loaded when needed
+    from statsmodels.regression.linear_model import OLS
+
+    result = OLS(dx, dxreg).fit()
+    return xreg, vt, result.params, result.bse
+
+# %% ../nbs/src/arima.ipynb 43
 def arima(
     x: np.ndarray,
     order=(0, 0, 0),
@@ -632,6 +1012,7 @@ def arima(
     kappa=1e6,
     tol=1e-8,
     optim_control={"maxiter": 100},
+    cache=None,
 ):
     SSG = SSinit == "Gardner1980"
     x = x.copy()
@@ -698,6 +1079,42 @@ def arima(
             return math.nan
         return 0.5 * (math.log(s2) + res[1] / res[2])
 
+    def armafn_grad(p, x, trans):
+        # armafn and its gradient with respect to p
+        x = x.copy()
+        par = coef.copy()
+        par[mask] = p
+        phi, theta = arima_transpar(par, arma, trans)
+        dphi, dtheta = arima_transpar_jac(par, arma, trans)
+        dphi, dtheta = dphi[mask], dtheta[mask]
+        Z = upARIMA(mod, phi, theta)
+        r = max(len(phi), len(theta) + 1)
+        dPn = np.zeros((mask.sum(), *Z["Pn"].shape))
+        dPn[:, :r, :r] = getQ0_jac(phi, theta, Z["Pn"][:r, :r].copy(), dphi, dtheta)
+        dy = np.zeros((narma + ncxreg, x.size))
+        if ncxreg > 0:
+            x -= np.dot(xreg, par[narma + np.arange(ncxreg)])
+            dy[narma:] = -xreg.T
+        ssq, sumlog, nu, dssq, dsumlog = arima_like_grad(
+            x,
+            Z["phi"],
+            Z["theta"],
+            Z["delta"],
+            Z["a"],
+            Z["P"],
+            Z["Pn"],
+            dphi,
+            dtheta,
+            dPn,
+            dy[mask],
+        )
+        if nu == 0:
+            return math.inf, np.full(p.size, np.nan)
+        s2 = ssq / nu
+        if s2 <= 0:
+            return math.nan, np.full(p.size, np.nan)
+        return 0.5 * (math.log(s2) + sumlog / nu), 0.5 * (dssq / ssq + dsumlog / nu)
+
     def arCheck(ar):
         p = np.argmax(np.append(1, -ar) != 0)
         if not p:
@@ -838,24 +1255,19 @@ def arima(
     if ncxreg:
         cn = nmxreg
         orig_xreg = (ncxreg == 1) | (~mask[narma + np.arange(ncxreg)]).any()
-        if not orig_xreg:
-            _, _, vt = np.linalg.svd(xreg[(~np.isnan(xreg)).all(1)])
-            xreg = np.matmul(xreg, vt)
-        dx = x
-        dxreg = xreg
-        if order[1] > 0:
-            dx = diff(dx, 1, order[1])
-            dxreg = diff(dxreg, 1, order[1])
-        if seasonal["period"] > 1 and seasonal["order"][1] > 0:
-            dx = diff(dx, seasonal["period"], seasonal["order"][1])
-            dxreg = diff(dxreg, seasonal["period"], seasonal["order"][1])
-        model = sm.OLS(dx, dxreg)
-        result = model.fit()
-        fit = {"coefs": result.params, "stderrs": result.bse}
+        xreg, vt, coefs, ses = cached(
+            cache,
+            regress_xreg,
+            x,
+            xreg,
+            order[1],
+            seasonal["period"],
+            seasonal["order"][1],
+            orig_xreg,
+        )
         isna = np.isnan(x) | np.isnan(xreg).any(1)
         n_used = (~isna).sum() - len(Delta)
-        init0 = np.append(init0, fit["coefs"])
-        ses = fit["stderrs"]
+        init0 = np.append(init0, coefs)
         parscale = np.append(parscale, 10 * ses)
 
     if n_used <= 0:
@@ -969,12 +1381,13 @@ def arima(
             )
         else:
             res = minimize(
-                armafn,
+                armafn_grad,
                 init[mask],
                 args=(
                     x,
                     transform_pars,
                 ),
+                jac=True,
                 method=optim_method,
                 tol=tol,
                 options=optim_control,
@@ -1039,7 +1452,9 @@ def arima(
             var = np.matmul(np.matmul(A, var), A.T)
     # if no_optim:
     #     var = pd.DataFrame(var, columns=nm[mask], index=nm[mask])
-    resid = val[1]
+    # the likelihood is computed in double precision, the residuals are
+    # kept in the precision of the serie
+    resid = val[1].astype(np.result_type(x.dtype, np.float32), copy=False)
 
     ans = {
         "coef": dict(zip(nm, coef)),
@@ -1058,7 +1473,7 @@ def arima(
     }
     return ans
 
-# %% ../nbs/src/arima.ipynb 40
+# %% ../nbs/src/arima.ipynb 52
 @njit(nogil=NOGIL, cache=CACHE)
 def kalman_forecast(n, Z, a, P, T, V, h):
     p = len(a)
@@ -1100,13 +1515,13 @@ def kalman_forecast(n, Z, a, P, T, V, h):
 
     return forecasts, se
 
-# %% ../nbs/src/arima.ipynb 43
+# %% ../nbs/src/arima.ipynb 55
 def checkarima(obj):
     if obj["var_coef"] is None:
         return False
     return any(np.isnan(np.sqrt(np.diag(obj["var_coef"]))))
 
-# %% ../nbs/src/arima.ipynb 44
+# %% ../nbs/src/arima.ipynb 56
 def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     myNCOL = lambda x: x.shape[1] if x is not None else 0
@@ -1165,7 +1580,7 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     return pred
 
-# %% ../nbs/src/arima.ipynb 48
+# %% ../nbs/src/arima.ipynb 60
 def convert_coef_name(name, inverse=False):
     if not inverse:
         if "ex" in name:
@@ -1187,13 +1602,13 @@ def convert_coef_name(name, inverse=False):
         else:
             return name
 
-# %% ../nbs/src/arima.ipynb 49
+# %% ../nbs/src/arima.ipynb 61
 def change_drift_name(model_coef, inverse=False):
     return {
         convert_coef_name(name, inverse): value for name, value in model_coef.items()
     }
 
-# %% ../nbs/src/arima.ipynb 50
+# %% ../nbs/src/arima.ipynb 62
 def myarima(
     x,
     order=(0, 0, 0),
@@ -1205,6 +1620,7 @@ def myarima(
     offset=0,
     xreg=None,
     method=None,
+    cache=None,
     **kwargs,
 ):
     missing = np.isnan(x)
@@ -1229,17 +1645,34 @@ def myarima(
             else:
                 xreg = drift
             if use_season:
-                fit = arima(x, order, seasonal, xreg, method=method)
+                fit = arima(
+                    x, order, seasonal, xreg, method=method, cache=cache, **kwargs
+                )
             else:
-                fit = arima(x, order, xreg=xreg, method=method)
+                fit = arima(x, order, xreg=xreg, method=method, cache=cache, **kwargs)
             fit["coef"] = change_drift_name(fit["coef"])
         else:
             if use_season:
                 fit = arima(
-                    x, order, seasonal, include_mean=constant, method=method, xreg=xreg
+                    x,
+                    order,
+                    seasonal,
+                    include_mean=constant,
+                    method=method,
+                    xreg=xreg,
+                    cache=cache,
+                    **kwargs,
                 )
             else:
-                fit = arima(x, order, include_mean=constant, method=method, xreg=xreg)
+                fit = arima(
+                    x,
+                    order,
+                    include_mean=constant,
+                    method=method,
+                    xreg=xreg,
+                    cache=cache,
+                    **kwargs,
+                )
         # nxreg = 0 if xreg is None else xreg.shape[1]
         nstar = n - order[1] - seas_order[1] * m
         if diffs == 1 and constant:
@@ -1292,7 +1725,23 @@ def myarima(
         raise e
         return {"ic": math.inf}
 
-# %% ../nbs/src/arima.ipynb 53
+# %% ../nbs/src/arima.ipynb 65
+def _fit_candidate(fit_fn, order, seasonal, constant):
+    return fit_fn(order=order, seasonal=seasonal, constant=constant)
+
+
+def map_fits(fit_fn, candidates, executor=None):
+    # fits the (order, seasonal, constant) candidates, the fits are returned in the same order.
+    # the executor only changes where they're fitted, so the selected model doesn't depend on it
+    if not candidates:
+        return iter(())
+    if executor is None:
+        return map(partial(_fit_candidate, fit_fn), *zip(*candidates))
+    # the cache isn't shared with the processes
+    fit_fn = partial(fit_fn, cache=None)
+    return executor.map(partial(_fit_candidate, fit_fn), *zip(*candidates))
+
+# %% ../nbs/src/arima.ipynb 66
 def search_arima(
     x,
     d=0,
@@ -1311,6 +1760,8 @@ def search_arima(
     allow_drift=True,
     allow_mean=True,
     period=1,
+    parallel=False,
+    num_cores=2,
     **kwargs
 ):
     m = period
@@ -1320,29 +1771,35 @@ def search_arima(
 
     best_ic = np.inf
     best_fit = None
-    for i in range(max_p + 1):
-        for j in range(max_q + 1):
-            for I in range(max_P + 1):
-                for J in range(max_Q + 1):
-                    if i + j + I + J > max_order:
-                        continue
-                    for K in range(max_K + 1):
-                        fit = myarima(
-                            x,
-                            order=(i, d, j),
-                            seasonal={"order": (I, D, J), "period": m},
-                            constant=K == 1,
-                            trace=trace,
-                            ic=ic,
-                            approximation=approximation,
-                            offset=offset,
-                            xreg=xreg,
-                            **kwargs,
-                        )
-                        if fit["ic"] < best_ic:
-                            best_ic = fit["ic"]
-                            best_fit = fit
-                            constant = K == 1
+    fit_fn = partial(
+        myarima,
+        x,
+        trace=trace,
+        ic=ic,
+        approximation=approximation,
+        offset=offset,
+        xreg=xreg,
+        **kwargs,
+    )
+    candidates = [
+        ((i, d, j), {"order": (I, D, J), "period": m}, K == 1)
+        for i in range(max_p + 1)
+        for j in range(max_q + 1)
+        for I in range(max_P + 1)
+        for J in range(max_Q + 1)
+        if i + j + I + J <= max_order
+        for K in range(max_K + 1)
+    ]
+    if parallel:
+        with ProcessPoolExecutor(num_cores) as executor:
+            fits = list(map_fits(fit_fn, candidates, executor))
+    else:
+        fits = map_fits(fit_fn, candidates)
+    for (_, _, K), fit in zip(candidates, fits):
+        if fit["ic"] < best_ic:
+            best_ic = fit["ic"]
+            best_fit = fit
+            constant = K
     if best_fit is None:
         raise RuntimeError("No ARIMA model able to be estimated")
     if approximation:
@@ -1382,11 +1839,13 @@ def search_arima(
                 offset=offset,
                 allow_drift=allow_drift,
                 allow_mean=allow_mean,
+                parallel=parallel,
+                num_cores=num_cores,
                 **kwargs,
             )
     return best_fit
 
-# %% ../nbs/src/arima.ipynb 55
+# %% ../nbs/src/arima.ipynb 68
 def arima2(x, model, xreg, method):
     m = model["arma"][4]  # 5
     use_drift = "drift" in model["coef"].keys()
@@ -1397,10 +1856,13 @@ def arima2(x, model, xreg, method):
         n = len(model["x"])
         time = np.arange(0, (n + 1) / m, 1 / m)[:n].reshape(-1, 1)
         # drift is the first column of the exogenous regressors
-        driftmod = sm.OLS(model["xreg"][:, 0], sm.add_constant(time)).fit()
+        from statsmodels.regression.linear_model import OLS
+        from statsmodels.tools.tools import add_constant
+
+        driftmod = OLS(model["xreg"][:, 0], add_constant(time)).fit()
         n = len(x)
         newtime = np.arange(0, (n + 1) / m, 1 / m)[:n].reshape(-1, 1)
-        newxreg = driftmod.predict(sm.add_constant(newtime)).reshape(-1, 1)
+        newxreg = driftmod.predict(add_constant(newtime)).reshape(-1, 1)
         if xreg is not None:
             xreg = np.concatenate([newxreg, xreg], axis=1)
         else:
@@ -1453,7 +1915,7 @@ def arima2(x, model, xreg, method):
         refit["coef"] = change_drift_name(refit["coef"])
     return refit
 
-# %% ../nbs/src/arima.ipynb 56
+# %% ../nbs/src/arima.ipynb 69
 def Arima(
     x,
     order=(0, 0, 0),
@@ -1547,7 +2009,7 @@ def Arima(
         tmp["sigma2"] = np.nansum(tmp["residuals"] ** 2) / (nstar - npar + 1)
     return tmp
 
-# %% ../nbs/src/arima.ipynb 64
+# %% ../nbs/src/arima.ipynb 78
 def arima_string(model, padding=False):
     order = tuple(model["arma"][i] for i in [0, 5, 1, 2, 6, 3, 4])
     m = order[6]
@@ -1577,11 +2039,11 @@ def arima_string(model, padding=False):
 
     return result
 
-# %% ../nbs/src/arima.ipynb 67
+# %% ../nbs/src/arima.ipynb 81
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../nbs/src/arima.ipynb 68
+# %% ../nbs/src/arima.ipynb 82
 def forecast_arima(
     model,
     h=None,
@@ -1648,7 +2110,7 @@ def forecast_arima(
         if bootstrap:
             raise NotImplementedError("bootstrap=True")
         else:
-            quantiles = norm.ppf(0.5 * (1 + np.asarray(level) / 100))
+            quantiles = ndtri(0.5 * (1 + np.asarray(level) / 100))
             lower = pd.DataFrame(
                 pred.reshape(-1, 1) - quantiles * se.reshape(-1, 1),
                 columns=[f"{l}%" for l in level],
@@ -1676,7 +2138,7 @@ def forecast_arima(
 
     return ans
 
-# %% ../nbs/src/arima.ipynb 75
+# %% ../nbs/src/arima.ipynb 89
 def fitted_arima(model, h=1):
     """Returns h-step forecasts for the data used in fitting the model."""
     if h == 1:
@@ -1692,7 +2154,7 @@ def fitted_arima(model, h=1):
     else:
         raise NotImplementedError("h > 1")
 
-# %% ../nbs/src/arima.ipynb 80
+# %% ../nbs/src/arima.ipynb 94
 def seas_heuristic(x, period):
     # nperiods = period > 1
     season = math.nan
@@ -1704,7 +2166,7 @@ def seas_heuristic(x, period):
         season = max(0, min(1, 1 - vare / np.var(remainder + seasonal, ddof=1)))
     return season
 
-# %% ../nbs/src/arima.ipynb 82
+# %% ../nbs/src/arima.ipynb 96
 def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
     D = 0
     if alpha < 0.01:
@@ -1767,7 +2229,7 @@ def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
             dodiff = False
     return D
 
-# %% ../nbs/src/arima.ipynb 84
+# %% ../nbs/src/arima.ipynb 98
 def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
     x = x[~np.isnan(x)]
     d = 0
@@ -1785,11 +2247,13 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
         return d
 
     def run_tests(x, test, alpha):
+        from statsmodels.tsa.stattools import kpss
+
         try:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
                 nlags = math.floor(3 * math.sqrt(len(x)) / 13)
-                diff = sm.tsa.kpss(x, "c", nlags=nlags)[1] < alpha
+                diff = kpss(x, "c", nlags=nlags)[1] < alpha
         except Exception as e:
             warnings.warn(
                 f"The chosen unit root test encountered an error when testing for the {d} difference.\n"
@@ -1812,13 +2276,23 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             return d - 1
     return d
 
-# %% ../nbs/src/arima.ipynb 86
+# %% ../nbs/src/arima.ipynb 100
 def newmodel(p, d, q, P, D, Q, constant, results):
     curr = np.array([p, d, q, P, D, Q, constant])
     in_results = (curr == results[:, :7]).all(1).any()
     return not in_results
 
-# %% ../nbs/src/arima.ipynb 88
+# %% ../nbs/src/arima.ipynb 102
+def warm_start_init(fitted_model):
+    # initial values of the ARMA coefficients taken from a fitted model.
+    # the coefficients of the regressors come from the regression, since
+    # the optimizer can work with the regressors in a rotated basis
+    narma = sum(fitted_model["arma"][:4])
+    init = np.full(len(fitted_model["coef"]), np.nan)
+    init[:narma] = list(fitted_model["coef"].values())[:narma]
+    return init
+
+# %% ../nbs/src/arima.ipynb 103
 def auto_arima_f(
     x,
     d=None,
@@ -1853,6 +2327,11 @@ def auto_arima_f(
     blambda=None,
     biasadj=False,
     period=1,
+    parallel=False,
+    num_cores=2,
+    cache=None,
+    warm_start=None,
+    selection_length=None,
 ):
     if approximation is None:
         approximation = len(x) > 150 or period > 12
@@ -1860,6 +2339,8 @@ def auto_arima_f(
         raise ValueError("auto_arima can only handle univariate time series")
     if test_kwargs is None:
         test_kwargs = {}
+    if cache is None:
+        cache = ARIMACache()
     if seasonal_test_kwargs is None:
         seasonal_test_kwargs = {}
     x = x.copy()
@@ -1884,6 +2365,31 @@ def auto_arima_f(
         fit["x"] = origx
         fit["constant"] = True
         return fit
+    if warm_start is not None:
+        # fits the order of a previous model starting from its coefficients,
+        # the search only runs if this fails
+        arma = warm_start["arma"]
+        try:
+            fit = myarima(
+                x,
+                order=(arma[0], arma[5], arma[1]),
+                seasonal={"order": (arma[2], arma[6], arma[3]), "period": arma[4]},
+                constant="intercept" in warm_start["coef"]
+                or "drift" in warm_start["coef"],
+                ic=ic,
+                trace=trace,
+                xreg=xreg,
+                method=method,
+                cache=cache,
+                init=warm_start_init(warm_start),
+            )
+        except ValueError:
+            fit = {"ic": math.inf}
+        if math.isfinite(fit["ic"]):
+            fit["x"] = origx
+            fit["ic"] = None
+            fit["lambda"] = blambda
+            return fit
     m = period if seasonal else 1
     if m < 1:
         m = 1
@@ -1914,7 +2420,10 @@ def auto_arima_f(
             if sv.min() / sv.sum() < np.finfo(np.float64).eps:
                 raise ValueError("xreg is rank deficient")
             j = (~np.isnan(x)) & (~np.isnan(np.nansum(xregg, 1)))
-            xx[j] = sm.OLS(x, sm.add_constant(xregg)).fit().resid
+            from statsmodels.regression.linear_model import OLS
+            from statsmodels.tools.tools import add_constant
+
+            xx[j] = OLS(x, add_constant(xregg)).fit().resid
     else:
         xx = x
         xregg = None
@@ -1925,8 +2434,14 @@ def auto_arima_f(
     elif D is None and len(xx) <= 2 * m:
         D = 0
     elif D is None:
-        D = nsdiffs(
-            xx, period=m, test=seasonal_test, max_D=max_D, **seasonal_test_kwargs
+        D = cached(
+            cache,
+            nsdiffs,
+            xx,
+            period=m,
+            test=seasonal_test,
+            max_D=max_D,
+            **seasonal_test_kwargs,
         )
         if D > 0 and xregg is not None:
             diffxreg = diff(xregg, m, D)
@@ -1946,7 +2461,7 @@ def auto_arima_f(
         else:
             diffxreg = xregg
     if d is None:
-        d = ndiffs(dx, test=test, max_d=max_d, **test_kwargs)
+        d = cached(cache, ndiffs, dx, test=test, max_d=max_d, **test_kwargs)
         if d > 0 and xregg is not None:
             diffxreg = diff(diffxreg, 1, d)
             if any(is_constant(col) for col in diffxreg.T):
@@ -2017,10 +2532,29 @@ def auto_arima_f(
             max_p = min(max_p, m - 1)
         if max_q > 0:
             max_q = min(max_q, m - 1)
+    # the fast mode selects the model using CSS on the last selection_length
+    # observations and only fits the selected one with method on the whole serie
+    full_x, full_xreg = x, xreg
+    fast = selection_length is not None and len(x) > selection_length
+    if fast:
+        x = x[-selection_length:]
+        if xreg is not None:
+            xreg = xreg[-selection_length:]
+        series_len = int(np.sum(~np.isnan(x)))
+        max_p = min(max_p, series_len // 3)
+        max_q = min(max_q, series_len // 3)
+        max_P = min(max_P, math.floor(series_len / 3 / m))
+        max_Q = min(max_Q, math.floor(series_len / 3 / m))
+        approximation = True
+        search_method = "CSS"
+    else:
+        search_method = method
     if approximation:
         if truncate is not None:
             if len(x) > truncate:
                 x = x[-truncate:]
+                if not fast:
+                    full_x = x
         try:
             if D == 0:
                 fit = arima(x, order=(0, d, 0), xreg=xreg)
@@ -2041,6 +2575,21 @@ def auto_arima_f(
     constant = allowdrift or allowmean
     if approximation and trace:
         print("Fitting models using approximations to speed things up")
+
+    def refit(p, q, P, Q, constant):
+        return myarima(
+            full_x,
+            (p, d, q),
+            {"order": (P, D, Q), "period": m},
+            constant=constant,
+            ic=ic,
+            trace=trace,
+            approximation=False,
+            method=method,
+            xreg=full_xreg,
+            cache=cache,
+        )
+
     if not stepwise:
         bestfit = search_arima(
             x,
@@ -2054,14 +2603,44 @@ def auto_arima_f(
             stationary,
             ic,
             trace,
-            approximation,
-            method=method,
+            approximation and not fast,
+            method=search_method,
             xreg=xreg,
             offset=offset,
             allow_drift=allowdrift,
             allow_mean=allowmean,
             period=m,
+            parallel=parallel,
+            num_cores=num_cores,
+            cache=cache,
         )
+        if fast:
+            arma = bestfit["arma"]
+            constant = "intercept" in bestfit["coef"] or "drift" in bestfit["coef"]
+            bestfit = refit(arma[0], arma[1], arma[2], arma[3], constant)
+            if math.isinf(bestfit["ic"]):
+                bestfit = search_arima(
+                    full_x,
+                    d,
+                    D,
+                    max_p,
+                    max_q,
+                    max_P,
+                    max_Q,
+                    max_order,
+                    stationary,
+                    ic,
+                    trace,
+                    False,
+                    method=method,
+                    xreg=full_xreg,
+                    allow_drift=allowdrift,
+                    allow_mean=allowmean,
+                    period=m,
+                    parallel=parallel,
+                    num_cores=num_cores,
+                    cache=cache,
+                )
         bestfit["lambda"] = blambda
         bestfit["x"] = origx
         if trace:
@@ -2086,241 +2665,282 @@ def auto_arima_f(
         approximation=approximation,
         offset=offset,
         xreg=xreg,
-        method=method,
-    )
-    bestfit = p_myarima(
-        order=(p, d, q),
-        seasonal={"order": (P, D, Q), "period": m},
-    )
-    results[0] = (p, d, q, P, D, Q, constant, bestfit["ic"])
-    fit = p_myarima(
-        order=(0, d, 0),
-        seasonal={"order": (0, D, 0), "period": m},
+        method=search_method,
+        cache=cache,
     )
-    results[1] = (0, d, 0, 0, D, 0, constant, fit["ic"])
-    if fit["ic"] < bestfit["ic"]:
-        bestfit = fit
-        p = q = P = Q = 0
-    k = 2
-    if max_p > 0 or max_P > 0:
-        p_ = int(max_p > 0)
-        P_ = int(m > 1 and max_P > 0)
-        fit = p_myarima(
-            order=(p_, d, 0),
-            seasonal={"order": (P_, D, 0), "period": m},
+    # try_params fits the models with the constant of p_myarima
+    fit_constant = constant
+    fits = {}
+    executor = ProcessPoolExecutor(num_cores) if parallel else None
+
+    def prefit(candidates):
+        # fits the candidates concurrently, fit_model then takes them from `fits`
+        if executor is None:
+            return
+        keys = [key for key in dict.fromkeys(candidates) if key not in fits]
+        args = [
+            ((p, d, q), {"order": (P, D, Q), "period": m}, constant)
+            for p, q, P, Q, constant in keys
+        ]
+        fits.update(zip(keys, map_fits(p_myarima, args, executor)))
+
+    def fit_model(p, q, P, Q, constant=fit_constant):
+        key = (p, q, P, Q, constant)
+        if key in fits:
+            return fits.pop(key)
+        return p_myarima(
+            order=(p, d, q),
+            seasonal={"order": (P, D, Q), "period": m},
+            constant=constant,
         )
-        results[k] = (p_, d, 0, P_, D, 0, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = p_
-            P = P_
-            q = Q = 0
-        k += 1
+
+    def neighbourhood(p, q, P, Q, constant):
+        # models tried by the stepwise search around the current one, in order
+        steps = [(-1, 0), (0, -1), (1, 0), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+        for dP, dQ in steps:
+            if 0 <= P + dP <= max_P and 0 <= Q + dQ <= max_Q:
+                yield p, q, P + dP, Q + dQ, constant
+        for dp, dq in steps:
+            if 0 <= p + dp <= max_p and 0 <= q + dq <= max_q:
+                yield p + dp, q + dq, P, Q, constant
+        if allowdrift or allowmean:
+            yield p, q, P, Q, not constant
+
+    p_ = int(max_p > 0)
+    P_ = int(m > 1 and max_P > 0)
+    q_ = int(max_q > 0)
+    Q_ = int(m > 1 and max_Q > 0)
+    start_models = [(p, q, P, Q, constant), (0, 0, 0, 0, constant)]
+    if max_p > 0 or max_P > 0:
+        start_models.append((p_, 0, P_, 0, constant))
     if max_q > 0 or max_Q > 0:
-        q_ = int(max_q > 0)
-        Q_ = int(m > 1 and max_Q > 0)
-        fit = p_myarima(
-            order=(0, d, q_),
-            seasonal={"order": (0, D, Q_), "period": m},
-        )
-        results[k] = (0, d, q_, 0, D, Q_, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = P = 0
-            Q = Q_
-            q = q_
-        k += 1
+        start_models.append((0, q_, 0, Q_, constant))
     if constant:
-        fit = p_myarima(
-            order=(0, d, 0),
-            seasonal={"order": (0, D, 0), "period": m},
-            constant=False,
-        )
-        results[k] = (0, d, 0, 0, D, 0, 0, fit["ic"])
+        start_models.append((0, 0, 0, 0, False))
+    try:
+        prefit(start_models)
+        bestfit = fit_model(p, q, P, Q)
+        results[0] = (p, d, q, P, D, Q, constant, bestfit["ic"])
+        fit = fit_model(0, 0, 0, 0)
+        results[1] = (0, d, 0, 0, D, 0, constant, fit["ic"])
         if fit["ic"] < bestfit["ic"]:
             bestfit = fit
             p = q = P = Q = 0
-        k += 1
-
-    def try_params(p, d, q, P, D, Q, constant, k, bestfit):
-        improved = False
-        if k >= results.shape[0]:
+        k = 2
+        if max_p > 0 or max_P > 0:
+            fit = fit_model(p_, 0, P_, 0)
+            results[k] = (p_, d, 0, P_, D, 0, constant, fit["ic"])
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p = p_
+                P = P_
+                q = Q = 0
+            k += 1
+        if max_q > 0 or max_Q > 0:
+            fit = fit_model(0, q_, 0, Q_)
+            results[k] = (0, d, q_, 0, D, Q_, constant, fit["ic"])
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p = P = 0
+                Q = Q_
+                q = q_
+            k += 1
+        if constant:
+            fit = fit_model(0, 0, 0, 0, constant=False)
+            results[k] = (0, d, 0, 0, D, 0, 0, fit["ic"])
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p = q = P = Q = 0
+            k += 1
+
+        def try_params(p, d, q, P, D, Q, constant, k, bestfit):
+            improved = False
+            if k >= results.shape[0]:
+                return k, bestfit, improved
+            fit = fit_model(p, q, P, Q)
+            results[k] = (p, d, q, P, D, Q, constant, fit["ic"])
+            k += 1
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                improved = True
             return k, bestfit, improved
-        fit = p_myarima(
-            order=(p, d, q),
-            seasonal={"order": (P, D, Q), "period": m},
-        )
-        results[k] = (p, d, q, P, D, Q, constant, fit["ic"])
-        k += 1
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            improved = True
-        return k, bestfit, improved
-
-    startk = 0
-    while startk < k and k < nmodels:
-        startk = k
-        if P > 0 and newmodel(p, d, q, P - 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                continue
-        if Q > 0 and newmodel(p, d, q, P, D, Q - 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                Q -= 1
-                continue
-        if P < max_P and newmodel(p, d, q, P + 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                continue
-        if Q < max_Q and newmodel(p, d, q, P, D, Q + 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q += 1
-                continue
-        if p > 0 and newmodel(p - 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p - 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                continue
-        if q > 0 and newmodel(p, d, q - 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q -= 1
-                continue
-        if p < max_p and newmodel(p + 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p + 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                continue
-        if q < max_q and newmodel(p, d, q + 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q += 1
-                continue
-        if (
-            q > 0
-            and p > 0
-            and newmodel(p - 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p > 0
-            and newmodel(p - 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q += 1
-                continue
-        if (
-            q > 0
-            and p < max_p
-            and newmodel(p + 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p < max_p
-            and newmodel(p + 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q += 1
-                continue
-        if (allowdrift or allowmean) and newmodel(
-            p, d, q, P, D, Q, not constant, results[:k]
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q, not constant, k, bestfit
-            )
-            if improved:
-                constant = not constant
-                continue
+
+        startk = 0
+        while startk < k and k < nmodels:
+            startk = k
+            if parallel:
+                # the models of the neighbourhood are fitted concurrently, but they're still
+                # compared in the same order, so the search selects the same model as the serial one
+                candidates = [
+                    (p1, q1, P1, Q1, fit_constant)
+                    for p1, q1, P1, Q1, constant1 in neighbourhood(p, q, P, Q, constant)
+                    if newmodel(p1, d, q1, P1, D, Q1, constant1, results[:k])
+                ]
+                prefit(candidates[: nmodels - k])
+            if P > 0 and newmodel(p, d, q, P - 1, D, Q, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p, d, q, P - 1, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    P -= 1
+                    continue
+            if Q > 0 and newmodel(p, d, q, P, D, Q - 1, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p, d, q, P, D, Q - 1, constant, k, bestfit
+                )
+                if improved:
+                    Q -= 1
+                    continue
+            if P < max_P and newmodel(p, d, q, P + 1, D, Q, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p, d, q, P + 1, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    P += 1
+                    continue
+            if Q < max_Q and newmodel(p, d, q, P, D, Q + 1, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p, d, q, P, D, Q + 1, constant, k, bestfit
+                )
+                if improved:
+                    Q += 1
+                    continue
+            if (
+                Q > 0
+                and P > 0
+                and newmodel(p, d, q, P - 1, D, Q - 1, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p, d, q, P - 1, D, Q - 1, constant, k, bestfit
+                )
+                if improved:
+                    P -= 1
+                    Q -= 1
+                    continue
+            if (
+                Q < max_Q
+                and P > 0
+                and newmodel(p, d, q, P - 1, D, Q + 1, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p, d, q, P - 1, D, Q + 1, constant, k, bestfit
+                )
+                if improved:
+                    P -= 1
+                    Q += 1
+                    continue
+            if (
+                Q > 0
+                and P < max_P
+                and newmodel(p, d, q, P + 1, D, Q - 1, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p, d, q, P + 1, D, Q - 1, constant, k, bestfit
+                )
+                if improved:
+                    P += 1
+                    Q -= 1
+                    continue
+            if (
+                Q < max_Q
+                and P < max_P
+                and newmodel(p, d, q, P + 1, D, Q + 1, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p, d, q, P + 1, D, Q + 1, constant, k, bestfit
+                )
+                if improved:
+                    P += 1
+                    Q += 1
+                    continue
+            if p > 0 and newmodel(p - 1, d, q, P, D, Q, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p - 1, d, q, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    p -= 1
+                    continue
+            if q > 0 and newmodel(p, d, q - 1, P, D, Q, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p, d, q - 1, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    q -= 1
+                    continue
+            if p < max_p and newmodel(p + 1, d, q, P, D, Q, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p + 1, d, q, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    p += 1
+                    continue
+            if q < max_q and newmodel(p, d, q + 1, P, D, Q, constant, results[:k]):
+                k, bestfit, improved = try_params(
+                    p, d, q + 1, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    q += 1
+                    continue
+            if (
+                q > 0
+                and p > 0
+                and newmodel(p - 1, d, q - 1, P, D, Q, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p - 1, d, q - 1, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    p -= 1
+                    q -= 1
+                    continue
+            if (
+                q < max_q
+                and p > 0
+                and newmodel(p - 1, d, q + 1, P, D, Q, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p - 1, d, q + 1, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    p -= 1
+                    q += 1
+                    continue
+            if (
+                q > 0
+                and p < max_p
+                and newmodel(p + 1, d, q - 1, P, D, Q, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p + 1, d, q - 1, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    p += 1
+                    q -= 1
+                    continue
+            if (
+                q < max_q
+                and p < max_p
+                and newmodel(p + 1, d, q + 1, P, D, Q, constant, results[:k])
+            ):
+                k, bestfit, improved = try_params(
+                    p + 1, d, q + 1, P, D, Q, constant, k, bestfit
+                )
+                if improved:
+                    p += 1
+                    q += 1
+                    continue
+            if (allowdrift or allowmean) and newmodel(
+                p, d, q, P, D, Q, not constant, results[:k]
+            ):
+                k, bestfit, improved = try_params(
+                    p, d, q, P, D, Q, not constant, k, bestfit
+                )
+                if improved:
+                    constant = not constant
+                    continue
+    finally:
+        if executor is not None:
+            executor.shutdown()
     if k >= nmodels:
         warnings.warn(
             f"Stepwise search was stopped early due to reaching the model number limit: nmodels={nmodels}"
@@ -2333,17 +2953,7 @@ def auto_arima_f(
         for i in range(nmodels):
             k = icorder[i]
             p, q, P, Q, constant = map(int, results[k, [0, 2, 3, 5, 6]])
-            fit = myarima(
-                x,
-                (p, d, q),
-                {"order": (P, D, Q), "period": m},
-                constant=results[k, 6],
-                ic=ic,
-                trace=trace,
-                approximation=False,
-                method=method,
-                xreg=xreg,
-            )
+            fit = refit(p, q, P, Q, results[k, 6])
             if fit["ic"] < math.inf:
                 bestfit = fit
                 break
@@ -2356,11 +2966,59 @@ def auto_arima_f(
 
     return bestfit
 
-# %% ../nbs/src/arima.ipynb 90
+# %% ../nbs/src/arima.ipynb 110
 def forward_arima(fitted_model, y, xreg=None, method="CSS-ML"):
     return Arima(x=y, model=fitted_model, xreg=xreg, method=method)
 
-# %% ../nbs/src/arima.ipynb 99
+# %% ../nbs/src/arima.ipynb 119
+def update_arima(fitted_model, y, xreg=None, method="CSS-ML"):
+    # runs the new observations through the kalman filter starting from the last state
+    if method == "CSS":
+        # the models estimated with CSS don't keep the state of the filter
+        x = np.append(fitted_model["x"], y)
+        if xreg is not None:
+            old_xreg = fitted_model["xreg"]
+            if "drift" in fitted_model["coef"]:
+                # the drift is added by forward_arima
+                old_xreg = old_xreg[:, 1:]
+            xreg = np.vstack([old_xreg, xreg])
+        return forward_arima(fitted_model, y=x, xreg=xreg, method=method)
+    n = len(fitted_model["x"])
+    k = len(y)
+    coef = fitted_model["coef"]
+    # regressors in the order of the coefficients: intercept, drift and exogenous
+    new_xreg = np.empty((k, 0))
+    if "drift" in coef:
+        drift = np.arange(n + 1, n + k + 1, dtype=np.float64).reshape(-1, 1)
+        new_xreg = np.hstack([new_xreg, drift])
+    if any("ex_" in name for name in coef):
+        if xreg is None:
+            raise Exception("No regressors provided")
+        new_xreg = np.hstack([new_xreg, xreg])
+    model_xreg = fitted_model["xreg"]
+    if model_xreg is not None:
+        model_xreg = np.vstack([model_xreg, new_xreg])
+    if "intercept" in coef:
+        new_xreg = np.hstack([np.ones((k, 1)), new_xreg])
+    narma = sum(fitted_model["arma"][:4])
+    x = y - new_xreg @ np.array(list(coef.values()))[narma:]
+    mod = fitted_model["model"]
+    a = mod["a"].copy()
+    P = mod["P"].copy()
+    Pn = mod["Pn"].copy()
+    # up=-1 predicts the covariance of the first new point from the last state
+    _, _, _, resid = arima_like(
+        x, mod["phi"], mod["theta"], mod["delta"], a, P, Pn, -1, True
+    )
+    return {
+        **fitted_model,
+        "model": {**mod, "a": a, "P": P, "Pn": Pn},
+        "x": np.append(fitted_model["x"], y),
+        "xreg": model_xreg,
+        "residuals": np.append(fitted_model["residuals"], resid),
+    }
+
+# %% ../nbs/src/arima.ipynb 121
 def print_statsforecast_ARIMA(model, digits=3, se=True):
     print(arima_string(model, padding=False))
     if model["lambda"] is not None:
@@ -2390,7 +3048,7 @@ def print_statsforecast_ARIMA(model, digits=3, se=True):
     if not np.isnan(model["aic"]):
         print(f'AIC={round(model["aic"], 2)}')
 
-# %% ../nbs/src/arima.ipynb 101
+# %% ../nbs/src/arima.ipynb 123
 class ARIMASummary:
     """ARIMA Summary."""
 
@@ -2403,7 +3061,7 @@ class ARIMASummary:
     def summary(self):
         return print_statsforecast_ARIMA(self.model)
 
-# %% ../nbs/src/arima.ipynb 102
+# %% ../nbs/src/arima.ipynb 124
 class AutoARIMA:
     """An AutoARIMA estimator.
 
@@ -2509,6 +3167,21 @@ class AutoARIMA:
     period: int (default 1)
         Number of observations per unit of time.
         For example 24 for Hourly data.
+    parallel: bool (default False)
+        If True, the candidate models are fitted by a pool of processes.
+        The stepwise search fits the models around the current one
+        concurrently and compares them in order, so the selected
+        model doesn't change.
+    num_cores: int optional (default 2)
+        Number of processes used if `parallel=True`.
+        If None, all the available cores are used.
+    selection_length: int optional (default None)
+        When the series is longer than selection_length,
+        the model is selected with conditional sum-of-squares
+        on its last selection_length values and only the
+        selected model is fitted with method on all the
+        observations. All observations are used to select
+        the model if selection_length=None.
 
     Notes
     -----
@@ -2552,6 +3225,9 @@ class AutoARIMA:
         blambda: Optional[float] = None,
         biasadj: bool = False,
         period: int = 1,
+        parallel: bool = False,
+        num_cores: Optional[int] = 2,
+        selection_length: Optional[int] = None,
     ):
         self.d = d
         self.D = D
@@ -2584,6 +3260,9 @@ class AutoARIMA:
         self.blambda = blambda
         self.biasadj = biasadj
         self.period = period
+        self.parallel = parallel
+        self.num_cores = num_cores
+        self.selection_length = selection_length
 
     def fit(self, y: np.ndarray, X: Optional[np.ndarray] = None):
         """Fit the AutoARIMA estimator
@@ -2622,6 +3301,7 @@ class AutoARIMA:
             approximation=self.approximation,
             method=self.method,
             truncate=self.truncate,
+            selection_length=self.selection_length,
             xreg=X,
             test=self.test,
             test_kwargs=self.test_kwargs,
@@ -2632,6 +3312,8 @@ class AutoARIMA:
             blambda=self.blambda,
             biasadj=self.biasadj,
             period=self.period,
+            parallel=self.parallel,
+            num_cores=self.num_cores,
         )
         self.model_ = ARIMASummary(model_)
 
@@ -2699,7 +3381,7 @@ class AutoARIMA:
             _level = sorted(_level)
             arr_level = np.asarray(_level)
             se = np.sqrt(self.model_.model["sigma2"])
-            quantiles = norm.ppf(0.5 * (1 + arr_level / 100))
+            quantiles = ndtri(0.5 * (1 + arr_level / 100))
 
             lo = pd.DataFrame(
                 fitted_values.values.reshape(-1, 1) - quantiles * se.reshape(-1, 1),
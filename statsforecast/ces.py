@@ -9,10 +9,9 @@ from typing import Tuple
 
 import numpy as np
 from numba import njit
-from statsmodels.tsa.seasonal import seasonal_decompose
 
 from .ets import restrict_to_bounds, results
-from .utils import CACHE, NOGIL
+from .utils import CACHE, NOGIL, _samples_quantiles
 
 # %% ../nbs/src/ces.ipynb 4
 # Global variables
@@ -27,6 +26,9 @@ smalno = np.finfo(float).eps
 
 # %% ../nbs/src/ces.ipynb 6
 def initstate(y, m, seasontype):
+    # statsmodels is slow to import, so it's only loaded when needed
+    from statsmodels.tsa.seasonal import seasonal_decompose
+
     n = len(y)
     components = 2 + (seasontype == "P") + 2 * (seasontype == "F")
     lags = 1 if seasontype == "N" else m
@@ -678,29 +680,37 @@ def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     return forecast
 
 # %% ../nbs/src/ces.ipynb 31
-def _simulate_pred_intervals(model, h, level):
-
-    np.random.seed(1)
-    nsim = 5000
-    y_path = np.zeros([nsim, h])
-
+@njit(nogil=NOGIL, cache=CACHE)
+def cessimulate(states, n, m, season, h, alpha_0, alpha_1, beta_0, beta_1, noise):
+    # sample paths of the forecasts. the forecasts only depend on the last m states,
+    # so each path perturbs those with one of the rows of noise
+    m = 1 if season == NONE else m
+    nsim = noise.shape[0]
+    paths = np.empty((h, nsim))
+    last_states = states[n : (n + m)]
+    sim_states = np.empty((m, states.shape[1]))
+    f = np.zeros(h)
     for k in range(nsim):
-        e = np.random.normal(0, np.sqrt(model["sigma2"]), model["states"].shape)
-        states = model["states"]
-        fcsts = np.zeros(h, dtype=np.float32)
-        cesforecast(
-            states=states + e,
-            n=model["n"],
-            m=model["m"],
-            season=switch_ces(model["seasontype"]),
-            h=h,
-            f=fcsts,
-            **model["par"],
-        )
-        y_path[k,] = fcsts
-
-    lower = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=0)
-    upper = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=0)
+        sim_states[:] = last_states + noise[k]
+        cesfcst(sim_states, m, m, season, f, h, alpha_0, alpha_1, beta_0, beta_1)
+        paths[:, k] = f
+    return paths
+
+
+def _simulate_pred_intervals(model, h, level, nsim=5_000, seed=1):
+    season = switch_ces(model["seasontype"])
+    states = model["states"]
+    lags = 1 if season == NONE else model["m"]
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(0, np.sqrt(model["sigma2"]), (nsim, lags, states.shape[1]))
+    y_path = cessimulate(
+        states, model["n"], model["m"], season, h, noise=noise, **model["par"]
+    )
+    level = np.asarray(level)
+    quantiles = _samples_quantiles(
+        y_path, np.hstack([0.5 - level / 200, 0.5 + level / 200])
+    )
+    lower, upper = quantiles[: level.size], quantiles[level.size :]
     pi = {
         **{f"lo-{lv}": lower[i] for i, lv in enumerate(level)},
         **{f"hi-{lv}": upper[i] for i, lv in enumerate(level)},
@@ -709,16 +719,16 @@ def _simulate_pred_intervals(model, h, level):
     return pi
 
 # %% ../nbs/src/ces.ipynb 32
-def forecast_ces(obj, h, level=None):
+def forecast_ces(obj, h, level=None, nsim=5_000, seed=1):
     fcst = pegelsfcast_C(h, obj)
     out = {"mean": fcst}
     out["fitted"] = obj["fitted"]
     if level is not None:
-        pi = _simulate_pred_intervals(model=obj, h=h, level=level)
+        pi = _simulate_pred_intervals(model=obj, h=h, level=level, nsim=nsim, seed=seed)
         out = {**out, **pi}
     return out
 
-# %% ../nbs/src/ces.ipynb 34
+# %% ../nbs/src/ces.ipynb 35
 def auto_ces(
     y,
     m,
@@ -783,7 +793,7 @@ def auto_ces(
         raise Exception("no model able to be fitted")
     return model
 
-# %% ../nbs/src/ces.ipynb 37
+# %% ../nbs/src/ces.ipynb 38
 def forward_ces(fitted_model, y):
     m = fitted_model["m"]
     model = fitted_model["seasontype"]
@@ -800,3 +810,47 @@ def forward_ces(fitted_model, y):
         beta_0=beta_0,
         beta_1=beta_1,
     )
+
+# %% ../nbs/src/ces.ipynb 40
+@njit(nogil=NOGIL, cache=CACHE)
+def cesupdatestates(states, n, m, season, alpha_0, alpha_1, beta_0, beta_1, y, e):
+    # states has the n + m fitted states followed by space for the new ones
+    # and the m states of the forecast
+    f = np.zeros(max(1, m))
+    for i in range(n + m, n + m + y.size):
+        cesfcst(states, i, m, season, f, 1, alpha_0, alpha_1, beta_0, beta_1)
+        e[i - n - m] = y[i - n - m] - f[0]
+        cesupdate(states, i, m, season, alpha_0, alpha_1, beta_0, beta_1, y[i - n - m])
+    new_states = cesfcst(
+        states, n + y.size + m, m, season, f, m, alpha_0, alpha_1, beta_0, beta_1
+    )
+    states[-m:] = new_states[-m:]
+
+
+def update_ces(fitted_model, y):
+    m = fitted_model["m"]
+    n = fitted_model["n"]
+    k = y.size
+    old_states = fitted_model["states"]
+    states = np.zeros((n + k + 2 * m, old_states.shape[1]), dtype=np.float32)
+    states[: n + m] = old_states[: n + m]
+    e = np.full_like(y, fill_value=np.nan)
+    cesupdatestates(
+        states=states,
+        n=n,
+        m=m,
+        season=switch_ces(fitted_model["seasontype"]),
+        y=y,
+        e=e,
+        **fitted_model["par"],
+    )
+    np_ = old_states.shape[1] + 1
+    sse = fitted_model["sigma2"] * (n - np_ - 1) + np.sum(e**2)
+    return {
+        **fitted_model,
+        "states": states,
+        "n": n + k,
+        "residuals": np.append(fitted_model["residuals"], e),
+        "fitted": np.append(fitted_model["fitted"], y - e),
+        "sigma2": sse / (n + k - np_ - 1),
+    }
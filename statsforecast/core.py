@@ -1,13 +1,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/src/core/core.ipynb.
 
 # %% auto 0
-__all__ = ['StatsForecast']
+__all__ = ['save_panel', 'warmup', 'StatsForecast']
 
 # %% ../nbs/src/core/core.ipynb 6
+import copy
 import datetime as dt
 import errno
 import inspect
 import logging
+import math
+import mmap
 import os
 import pickle
 import re
@@ -15,9 +18,22 @@ import reprlib
 import time
 import warnings
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -33,7 +49,7 @@ from utilsforecast.compat import DataFrame, pl_DataFrame, pl_Series
 from utilsforecast.grouped_array import GroupedArray as BaseGroupedArray
 from utilsforecast.validation import ensure_time_dtype, validate_freq
 
-from .utils import ConformalIntervals
+from .utils import ConformalIntervals, NOGIL
 
 # %% ../nbs/src/core/core.ipynb 7
 if __name__ == "__main__":
@@ -44,8 +60,90 @@ if __name__ == "__main__":
 logger = logging.getLogger(__name__)
 
 # %% ../nbs/src/core/core.ipynb 10
+class _ModelOutput:
+    """Output columns of a model, resolved once from its first result."""
+
+    def __init__(self, name, res, fitted=False):
+        self.keys = [key for key in res.keys() if key.startswith(("mean", "lo", "hi"))]
+        self.cols = [name if key == "mean" else f"{name}-{key}" for key in self.keys]
+        self.fitted_keys = []
+        self.fitted_cols = []
+        if fitted:
+            self.fitted_keys = [key for key in res.keys() if key.startswith("fitted")]
+            self.fitted_cols = [
+                name if key == "fitted" else f"{name}-{key.replace('fitted-', '')}"
+                for key in self.fitted_keys
+            ]
+
+    def write(self, res, out):
+        # out is a view of the preallocated output for this model
+        for j, key in enumerate(self.keys):
+            out[:, j] = res[key]
+
+    def write_fitted(self, res, out):
+        for j, key in enumerate(self.fitted_keys):
+            out[:, j] = res[key]
+
+
 class GroupedArray(BaseGroupedArray):
 
+    @property
+    def data(self):
+        if self._data is None:
+            # the series were extended in place, gather them in a single array
+            self._data = np.concatenate(
+                [self._buffer[:0]] + [self[i] for i in range(self.n_groups)]
+            )
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        # the series are stored one after the other, without room to extend them
+        self._buffer = data
+        self._starts = None
+        self._capacity = None
+
+    def __getitem__(self, idx):
+        if self._starts is None:
+            return super().__getitem__(idx)
+        if idx < 0:
+            idx = self.n_groups + idx
+        start = self._starts[idx]
+        return self._buffer[start : start + self.indptr[idx + 1] - self.indptr[idx]]
+
+    def extend(self, sizes, values):
+        # appends the next sizes[i] rows of values to the i-th serie. The series
+        # are stored apart in a buffer with room to extend them, so only the new
+        # values are copied. When one doesn't fit, all of them are moved to a new
+        # buffer with room for as many values as they have, which amortizes the
+        # copies of the history over the following calls.
+        # The returned array shares the buffer, so this one can't be extended again.
+        old_sizes = np.diff(self.indptr)
+        new_sizes = old_sizes + sizes
+        if self._starts is None or (new_sizes > self._capacity).any():
+            capacity = 2 * new_sizes
+            starts = np.append(0, capacity.cumsum()[:-1])
+            buffer = np.empty(
+                (capacity.sum(), *self._buffer.shape[1:]), dtype=self._buffer.dtype
+            )
+            for i in range(self.n_groups):
+                buffer[starts[i] : starts[i] + old_sizes[i]] = self[i]
+        else:
+            buffer, starts, capacity = self._buffer, self._starts, self._capacity
+        values_indptr = np.append(0, sizes.cumsum())
+        for i in np.flatnonzero(sizes):
+            start = starts[i] + old_sizes[i]
+            buffer[start : start + sizes[i]] = values[
+                values_indptr[i] : values_indptr[i + 1]
+            ]
+        indptr = np.append(0, new_sizes.cumsum()).astype(self.indptr.dtype)
+        ga = GroupedArray(buffer, indptr)
+        ga._data = None
+        ga._starts = starts
+        ga._capacity = capacity
+        return ga
+
     def __eq__(self, other):
         if not hasattr(other, "data") or not hasattr(other, "indptr"):
             return False
@@ -71,6 +169,32 @@ class GroupedArray(BaseGroupedArray):
                         raise error
         return fm
 
+    def update(self, fm, sizes, fallback_model=None):
+        # the last sizes[i] values of each serie are the new observations
+        for i in np.flatnonzero(sizes):
+            grp = self[i]
+            y = grp[:, 0] if grp.ndim == 2 else grp
+            X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
+            new_y = y[-sizes[i] :]
+            new_X = X[-sizes[i] :] if X is not None else None
+            for i_model in range(fm.shape[1]):
+                model = fm[i, i_model]
+                try:
+                    if hasattr(model, "update"):
+                        # update a copy to keep the fitted model if an update fails
+                        fm[i, i_model] = copy.copy(model).update(y=new_y, X=new_X)
+                    else:
+                        # models without states are fitted on the whole serie
+                        fm[i, i_model] = model.new().fit(y=y, X=X)
+                except Exception as error:
+                    if fallback_model is not None:
+                        new_fallback_model = fallback_model.new()
+                        new_fallback_model.alias = model.alias
+                        fm[i, i_model] = new_fallback_model.fit(y=y, X=X)
+                    else:
+                        raise error
+        return fm
+
     def _get_cols(self, models, attr, h, X, level=tuple()):
         n_models = len(models)
         cuts = np.full(n_models + 1, fill_value=0, dtype=np.int32)
@@ -98,13 +222,18 @@ class GroupedArray(BaseGroupedArray):
         )
         return out, cuts, has_level_models
 
-    def predict(self, fm, h, X=None, level=tuple()):
+    def predict(self, fm, h, X=None, level=tuple(), out=None):
         # fm stands for fitted_models
         # and fm should have fitted_model
-        fcsts, cuts, has_level_models = self._output_fcst(
-            models=fm[0], attr="predict", h=h, X=X, level=level
-        )
-        matches = ["mean", "lo", "hi"]
+        if out is None:
+            fcsts, cuts, has_level_models = self._output_fcst(
+                models=fm[0], attr="predict", h=h, X=X, level=level
+            )
+        else:
+            cuts, has_level_models = self._get_cols(
+                models=fm[0], attr="predict", h=h, X=X, level=level
+            )
+            fcsts = out
         cols = []
         for i_model in range(fm.shape[1]):
             has_level = has_level_models[i_model]
@@ -117,21 +246,12 @@ class GroupedArray(BaseGroupedArray):
                 else:
                     X_ = None
                 res_i = fm[i, i_model].predict(h=h, X=X_, **kwargs)
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                model_name = repr(fm[i, i_model])
-                cols_m = [
-                    f"{model_name}" if col == "mean" else f"{model_name}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-            cols += cols_m
+                if i == 0:
+                    output = _ModelOutput(repr(fm[i, i_model]), res_i)
+                output.write(
+                    res_i, fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]]
+                )
+            cols += output.cols
         return fcsts, cols
 
     def fit_predict(self, models, h, X=None, level=tuple()):
@@ -151,36 +271,83 @@ class GroupedArray(BaseGroupedArray):
         level=tuple(),
         verbose=False,
         target_col="y",
+        out=None,
+        fitted_out=None,
     ):
-        fcsts, cuts, has_level_models = self._output_fcst(
-            models=models, attr="forecast", h=h, X=X, level=level
-        )
-        matches = ["mean", "lo", "hi"]
-        matches_fitted = ["fitted", "fitted-lo", "fitted-hi"]
+        if out is None:
+            fcsts, cuts, has_level_models = self._output_fcst(
+                models=models, attr="forecast", h=h, X=X, level=level
+            )
+        else:
+            cuts, has_level_models = self._get_cols(
+                models=models, attr="forecast", h=h, X=X, level=level
+            )
+            fcsts = out
         if fitted:
             # for the moment we dont return levels for fitted values in
             # forecast mode
-            fitted_vals = np.full(
-                (self.data.shape[0], 1 + cuts[-1]), np.nan, dtype=np.float32
-            )
+            if fitted_out is None:
+                fitted_vals = np.full(
+                    (self.data.shape[0], 1 + cuts[-1]), np.nan, dtype=np.float32
+                )
+            else:
+                fitted_vals = fitted_out
             if self.data.ndim == 1:
                 fitted_vals[:, 0] = self.data
             else:
                 fitted_vals[:, 0] = self.data[:, 0]
+        times = {repr(m): 0.0 for m in models}
+        outputs = [None] * len(models)
+        # models that can forecast all the series in a single call
+        y = self.data[:, 0] if self.data.ndim == 2 else self.data
+        for i_model, model in enumerate(models):
+            has_level = has_level_models[i_model]
+            if not hasattr(model, "forecast_batch"):
+                continue
+            if has_level and getattr(model, "prediction_intervals", None) is not None:
+                continue
+            kwargs = {}
+            if has_level:
+                kwargs["level"] = level
+            start = time.perf_counter()
+            try:
+                res = model.forecast_batch(
+                    y=y, indptr=self.indptr, h=h, fitted=fitted, **kwargs
+                )
+            except (ValueError, NotImplementedError) as error:
+                # run serie by serie, which takes care of the fallback model
+                warnings.warn(
+                    f"{model!r} can't forecast all the series at once ({error}), "
+                    "forecasting them one by one."
+                )
+                continue
+            times[repr(model)] += time.perf_counter() - start
+            outputs[i_model] = _ModelOutput(repr(model), res, fitted)
+            outputs[i_model].write(res, fcsts[:, cuts[i_model] : cuts[i_model + 1]])
+            if fitted:
+                outputs[i_model].write_fitted(
+                    res, fitted_vals[:, (cuts[i_model] + 1) : (cuts[i_model + 1] + 1)]
+                )
+        serie_models = [
+            i_model for i_model, output in enumerate(outputs) if output is None
+        ]
         iterable = tqdm(
-            enumerate(self), disable=(not verbose), total=len(self), desc="Forecast"
+            enumerate(self),
+            disable=(not verbose or not serie_models),
+            total=len(self),
+            desc="Forecast",
         )
-        times = {repr(m): 0.0 for m in models}
         for i, grp in iterable:
+            if not serie_models:
+                break
             y_train = grp[:, 0] if grp.ndim == 2 else grp
             X_train = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
             if X is not None:
                 X_f = X[i]
             else:
                 X_f = None
-            cols = []
-            cols_fitted = []
-            for i_model, model in enumerate(models):
+            for i_model in serie_models:
+                model = models[i_model]
                 has_level = has_level_models[i_model]
                 kwargs = {}
                 if has_level:
@@ -203,40 +370,23 @@ class GroupedArray(BaseGroupedArray):
                     else:
                         raise error
                 times[repr(model)] += time.perf_counter() - start
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                cols_m = [
-                    f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-                cols += cols_m
+                if outputs[i_model] is None:
+                    outputs[i_model] = _ModelOutput(repr(model), res_i, fitted)
+                output = outputs[i_model]
+                output.write(
+                    res_i, fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]]
+                )
                 if fitted:
-                    cols_m_fitted = [
-                        key
-                        for key in res_i.keys()
-                        if any(key.startswith(m) for m in matches_fitted)
-                    ]
-                    fitted_i = np.vstack([res_i[key] for key in cols_m_fitted]).T
-                    cols_m_fitted = [
-                        (
-                            f"{repr(model)}"
-                            if col == "fitted"
-                            else f"{repr(model)}-{col.replace('fitted-', '')}"
-                        )
-                        for col in cols_m_fitted
-                    ]
-                    fitted_vals[
-                        self.indptr[i] : self.indptr[i + 1],
-                        (cuts[i_model] + 1) : (cuts[i_model + 1] + 1),
-                    ] = fitted_i
-                    cols_fitted += cols_m_fitted
+                    output.write_fitted(
+                        res_i,
+                        fitted_vals[
+                            self.indptr[i] : self.indptr[i + 1],
+                            (cuts[i_model] + 1) : (cuts[i_model + 1] + 1),
+                        ],
+                    )
+        cols = [col for output in outputs for col in output.cols]
+        if fitted:
+            cols_fitted = [col for output in outputs for col in output.fitted_cols]
         result = {"forecasts": fcsts, "cols": cols, "times": times}
         if fitted:
             result["fitted"] = {"values": fitted_vals}
@@ -256,6 +406,7 @@ class GroupedArray(BaseGroupedArray):
         refit=True,
         verbose=False,
         target_col="y",
+        warm_start=False,
     ):
         # output of size: (ts, window, h)
         if (test_size - h) % step_size:
@@ -275,7 +426,7 @@ class GroupedArray(BaseGroupedArray):
             )
             fitted_idxs = np.full((self.data.shape[0], n_windows), False, dtype=bool)
             last_fitted_idxs = np.full_like(fitted_idxs, False, dtype=bool)
-        matches = ["mean", "lo", "hi"]
+        outputs = [None] * n_models
         steps = list(range(-test_size, -h + 1, step_size))
         for i_ts, grp in enumerate(self):
             iterable = tqdm(
@@ -309,15 +460,16 @@ class GroupedArray(BaseGroupedArray):
                     last_fitted_idxs[
                         self.indptr[i_ts] : self.indptr[i_ts + 1], i_window
                     ][cutoff - 1] = True
-                cols = [target_col]
                 for i_model, model in enumerate(models):
                     has_level = has_level_models[i_model]
                     kwargs = {}
                     if has_level:
                         kwargs["level"] = level
                     # this is implemented like this because not all models have a forward method
-                    # so we can't do fit + forward
-                    if refit is True:
+                    # so we can't do fit + forward. the models that are warm started are always
+                    # fitted and kept, so that the next window starts from them
+                    use_warm_start = warm_start and hasattr(model, "warm_start")
+                    if refit is True and not use_warm_start:
                         forecast_kwargs = dict(
                             h=h,
                             y=y_train,
@@ -334,8 +486,15 @@ class GroupedArray(BaseGroupedArray):
                             res_i = fallback_model.forecast(**forecast_kwargs)
                     else:
                         if should_fit:
+                            previous = fitted_models[i_model]
+                            if use_warm_start and type(previous) is type(model):
+                                model_to_fit = previous.warm_start()
+                            else:
+                                model_to_fit = model
                             try:
-                                fitted_models[i_model] = model.fit(y=y_train, X=X_train)
+                                fitted_models[i_model] = model_to_fit.fit(
+                                    y=y_train, X=X_train
+                                )
                             except Exception as error:
                                 if fallback_model is None:
                                     raise error
@@ -350,26 +509,24 @@ class GroupedArray(BaseGroupedArray):
                             fitted=fitted,
                             **kwargs,
                         )
-                    cols_m = [
-                        key
-                        for key in res_i.keys()
-                        if any(key.startswith(m) for m in matches)
-                    ]
-                    fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                    cols_m = [
-                        f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                        for col in cols_m
-                    ]
-                    out[
-                        i_ts, i_window, :, (1 + cuts[i_model]) : (1 + cuts[i_model + 1])
-                    ] = fcsts_i
+                    if outputs[i_model] is None:
+                        outputs[i_model] = _ModelOutput(repr(model), res_i)
+                    outputs[i_model].write(
+                        res_i,
+                        out[
+                            i_ts,
+                            i_window,
+                            :,
+                            (1 + cuts[i_model]) : (1 + cuts[i_model + 1]),
+                        ],
+                    )
                     if fitted:
                         fitted_vals[
                             self.indptr[i_ts] : self.indptr[i_ts + 1],
                             i_window,
                             i_model + 1,
                         ][(cutoff - in_size_disp) : cutoff] = res_i["fitted"]
-                    cols += cols_m
+        cols = [target_col] + [col for output in outputs for col in output.cols]
         result = {"forecasts": out.reshape(-1, 1 + cuts[-1]), "cols": cols}
         if fitted:
             result["fitted"] = {
@@ -384,12 +541,37 @@ class GroupedArray(BaseGroupedArray):
         data, indptr = super().take(idxs)
         return GroupedArray(data, indptr)
 
+    def take_range(self, start, end):
+        # contiguous block of series, data is a view of the original array
+        offset = self.indptr[start]
+        data = self.data[offset : self.indptr[end]]
+        indptr = self.indptr[start : end + 1] - offset
+        return GroupedArray(data, indptr)
+
     def split(self, n_chunks):
         n_chunks = min(n_chunks, self.n_groups)
         return [
             self.take(idxs) for idxs in np.array_split(range(self.n_groups), n_chunks)
         ]
 
+    def split_ranges(self, chunk_size):
+        starts = range(0, self.n_groups, chunk_size)
+        return [(start, min(start + chunk_size, self.n_groups)) for start in starts]
+
+    def split_ranges_by_cost(self, costs, n_chunks):
+        # contiguous blocks of series with roughly the same total cost
+        costs = np.asarray(costs)
+        if costs.size == 0:
+            return []
+        n_chunks = min(n_chunks, self.n_groups)
+        # cut where the middle of a serie crosses each target
+        cum_costs = np.cumsum(costs)
+        midpoints = cum_costs - 0.5 * costs
+        targets = cum_costs[-1] * np.arange(1, n_chunks) / n_chunks
+        cuts = np.searchsorted(midpoints, targets)
+        cuts = np.unique(np.hstack([0, cuts, self.n_groups]))
+        return list(zip(cuts[:-1].tolist(), cuts[1:].tolist()))
+
     def split_fm(self, fm, n_chunks):
         return [
             fm[idxs]
@@ -401,9 +583,13 @@ class GroupedArray(BaseGroupedArray):
         with threadpool_limits(limits=1):
             return self.fit(models=models, fallback_model=fallback_model)
 
-    def _single_threaded_predict(self, fm, h, X=None, level=tuple()):
+    def _single_threaded_update(self, fm, sizes, fallback_model=None):
+        with threadpool_limits(limits=1):
+            return self.update(fm=fm, sizes=sizes, fallback_model=fallback_model)
+
+    def _single_threaded_predict(self, fm, h, X=None, level=tuple(), out=None):
         with threadpool_limits(limits=1):
-            return self.predict(fm=fm, h=h, X=X, level=level)
+            return self.predict(fm=fm, h=h, X=X, level=level, out=out)
 
     def _single_threaded_fit_predict(self, models, h, X=None, level=tuple()):
         with threadpool_limits(limits=1):
@@ -419,6 +605,8 @@ class GroupedArray(BaseGroupedArray):
         level=tuple(),
         verbose=False,
         target_col="y",
+        out=None,
+        fitted_out=None,
     ):
         with threadpool_limits(limits=1):
             return self.forecast(
@@ -430,6 +618,8 @@ class GroupedArray(BaseGroupedArray):
                 level=level,
                 verbose=verbose,
                 target_col=target_col,
+                out=out,
+                fitted_out=fitted_out,
             )
 
     def _single_threaded_cross_validation(
@@ -445,6 +635,7 @@ class GroupedArray(BaseGroupedArray):
         refit=True,
         verbose=False,
         target_col="y",
+        warm_start=False,
     ):
         with threadpool_limits(limits=1):
             return self.cross_validation(
@@ -459,9 +650,10 @@ class GroupedArray(BaseGroupedArray):
                 refit=refit,
                 verbose=verbose,
                 target_col=target_col,
+                warm_start=warm_start,
             )
 
-# %% ../nbs/src/core/core.ipynb 24
+# %% ../nbs/src/core/core.ipynb 28
 def _get_n_jobs(n_groups, n_jobs):
     if n_jobs == -1 or (n_jobs is None):
         actual_n_jobs = os.cpu_count()
@@ -469,7 +661,365 @@ def _get_n_jobs(n_groups, n_jobs):
         actual_n_jobs = n_jobs
     return min(n_groups, actual_n_jobs)
 
-# %% ../nbs/src/core/core.ipynb 27
+
+def _estimate_costs(sizes, models, times=None):
+    """Relative cost of forecasting each serie with `models`.
+
+    The cost of each model grows with the size of the serie according to its
+    `cost_exponent`. If `times` (seconds per model) are available they're used
+    to weight the models, otherwise all models are assumed equally expensive."""
+    sizes = np.asarray(sizes, dtype=np.float64)
+    costs = np.zeros_like(sizes)
+    for model in models:
+        model_costs = sizes ** getattr(model, "cost_exponent", 1.0)
+        if times is not None and repr(model) in times:
+            model_costs *= times[repr(model)] / max(model_costs.sum(), 1e-12)
+        costs += model_costs
+    if costs.sum() == 0:
+        costs = sizes
+    return costs
+
+
+def _warm_worker():
+    # import the models once per worker process instead of on the first task
+    import statsforecast.models  # noqa: F401
+
+# %% ../nbs/src/core/core.ipynb 29
+class _SharedArrays:
+    """Numpy arrays placed in shared memory.
+
+    Pickling only sends the name, shape and dtype of each array, so workers
+    attach to the same buffers instead of receiving copies. Arrays memory-mapped
+    from a file aren't copied, the workers map the same file."""
+
+    def __init__(self, **arrays):
+        self._shms = []
+        self.specs = {}
+        self.files = {}
+        for key, arr in arrays.items():
+            if isinstance(arr, np.memmap) and isinstance(arr.base, mmap.mmap):
+                order = (
+                    "F"
+                    if arr.flags.f_contiguous and not arr.flags.c_contiguous
+                    else "C"
+                )
+                self.files[key] = (
+                    arr.filename,
+                    arr.offset,
+                    arr.shape,
+                    arr.dtype.str,
+                    order,
+                )
+            else:
+                self._create(key, arr.shape, arr.dtype)[:] = arr
+
+    def _create(self, key, shape, dtype):
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        shm = SharedMemory(create=True, size=max(nbytes, 1))
+        self._shms.append(shm)
+        self.specs[key] = (shm.name, shape, dtype.str)
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    def add_empty(self, key, shape, dtype):
+        # no references to the buffer are kept, so it can be unlinked later
+        self._create(key, shape, dtype)
+
+    def to_numpy(self, key):
+        with self.attach() as arrays:
+            return arrays[key].copy()
+
+    def __getstate__(self):
+        return {"specs": self.specs, "files": self.files}
+
+    def __setstate__(self, state):
+        self.specs = state["specs"]
+        self.files = state["files"]
+        self._shms = []
+
+    @contextmanager
+    def attach(self):
+        shms = {}
+        arrays = {}
+        try:
+            for key, (name, shape, dtype) in self.specs.items():
+                shms[key] = SharedMemory(name=name)
+                arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shms[key].buf)
+            for key, (filename, offset, shape, dtype, order) in self.files.items():
+                arrays[key] = np.memmap(
+                    filename,
+                    dtype=dtype,
+                    mode="r",
+                    offset=offset,
+                    shape=shape,
+                    order=order,
+                )
+            yield arrays
+        finally:
+            # the views must be released before closing the buffers
+            arrays.clear()
+            for shm in shms.values():
+                shm.close()
+
+    def unlink(self):
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._shms = []
+
+
+class _LocalArrays:
+    """Same interface as `_SharedArrays` for workers that run in this process (threads),
+    which read and write the arrays directly."""
+
+    def __init__(self, **arrays):
+        self.arrays = arrays
+
+    def add_empty(self, key, shape, dtype):
+        self.arrays[key] = np.empty(shape, dtype=dtype)
+
+    def to_numpy(self, key):
+        return self.arrays[key]
+
+    @contextmanager
+    def attach(self):
+        yield self.arrays
+
+    def unlink(self):
+        self.arrays = {}
+
+
+def _forecast_shared(shared, start, end, h, **forecast_kwargs):
+    with shared.attach() as arrays:
+        ga = GroupedArray(arrays["data"], arrays["indptr"])
+        if "X_data" in arrays:
+            X = GroupedArray(arrays["X_data"], arrays["X_indptr"]).take_range(
+                start, end
+            )
+        else:
+            X = None
+        fitted_out = None
+        if "fitted" in arrays:
+            fitted_out = arrays["fitted"][ga.indptr[start] : ga.indptr[end]]
+        # the forecasts are written straight into the shared buffers
+        res = ga.take_range(start, end)._single_threaded_forecast(
+            h=h,
+            X=X,
+            out=arrays["forecasts"][start * h : end * h],
+            fitted_out=fitted_out,
+            **forecast_kwargs,
+        )
+        res.pop("forecasts")
+        if "fitted" in res:
+            res["fitted"] = res["fitted"]["cols"]
+        del ga, X, fitted_out
+    return res
+
+
+def _cross_validation_shared(shared, start, end, **cv_kwargs):
+    with shared.attach() as arrays:
+        ga = GroupedArray(arrays["data"], arrays["indptr"])
+        res = ga.take_range(start, end)._single_threaded_cross_validation(**cv_kwargs)
+        n_rows = res["forecasts"].shape[0] // (end - start)
+        arrays["forecasts"][start * n_rows : end * n_rows] = res["forecasts"]
+        if "fitted" in res:
+            fitted_idxs = slice(ga.indptr[start], ga.indptr[end])
+            for key in ["values", "idxs", "last_idxs"]:
+                arrays[f"fitted_{key}"][fitted_idxs] = res["fitted"][key]
+            res["fitted"] = res["fitted"]["cols"]
+        del ga
+    res.pop("forecasts")
+    return res
+
+# %% ../nbs/src/core/core.ipynb 35
+def _iter_source(source):
+    # a path is read fragment by fragment to keep the order of the rows
+    if isinstance(source, (str, Path)):
+        import pyarrow.dataset as ds
+
+        for fragment in ds.dataset(source, format="parquet").get_fragments():
+            for batch in fragment.to_batches():
+                yield batch.to_pandas()
+    else:
+        yield from source
+
+
+def _batches_by_id(source, batch_size, id_col):
+    """Regroups the frames of `source`, which must have the rows of each serie together,
+    into frames of `batch_size` complete series."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+    frames = []
+    n_series = 0
+    last_id = None
+    for frame in _iter_source(source):
+        ids = np.asarray(frame[id_col])
+        if not ids.size:
+            continue
+        is_start = np.empty(ids.size, dtype=bool)
+        is_start[0] = not frames or ids[0] != last_id
+        is_start[1:] = ids[1:] != ids[:-1]
+        starts = np.flatnonzero(is_start)
+        offset = 0
+        while n_series + starts.size > batch_size:
+            cut = starts[batch_size - n_series]
+            frames.append(ufp.take_rows(frame, np.arange(offset, cut)))
+            yield ufp.vertical_concat(frames, match_categories=False)
+            frames = []
+            n_series = 0
+            offset = cut
+            starts = starts[starts >= cut]
+        frames.append(ufp.take_rows(frame, np.arange(offset, ids.size)))
+        n_series += starts.size
+        last_id = ids[-1]
+    if frames:
+        yield ufp.vertical_concat(frames, match_categories=False)
+
+# %% ../nbs/src/core/core.ipynb 37
+def save_panel(
+    df: DataFrame,
+    path: Union[str, Path],
+    id_col: str = "unique_id",
+    time_col: str = "ds",
+    target_col: str = "y",
+    dtype: Union[str, np.dtype] = "float64",
+) -> None:
+    """Save a processed panel as a directory of numpy arrays.
+
+    The directory can be passed as `df` to the `fit`, `forecast` and `cross_validation`
+    methods of `StatsForecast`, which memory-map the arrays instead of processing the
+    DataFrame again, so the startup time is almost zero and the worker processes
+    share the data through the OS page cache.
+
+    Parameters
+    ----------
+    df : pandas or polars DataFrame
+        DataFrame with ids, times, targets and exogenous.
+    path : str or pathlib.Path
+        Directory where the arrays are saved. It's created if it doesn't exist.
+    id_col : str (default='unique_id')
+        Column that identifies each serie.
+    time_col : str (default='ds')
+        Column that identifies each timestep, its values can be timestamps or integers.
+    target_col : str (default='y')
+        Column that contains the target.
+    dtype : str or numpy.dtype (default='float64')
+        Floating type used to store the series and the exogenous features.
+        It should match the `dtype` of the `StatsForecast` that reads the panel.
+    """
+    df = ensure_time_dtype(df, time_col)
+    uids, last_times, data, indptr, sort_idxs = ufp.process_df(
+        df, id_col, time_col, target_col
+    )
+    times = df[time_col].to_numpy()
+    if sort_idxs is not None:
+        times = times[sort_idxs]
+    uids = np.asarray(uids)
+    if uids.dtype == object:
+        uids = uids.astype(str)
+    exog = [c for c in df.columns if c not in (id_col, time_col, target_col)]
+    frame = "polars" if isinstance(df, pl_DataFrame) else "pandas"
+    arrays = {
+        "data": data.astype(dtype, copy=False),
+        "indptr": indptr,
+        "uids": uids,
+        "last_dates": last_times,
+        "times": times,
+        "exog": np.array(exog, dtype=str),
+        "meta": np.array([id_col, time_col, target_col, frame]),
+    }
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    for name, arr in arrays.items():
+        np.save(path / f"{name}.npy", arr, allow_pickle=False)
+
+
+def _load_panel(path):
+    path = Path(path)
+    # the big arrays are memory-mapped, the rest are small
+    panel = {
+        name: np.load(path / f"{name}.npy", mmap_mode="r") for name in ["data", "times"]
+    }
+    for name in ["indptr", "uids", "last_dates", "exog", "meta"]:
+        panel[name] = np.load(path / f"{name}.npy")
+    return panel
+
+# %% ../nbs/src/core/core.ipynb 38
+_warmed_up: Set[Tuple[type, np.dtype]] = set()
+
+
+def _warmup_serie(model, n_series=2):
+    season_length = np.max(np.atleast_1d(getattr(model, "season_length", 1)))
+    n = 3 * int(season_length) + 20
+    rng = np.random.default_rng(0)
+    t = np.arange(n)
+    y = (
+        10
+        + 0.1 * t
+        + np.sin(2 * np.pi * t / max(season_length, 2))
+        + rng.uniform(size=n)
+    )
+    indptr = np.arange(0, (n_series + 1) * n, n, dtype=np.int32)
+    return np.tile(y, n_series), indptr
+
+
+def warmup(
+    models: List[Any],
+    dtypes: Iterable[Union[str, np.dtype]] = ("float32", "float64"),
+) -> None:
+    """Compile the numba functions used by `models` ahead of time.
+
+    Numba compiles each function the first time it's called with a new combination
+    of argument types. This fits and forecasts each model on a small synthetic serie
+    of every floating type in `dtypes`, going through the same methods as
+    `StatsForecast` (`forecast`, `fit` + `predict`, `predict_in_sample` and
+    `forecast_batch`), with and without prediction intervals.
+    The processes backend calls it before starting the workers, so the compiled
+    functions are inherited by the forked processes (or loaded from the cache
+    when `NIXTLA_NUMBA_CACHE` is set) instead of being compiled by every worker.
+    Each model class is compiled once per floating type.
+
+    Parameters
+    ----------
+    models : List[Any]
+        Instantiated models, e.g. the `models` of a `StatsForecast` object.
+    dtypes : iterable of str or numpy.dtype (default=('float32', 'float64'))
+        Floating types of the series.
+    """
+    h = 2
+    for model in models:
+        y, indptr = _warmup_serie(model)
+        for dtype in dtypes:
+            key = (type(model), np.dtype(dtype))
+            if key in _warmed_up:
+                continue
+            y_dtype = y.astype(dtype)
+            y_serie = y_dtype[indptr[0] : indptr[1]]
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                for level in ([], [80]):
+                    kwargs = {"level": level} if level else {}
+                    # the models that can't fit this serie are compiled as far as they get
+                    try:
+                        model.new().forecast(y=y_serie, h=h, fitted=True, **kwargs)
+                    except Exception:
+                        pass
+                    try:
+                        fitted_model = model.new().fit(y=y_serie)
+                        fitted_model.predict(h=h, **kwargs)
+                        fitted_model.predict_in_sample(**kwargs)
+                    except Exception:
+                        pass
+                    if hasattr(model, "forecast_batch"):
+                        try:
+                            model.forecast_batch(
+                                y=y_dtype, indptr=indptr, h=h, fitted=True, **kwargs
+                            )
+                        except Exception:
+                            pass
+            _warmed_up.add(key)
+
+# %% ../nbs/src/core/core.ipynb 39
 def _warn_df_constructor():
     warnings.warn(
         "The `df` argument of the StatsForecast constructor as well as reusing stored "
@@ -497,15 +1047,29 @@ def _warn_id_as_idx():
     )
 
 
+def _maybe_warn_threads(models):
+    if NOGIL:
+        holding = [repr(m) for m in models if not getattr(m, "releases_gil", False)]
+    else:
+        holding = [repr(m) for m in models]
+    if holding:
+        warnings.warn(
+            f"The following models hold the GIL and won't run in parallel with the threads backend: {holding}. "
+            "Set the `NIXTLA_NUMBA_RELEASE_GIL` environment variable before importing statsforecast "
+            "and use models with `releases_gil=True`, or use the processes backend.",
+        )
+
+
 def _id_as_idx() -> bool:
     return not bool(os.getenv("NIXTLA_ID_AS_COL", ""))
 
-# %% ../nbs/src/core/core.ipynb 28
+# %% ../nbs/src/core/core.ipynb 40
 _param_descriptions = {
     "freq": """freq : str or int
             Frequency of the data. Must be a valid pandas or polars offset alias, or an integer.""",
-    "df": """df : pandas or polars DataFrame, optional (default=None)
-            DataFrame with ids, times, targets and exogenous.""",
+    "df": """df : pandas or polars DataFrame, str or pathlib.Path, optional (default=None)
+            DataFrame with ids, times, targets and exogenous,
+            or directory with a panel saved by `save_panel`.""",
     "sort_df": """sort_df : bool (default=True)
             Sort `df` by ids and times.""",
     "fallback_model": """fallback_model : Any, optional (default=None)
@@ -532,6 +1096,27 @@ _param_descriptions = {
             Number of jobs used in the parallel processing, use -1 for all cores.""",
     "verbose": """verbose : bool (default=True)
             Prints TQDM progress bar when `n_jobs=1`.""",
+    "chunk_size": """chunk_size : int, optional (default=None)
+            Number of series sent to each worker per task in `forecast` when `n_jobs > 1`.
+            If None, each series is submitted as a separate task.""",
+    "shared_memory": """shared_memory : bool (default=False)
+            Place the series in shared memory when `n_jobs > 1`, so that workers read them without copies
+            and write their results to a shared output array. Used by `forecast` and `cross_validation`.""",
+    "scheduling": """scheduling : str (default='static')
+            How the series are distributed among the workers when `n_jobs > 1`.
+            'static' sends blocks with the same number of series.
+            'cost' sends contiguous blocks with a similar estimated cost, based on the size of the series,
+            the `cost_exponent` of each model and the times of the last `forecast` call, if any.
+            More blocks than workers are created so that the pool balances the remaining work.""",
+    "backend": """backend : str (default='processes')
+            Workers used when `n_jobs > 1`. 'processes' uses a pool of processes.
+            'threads' uses a pool of threads that read the series and write the results in place, without copies.
+            Threads only run in parallel for models that release the GIL (`releases_gil=True`), which requires
+            setting the `NIXTLA_NUMBA_RELEASE_GIL` environment variable before importing statsforecast.""",
+    "dtype": """dtype : str or numpy.dtype (default='float64')
+            Floating type used to store the series and the exogenous features, either 'float32' or 'float64'.
+            'float32' halves their memory. The forecasts and fitted values are always stored as float32,
+            and the models that estimate their parameters by optimization compute in float64 internally.""",
     "models": """models : List[Any]
             List of instantiated objects models.StatsForecast.""",
     "n_windows": """n_windows : int (default=1)
@@ -545,9 +1130,17 @@ _param_descriptions = {
     "refit": """refit : bool or int (default=True)
             Wether or not refit the model for each window.
             If int, train the models every `refit` windows.""",
+    "warm_start": """warm_start : bool (default=False)
+            Start the fit of the models that support it (`ARIMA` and `AutoARIMA`) from the model
+            fitted in the previous window of the same serie instead of from scratch.
+            `AutoARIMA` keeps the order selected in the first window and only searches it again
+            if it can't be fitted. These models are applied to each window with `forward`.
+            The optimizer converges to the optimum of the likelihood closest to the previous
+            coefficients, so when it has several local optima (e.g. with overparametrized orders)
+            the coefficients and forecasts can differ from the ones of a fit from scratch.""",
 }
 
-# %% ../nbs/src/core/core.ipynb 29
+# %% ../nbs/src/core/core.ipynb 41
 class _StatsForecast:
     """The `StatsForecast` class allows you to efficiently fit multiple `StatsForecast` models
     for large sets of time series. It operates on a DataFrame `df` with at least three columns
@@ -570,6 +1163,11 @@ class _StatsForecast:
         sort_df: bool = True,
         fallback_model: Optional[Any] = None,
         verbose: bool = False,
+        chunk_size: Optional[int] = None,
+        shared_memory: bool = False,
+        scheduling: str = "static",
+        backend: str = "processes",
+        dtype: Union[str, np.dtype] = "float64",
     ):
         """Train statistical models.
 
@@ -582,6 +1180,11 @@ class _StatsForecast:
         {sort_df}
         {fallback_model}
         {verbose}
+        {chunk_size}
+        {shared_memory}
+        {scheduling}
+        {backend}
+        {dtype}
         """
         # TODO @fede: needed for residuals, think about it later
         self.models = models
@@ -590,6 +1193,21 @@ class _StatsForecast:
         self.n_jobs = n_jobs
         self.fallback_model = fallback_model
         self.verbose = verbose
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        self.chunk_size = chunk_size
+        self.shared_memory = shared_memory
+        if scheduling not in ("static", "cost"):
+            raise ValueError("`scheduling` must be either 'static' or 'cost'.")
+        self.scheduling = scheduling
+        if backend not in ("processes", "threads"):
+            raise ValueError("`backend` must be either 'processes' or 'threads'.")
+        self.backend = backend
+        if backend == "threads" and n_jobs != 1:
+            _maybe_warn_threads(models)
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("`dtype` must be either 'float32' or 'float64'.")
         if df is not None:
             _warn_df_constructor()
             self._prepare_fit(df=df, sort_df=sort_df)
@@ -620,6 +1238,11 @@ class _StatsForecast:
                 raise ValueError("You must provide the `df` argument.")
             _warn_df_constructor()
             return
+        if isinstance(df, (str, Path)):
+            self._prepare_fit_panel(
+                df, id_col=id_col, time_col=time_col, target_col=target_col
+            )
+            return
         df = ensure_time_dtype(df, time_col)
         validate_freq(df[time_col], self.freq)
         if isinstance(df, pd.DataFrame) and df.index.name == id_col:
@@ -637,10 +1260,11 @@ class _StatsForecast:
             self.last_dates = pd.Index(last_times, name=time_col)
         else:
             self.last_dates = pl_Series(last_times)
-        self.ga = GroupedArray(data, indptr)
-        self.og_dates = df[time_col].to_numpy()
+        self.ga = GroupedArray(data.astype(self.dtype, copy=False), indptr)
+        times = df[time_col].to_numpy()
         if sort_idxs is not None:
-            self.og_dates = self.og_dates[sort_idxs]
+            times = times[sort_idxs]
+        self._dates = GroupedArray(times, indptr)
         self.n_jobs = _get_n_jobs(len(self.ga), self.n_jobs)
         self.df_constructor = type(df)
         self.id_col = id_col
@@ -648,6 +1272,40 @@ class _StatsForecast:
         self.target_col = target_col
         self._exog = [c for c in df.columns if c not in (id_col, time_col, target_col)]
 
+    def _prepare_fit_panel(
+        self,
+        path: Union[str, Path],
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+    ) -> None:
+        panel = _load_panel(path)
+        saved_cols = panel["meta"][:3].tolist()
+        if saved_cols != [id_col, time_col, target_col]:
+            raise ValueError(
+                f"The panel was saved with id_col, time_col and target_col {saved_cols}, "
+                f"but got {[id_col, time_col, target_col]}."
+            )
+        if panel["meta"][3] == "polars":
+            self.uids = pl_Series(id_col, panel["uids"])
+            self.last_dates = pl_Series(panel["last_dates"])
+            self.df_constructor = pl_DataFrame
+        else:
+            self.uids = pd.Series(panel["uids"], name=id_col)
+            self.last_dates = pd.Index(panel["last_dates"], name=time_col)
+            self.df_constructor = pd.DataFrame
+        validate_freq(self.last_dates, self.freq)
+        # the memory map is kept if the panel was saved with the same dtype
+        self.ga = GroupedArray(
+            panel["data"].astype(self.dtype, copy=False), panel["indptr"]
+        )
+        self._dates = GroupedArray(panel["times"], panel["indptr"])
+        self.n_jobs = _get_n_jobs(len(self.ga), self.n_jobs)
+        self.id_col = id_col
+        self.time_col = time_col
+        self.target_col = target_col
+        self._exog = panel["exog"].tolist()
+
     def _validate_sizes_for_prediction_intervals(
         self,
         prediction_intervals: Optional[ConformalIntervals],
@@ -727,6 +1385,84 @@ class _StatsForecast:
 
     fit.__doc__ = fit.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
+    def update(self, df: DataFrame):
+        """Update the fitted models with new observations.
+
+        Appends the observations in `df` to the stored series and runs them through
+        the fitted models without estimating their parameters again.
+        `AutoARIMA`, `ARIMA`, `AutoETS`, `AutoCES` and `AutoTheta` advance their states
+        by the new observations, the rest of the models are fitted again on each serie,
+        in parallel if `n_jobs` > 1.
+        The series are stored with room for new observations, so appending them only
+        copies the new values. The stored series and the fitted models are left as they
+        were if a model can't be updated.
+        `AutoTheta` keeps the seasonal indices and the trend of the static models estimated
+        in `fit`, so its forecasts can differ from the ones of a fit on the whole series.
+
+        Parameters
+        ----------
+        df : pandas or polars DataFrame
+            DataFrame with ids, times, targets and exogenous of the new observations,
+            with the same columns used in `fit`. It can contain only some of the series,
+            and the observations of each serie must start right after its last date.
+
+        Returns
+        -------
+        self : StatsForecast
+            Returns with the updated `StatsForecast` fitted `models`.
+        """
+        if not hasattr(self, "fitted_"):
+            raise ValueError("You must call the fit method before calling update.")
+        df = ensure_time_dtype(df, self.time_col)
+        validate_freq(df[self.time_col], self.freq)
+        uids, _, data, indptr, sort_idxs = ufp.process_df(
+            df, self.id_col, self.time_col, self.target_col
+        )
+        if data.shape[1] != len(self._exog) + 1:
+            raise ValueError(
+                f"Expected the exogenous features {self._exog}, "
+                f"but got {data.shape[1] - 1} exogenous features."
+            )
+        times = df[self.time_col].to_numpy()
+        if sort_idxs is not None:
+            times = times[sort_idxs]
+        uids = np.asarray(uids)
+        pos = pd.Index(np.asarray(self.uids)).get_indexer(uids)
+        if (pos == -1).any():
+            raise ValueError(
+                f"The following series weren't seen during fit: {reprlib.repr(uids[pos == -1].tolist())}"
+            )
+        expected_starts = ufp.offset_times(self.last_dates[pos], freq=self.freq, n=1)
+        if (np.asarray(expected_starts) != times[indptr[:-1]]).any():
+            raise ValueError(
+                "The new observations of each serie must start right after its last date."
+            )
+        last_times = self.last_dates.to_numpy().copy()
+        last_times[pos] = times[indptr[1:] - 1]
+        # new observations in the order of the stored series
+        order = np.argsort(pos)
+        data = GroupedArray(data, indptr).take(order).data
+        times = GroupedArray(times, indptr).take(order).data
+        sizes = np.zeros(len(self.ga), dtype=self.ga.indptr.dtype)
+        sizes[pos] = np.diff(indptr)
+        ga = self.ga.extend(sizes, data.astype(self.dtype, copy=False))
+        dates = self._dates.extend(sizes, times)
+        if self.n_jobs == 1 or all(hasattr(model, "update") for model in self.models):
+            fitted = ga.update(
+                self.fitted_.copy(), sizes, fallback_model=self.fallback_model
+            )
+        else:
+            fitted = self._update_parallel(ga, sizes)
+        # keep the new observations only if all the models were updated
+        self.ga = ga
+        self._dates = dates
+        if self.df_constructor is pl_DataFrame:
+            self.last_dates = pl_Series(last_times)
+        else:
+            self.last_dates = pd.Index(last_times, name=self.time_col)
+        self.fitted_ = fitted
+        return self
+
     def _make_future_df(self, h: int):
         start_dates = ufp.offset_times(self.last_dates, freq=self.freq, n=1)
         dates = ufp.time_ranges(start_dates, freq=self.freq, periods=h)
@@ -753,7 +1489,7 @@ class _StatsForecast:
                 f"Expected X to have shape {expected_shape}, but got {X.shape}"
             )
         _, _, data, indptr, _ = ufp.process_df(X, self.id_col, self.time_col, None)
-        return GroupedArray(data, indptr), level
+        return GroupedArray(data.astype(self.dtype, copy=False), indptr), level
 
     def _validate_exog(self, X_df: Optional[DataFrame] = None) -> None:
         if not any(m.uses_exog for m in self.models) or not self._exog:
@@ -963,6 +1699,73 @@ class _StatsForecast:
 
     forecast.__doc__ = forecast.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
+    def forecast_iter(
+        self,
+        h: int,
+        source: Union[Iterable[DataFrame], str, Path],
+        batch_size: int = 10_000,
+        X_df: Optional[DataFrame] = None,
+        level: Optional[List[int]] = None,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+    ) -> Iterator[DataFrame]:
+        """Memory Efficient predictions over data that doesn't fit in memory.
+
+        The series are read from `source` and forecasted in batches of `batch_size` series,
+        so the memory used is proportional to the size of the batch instead of the whole panel.
+
+        Parameters
+        ----------
+        {h}
+        source : iterable of pandas or polars DataFrame, str or pathlib.Path
+            DataFrames with columns [`unique_id`, `ds`, `y`] and exogenous variables,
+            where the rows of each serie are contiguous, or path to a parquet dataset with that layout.
+            A serie can span several DataFrames.
+        batch_size : int (default=10_000)
+            Number of series to forecast at a time.
+        {X_df}
+        {level}
+        {sort_df}
+        {prediction_intervals}
+        {id_col}
+        {time_col}
+        {target_col}
+
+        Returns
+        -------
+        fcsts_iter : iterator of pandas or polars DataFrame
+            DataFrames with `models` columns for point predictions and probabilistic
+            predictions for the series of each batch.
+        """
+        times: DefaultDict[str, float] = defaultdict(float)
+        for df in _batches_by_id(source, batch_size, id_col):
+            if X_df is None:
+                X_batch = None
+            else:
+                X_batch = ufp.filter_with_mask(
+                    X_df, ufp.is_in(X_df[id_col], df[id_col].unique())
+                )
+            fcsts_df = self.forecast(
+                h=h,
+                df=df,
+                X_df=X_batch,
+                level=level,
+                sort_df=sort_df,
+                prediction_intervals=prediction_intervals,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+            for model_name, model_time in self.forecast_times_.items():
+                times[model_name] += model_time
+            self.forecast_times_ = dict(times)
+            yield fcsts_df
+
+    forecast_iter.__doc__ = forecast_iter.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
+
     def forecast_fitted_values(self):
         """Access insample predictions.
 
@@ -983,7 +1786,7 @@ class _StatsForecast:
         df = self.df_constructor(
             {
                 self.id_col: ufp.repeat(self.uids, np.diff(self.ga.indptr)),
-                self.time_col: self.og_dates,
+                self.time_col: self._dates.data,
             }
         )
         df[cols] = self.fcst_fitted_values_["values"]
@@ -1011,6 +1814,7 @@ class _StatsForecast:
         id_col: str = "unique_id",
         time_col: str = "ds",
         target_col: str = "y",
+        warm_start: bool = False,
     ) -> DataFrame:
         """Temporal Cross-Validation.
 
@@ -1038,6 +1842,7 @@ class _StatsForecast:
         {id_col}
         {time_col}
         {target_col}
+        {warm_start}
 
         Returns
         -------
@@ -1066,6 +1871,14 @@ class _StatsForecast:
                 raise ValueError(
                     "Can only use integer refit or refit=False with a fallback model that implements the forward method."
                 )
+        if (
+            warm_start
+            and self.fallback_model is not None
+            and not hasattr(self.fallback_model, "forward")
+        ):
+            raise ValueError(
+                "Can only use warm_start with a fallback model that implements the forward method."
+            )
         self.__dict__.pop("cv_fitted_values_", None)
         self._prepare_fit(
             df=df,
@@ -1100,6 +1913,7 @@ class _StatsForecast:
                 verbose=self.verbose,
                 refit=refit,
                 target_col=target_col,
+                warm_start=warm_start,
             )
         else:
             res_fcsts = self._cross_validation_parallel(
@@ -1111,12 +1925,13 @@ class _StatsForecast:
                 level=level,
                 refit=refit,
                 target_col=target_col,
+                warm_start=warm_start,
             )
         if fitted:
             self.cv_fitted_values_ = res_fcsts["fitted"]
             self.n_cv_ = n_windows
         fcsts_df = ufp.cv_times(
-            times=self.og_dates,
+            times=self._dates.data,
             uids=self.uids,
             indptr=self.ga.indptr,
             h=h,
@@ -1157,7 +1972,7 @@ class _StatsForecast:
         train_uids = ufp.repeat(self.uids, np.diff(self.ga.indptr))
         cv_uids = ufp.vertical_concat([train_uids for _ in range(self.n_cv_)])
         used_uids = ufp.take_rows(cv_uids, idxs)
-        dates = np.tile(self.og_dates, self.n_cv_)[idxs]
+        dates = np.tile(self._dates.data, self.n_cv_)[idxs]
         cutoffs_mask = self.cv_fitted_values_["last_idxs"].flatten(order="F")[idxs]
         cutoffs_sizes = np.diff(np.append(0, np.where(cutoffs_mask)[0] + 1))
         cutoffs = np.repeat(dates[cutoffs_mask], cutoffs_sizes)
@@ -1183,26 +1998,118 @@ class _StatsForecast:
                 df = df.reset_index(drop=True)
         return df
 
-    def _get_pool(self):
-        from multiprocessing import Pool
+    def __enter__(self):
+        self._keep_pool = True
+        return self
 
-        pool_kwargs = dict()
-        return Pool, pool_kwargs
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool kept alive by the context manager."""
+        pool = self.__dict__.pop("_pool", None)
+        if pool is not None:
+            pool.shutdown()
+        self._keep_pool = False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the worker pool can't be pickled and the copies don't own one
+        state.pop("_pool", None)
+        state["_keep_pool"] = False
+        return state
+
+    def _new_pool(self):
+        if self.backend == "threads":
+            return ThreadPoolExecutor(self.n_jobs)
+        # compile the models once here instead of in every worker
+        models = (
+            self.models
+            if self.fallback_model is None
+            else [*self.models, self.fallback_model]
+        )
+        warmup(models, dtypes=(self.dtype,))
+        return ProcessPoolExecutor(self.n_jobs, initializer=_warm_worker)
+
+    @contextmanager
+    def _get_pool(self):
+        if self.backend == "threads":
+            # the limits are process wide, so they're set once for all the threads
+            limits = threadpool_limits(limits=1)
+        else:
+            limits = nullcontext()
+        with limits:
+            if not getattr(self, "_keep_pool", False):
+                with self._new_pool() as pool:
+                    yield pool
+            else:
+                if getattr(self, "_pool", None) is None:
+                    self._pool = self._new_pool()
+                # don't shut down the persistent pool when leaving the with block
+                yield self._pool
+
+    def _get_arrays(self, **arrays):
+        # threads write their results directly in the output arrays
+        if self.backend == "threads":
+            return _LocalArrays(**arrays)
+        return _SharedArrays(**arrays)
+
+    def _get_ranges(self, chunk_size=None):
+        n_series = self.ga.n_groups
+        if self.scheduling == "cost":
+            if chunk_size is None:
+                n_chunks = 4 * self.n_jobs
+            else:
+                n_chunks = math.ceil(n_series / chunk_size)
+            costs = _estimate_costs(
+                np.diff(self.ga.indptr),
+                self.models,
+                getattr(self, "forecast_times_", None),
+            )
+            return self.ga.split_ranges_by_cost(costs, n_chunks)
+        return self.ga.split_ranges(chunk_size or math.ceil(n_series / self.n_jobs))
 
     def _fit_parallel(self):
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        gas, _ = self._get_gas_Xs(X=None)
+        with self._get_pool() as executor:
             futures = []
             for ga in gas:
-                future = executor.apply_async(
-                    ga._single_threaded_fit, (self.models, self.fallback_model)
+                future = executor.submit(
+                    ga._single_threaded_fit,
+                    self.models,
+                    self.fallback_model,
                 )
                 futures.append(future)
-            fm = np.vstack([f.get() for f in futures])
+            fm = np.vstack([f.result() for f in futures])
+        return fm
+
+    def _update_parallel(self, ga, sizes):
+        # the models without update are fitted again on the whole series
+        ranges = ga.split_ranges(math.ceil(len(ga) / self.n_jobs))
+        with self._get_pool() as executor:
+            futures = []
+            for start, end in ranges:
+                future = executor.submit(
+                    ga.take_range(start, end)._single_threaded_update,
+                    self.fitted_[start:end].copy(),
+                    sizes[start:end],
+                    self.fallback_model,
+                )
+                futures.append(future)
+            fm = np.vstack([f.result() for f in futures])
         return fm
 
     def _get_gas_Xs(self, X):
+        if self.scheduling == "cost":
+            ranges = self._get_ranges()
+            gas = [self.ga.take_range(start, end) for start, end in ranges]
+            if X is not None:
+                Xs = [X.take_range(start, end) for start, end in ranges]
+            else:
+                from itertools import repeat
+
+                Xs = repeat(None)
+            return gas, Xs
         gas = self.ga.split(self.n_jobs)
         if X is not None:
             Xs = X.split(self.n_jobs)
@@ -1215,18 +2122,23 @@ class _StatsForecast:
     def _predict_parallel(self, h, X, level):
         # create elements for each core
         gas, Xs = self._get_gas_Xs(X=X)
-        fms = self.ga.split_fm(self.fitted_, self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        if self.scheduling == "cost":
+            fms = [self.fitted_[start:end] for start, end in self._get_ranges()]
+        else:
+            fms = self.ga.split_fm(self.fitted_, self.n_jobs)
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._get_pool() as executor:
             futures = []
             for ga, fm, X_ in zip(gas, fms, Xs):
-                future = executor.apply_async(
+                future = executor.submit(
                     ga._single_threaded_predict,
-                    (fm, h, X_, level),
+                    fm,
+                    h,
+                    X_,
+                    level,
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = [f.result() for f in futures]
             fcsts, cols = list(zip(*out))
             fcsts = np.vstack(fcsts)
             cols = cols[0]
@@ -1235,17 +2147,19 @@ class _StatsForecast:
     def _fit_predict_parallel(self, h, X, level):
         # create elements for each core
         gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._get_pool() as executor:
             futures = []
             for ga, X_ in zip(gas, Xs):
-                future = executor.apply_async(
+                future = executor.submit(
                     ga._single_threaded_fit_predict,
-                    (self.models, h, X_, level),
+                    self.models,
+                    h,
+                    X_,
+                    level,
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = [f.result() for f in futures]
             fm, fcsts, cols = list(zip(*out))
             fm = np.vstack(fm)
             fcsts = np.vstack(fcsts)
@@ -1284,7 +2198,117 @@ class _StatsForecast:
                         fitted_res[col_name] = v
         return forecast_res, fitted_res, times
 
+    def _forecast_parallel_chunks(self, h, fitted, X, level, target_col):
+        n_series = self.ga.n_groups
+        ranges = self._get_ranges(self.chunk_size)
+        cols: List[str] = []
+        cols_fitted: List[str] = []
+        fcsts = np.empty((n_series * h, 0), dtype=np.float32)
+        fitted_vals = np.empty((self.ga.data.shape[0], 0), dtype=np.float32)
+        future2range = {}
+        times = {repr(m): 0.0 for m in self.models}
+        with self._get_pool() as executor:
+            for start, end in ranges:
+                X_ = X.take_range(start, end) if X is not None else None
+                future = executor.submit(
+                    self.ga.take_range(start, end)._single_threaded_forecast,
+                    models=self.models,
+                    h=h,
+                    fallback_model=self.fallback_model,
+                    fitted=fitted,
+                    X=X_,
+                    level=level,
+                    target_col=target_col,
+                )
+                future2range[future] = (start, end)
+            pbar = tqdm(disable=not self.verbose, total=n_series, desc="Forecast")
+            for future in as_completed(future2range):
+                start, end = future2range[future]
+                res = future.result()
+                if not cols:
+                    cols = res["cols"]
+                    fcsts = np.empty((n_series * h, len(cols)), dtype=np.float32)
+                fcsts[start * h : end * h] = res["forecasts"]
+                if fitted:
+                    if not cols_fitted:
+                        cols_fitted = res["fitted"]["cols"]
+                        fitted_vals = np.empty(
+                            (self.ga.data.shape[0], len(cols_fitted)), dtype=np.float32
+                        )
+                    fitted_idxs = slice(self.ga.indptr[start], self.ga.indptr[end])
+                    fitted_vals[fitted_idxs] = res["fitted"]["values"]
+                for model_name, model_time in res["times"].items():
+                    times[model_name] += model_time
+                pbar.update(end - start)
+            pbar.close()
+        result = {"cols": cols, "forecasts": fcsts, "times": times}
+        if fitted:
+            result["fitted"] = {"cols": cols_fitted, "values": fitted_vals}
+        return result
+
+    def _forecast_parallel_shared(self, h, fitted, X, level, target_col):
+        n_series = self.ga.n_groups
+        cuts, _ = self.ga._get_cols(
+            models=self.models, attr="forecast", h=h, X=X, level=level
+        )
+        arrays = {"data": self.ga.data, "indptr": self.ga.indptr}
+        if X is not None:
+            arrays.update(X_data=X.data, X_indptr=X.indptr)
+        shared = self._get_arrays(**arrays)
+        try:
+            shared.add_empty("forecasts", (n_series * h, cuts[-1]), np.float32)
+            if fitted:
+                shared.add_empty(
+                    "fitted", (self.ga.data.shape[0], 1 + cuts[-1]), np.float32
+                )
+            future2range = {}
+            times = {repr(m): 0.0 for m in self.models}
+            with self._get_pool() as executor:
+                for start, end in self._get_ranges(self.chunk_size):
+                    future = executor.submit(
+                        _forecast_shared,
+                        shared,
+                        start,
+                        end,
+                        h=h,
+                        models=self.models,
+                        fallback_model=self.fallback_model,
+                        fitted=fitted,
+                        level=level,
+                        target_col=target_col,
+                    )
+                    future2range[future] = (start, end)
+                pbar = tqdm(disable=not self.verbose, total=n_series, desc="Forecast")
+                for future in as_completed(future2range):
+                    start, end = future2range[future]
+                    res = future.result()
+                    for model_name, model_time in res["times"].items():
+                        times[model_name] += model_time
+                    pbar.update(end - start)
+                pbar.close()
+            result = {
+                "cols": res["cols"],
+                "forecasts": shared.to_numpy("forecasts"),
+                "times": times,
+            }
+            if fitted:
+                result["fitted"] = {
+                    "cols": res["fitted"],
+                    "values": shared.to_numpy("fitted"),
+                }
+        finally:
+            shared.unlink()
+        return result
+
     def _forecast_parallel(self, h, fitted, X, level, target_col):
+        if self.shared_memory or self.backend == "threads":
+            return self._forecast_parallel_shared(
+                h=h, fitted=fitted, X=X, level=level, target_col=target_col
+            )
+        if self.chunk_size is not None or self.scheduling == "cost":
+            return self._forecast_parallel_chunks(
+                h=h, fitted=fitted, X=X, level=level, target_col=target_col
+            )
         n_series = self.ga.n_groups
         forecast_res = defaultdict(lambda: np.empty(n_series * h, dtype=np.float32))
         fitted_res = defaultdict(
@@ -1293,7 +2317,7 @@ class _StatsForecast:
         fitted_res[target_col] = self.ga.data[:, 0]
         future2pos = {}
         times = {repr(m): 0.0 for m in self.models}
-        with ProcessPoolExecutor(self.n_jobs) as executor:
+        with self._get_pool() as executor:
             for i, serie in enumerate(self.ga):
                 y_train = serie[:, 0]
                 X_train = serie[:, 1:] if serie.shape[1] > 1 else None
@@ -1338,21 +2362,45 @@ class _StatsForecast:
             "times": times,
         }
 
-    def _cross_validation_parallel(
-        self, h, test_size, step_size, input_size, fitted, level, refit, target_col
+    def _cross_validation_parallel_shared(
+        self,
+        h,
+        test_size,
+        step_size,
+        input_size,
+        fitted,
+        level,
+        refit,
+        target_col,
+        warm_start=False,
     ):
-        # create elements for each core
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
-        # compute parallel forecasts
-        result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga in gas:
-                future = executor.apply_async(
-                    ga._single_threaded_cross_validation,
-                    tuple(),
-                    dict(
+        n_series = self.ga.n_groups
+        n_windows = int((test_size - h) / step_size) + 1
+        cuts, _ = self.ga._get_cols(
+            models=self.models, attr="forecast", h=h, X=None, level=level
+        )
+        shared = self._get_arrays(data=self.ga.data, indptr=self.ga.indptr)
+        try:
+            shared.add_empty(
+                "forecasts", (n_series * n_windows * h, 1 + cuts[-1]), np.float32
+            )
+            if fitted:
+                n_rows = self.ga.data.shape[0]
+                shared.add_empty(
+                    "fitted_values",
+                    (n_rows, n_windows, len(self.models) + 1),
+                    np.float32,
+                )
+                shared.add_empty("fitted_idxs", (n_rows, n_windows), bool)
+                shared.add_empty("fitted_last_idxs", (n_rows, n_windows), bool)
+            with self._get_pool() as executor:
+                futures = []
+                for start, end in self._get_ranges():
+                    future = executor.submit(
+                        _cross_validation_shared,
+                        shared,
+                        start,
+                        end,
                         models=self.models,
                         h=h,
                         test_size=test_size,
@@ -1364,10 +2412,72 @@ class _StatsForecast:
                         refit=refit,
                         verbose=self.verbose,
                         target_col=target_col,
-                    ),
+                        warm_start=warm_start,
+                    )
+                    futures.append(future)
+                out = [f.result() for f in futures]
+            result = {
+                "forecasts": shared.to_numpy("forecasts"),
+                "cols": out[0]["cols"],
+            }
+            if fitted:
+                result["fitted"] = {
+                    key: shared.to_numpy(f"fitted_{key}")
+                    for key in ["values", "idxs", "last_idxs"]
+                }
+                result["fitted"]["cols"] = out[0]["fitted"]
+        finally:
+            shared.unlink()
+        return result
+
+    def _cross_validation_parallel(
+        self,
+        h,
+        test_size,
+        step_size,
+        input_size,
+        fitted,
+        level,
+        refit,
+        target_col,
+        warm_start=False,
+    ):
+        if self.shared_memory or self.backend == "threads":
+            return self._cross_validation_parallel_shared(
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                fitted=fitted,
+                level=level,
+                refit=refit,
+                target_col=target_col,
+                warm_start=warm_start,
+            )
+        # create elements for each core
+        gas, _ = self._get_gas_Xs(X=None)
+        # compute parallel forecasts
+        result = {}
+        with self._get_pool() as executor:
+            futures = []
+            for ga in gas:
+                future = executor.submit(
+                    ga._single_threaded_cross_validation,
+                    models=self.models,
+                    h=h,
+                    test_size=test_size,
+                    fallback_model=self.fallback_model,
+                    step_size=step_size,
+                    input_size=input_size,
+                    fitted=fitted,
+                    level=level,
+                    refit=refit,
+                    verbose=self.verbose,
+                    target_col=target_col,
+                    warm_start=warm_start,
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = [f.result() for f in futures]
             fcsts = [d["forecasts"] for d in out]
             fcsts = np.vstack(fcsts)
             cols = out[0]["cols"]
@@ -1579,7 +2689,7 @@ class _StatsForecast:
 
 _StatsForecast.plot.__doc__ = _StatsForecast.plot.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
-# %% ../nbs/src/core/core.ipynb 30
+# %% ../nbs/src/core/core.ipynb 42
 class ParallelBackend:
     def forecast(
         self,
@@ -1633,6 +2743,7 @@ class ParallelBackend:
         id_col,
         time_col,
         target_col,
+        warm_start=False,
     ) -> Any:
         model = _StatsForecast(
             models=models,
@@ -1653,6 +2764,7 @@ class ParallelBackend:
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
+            warm_start=warm_start,
         )
 
 
@@ -1660,7 +2772,7 @@ class ParallelBackend:
 def make_backend(obj: Any, *args: Any, **kwargs: Any) -> ParallelBackend:
     return ParallelBackend()
 
-# %% ../nbs/src/core/core.ipynb 31
+# %% ../nbs/src/core/core.ipynb 43
 class StatsForecast(_StatsForecast):
     def forecast(
         self,
@@ -1733,6 +2845,7 @@ class StatsForecast(_StatsForecast):
         id_col: str = "unique_id",
         time_col: str = "ds",
         target_col: str = "y",
+        warm_start: bool = False,
     ):
         if self._is_native(df=df):
             return super().cross_validation(
@@ -1750,6 +2863,7 @@ class StatsForecast(_StatsForecast):
                 id_col=id_col,
                 time_col=time_col,
                 target_col=target_col,
+                warm_start=warm_start,
             )
         assert df is not None
         engine = make_execution_engine(infer_by=[df])
@@ -1771,10 +2885,11 @@ class StatsForecast(_StatsForecast):
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
+            warm_start=warm_start,
         )
 
     def _is_native(self, df) -> bool:
         engine = try_get_context_execution_engine()
         return engine is None and (
-            df is None or isinstance(df, pd.DataFrame) or isinstance(df, pl_DataFrame)
+            df is None or isinstance(df, (pd.DataFrame, pl_DataFrame, str, Path))
         )
@@ -429,6 +429,7 @@ class FugueBackend(ParallelBackend):
         id_col,
         time_col,
         target_col,
+        warm_start=False,
     ) -> pd.DataFrame:
         model = _StatsForecast(
             models=models,
@@ -450,6 +451,7 @@ class FugueBackend(ParallelBackend):
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
+            warm_start=warm_start,
         )
         if _id_as_idx():
             result = result.reset_index()
@@ -474,6 +476,7 @@ class FugueBackend(ParallelBackend):
         id_col: str,
         time_col: str,
         target_col: str,
+        warm_start: bool = False,
     ) -> Any:
         """Temporal Cross-Validation with core.StatsForecast and FugueBackend.
 
@@ -504,6 +507,7 @@ class FugueBackend(ParallelBackend):
         {id_col}
         {time_col}
         {target_col}
+        {warm_start}
 
         Returns
         -------
@@ -544,6 +548,7 @@ class FugueBackend(ParallelBackend):
                 id_col=id_col,
                 time_col=time_col,
                 target_col=target_col,
+                warm_start=warm_start,
             ),
             schema=schema,
             partition={"by": id_col},
@@ -11,9 +11,8 @@ from typing import Tuple
 import numpy as np
 from numba import njit
 from numba.typed import List
-from statsmodels.tsa.seasonal import seasonal_decompose
 
-from .utils import _calculate_intervals, CACHE, NOGIL
+from .utils import _quantiles, CACHE, NOGIL
 
 # %% ../nbs/src/ets.ipynb 5
 # Global variables
@@ -295,9 +294,10 @@ def initparam(
     return {"alpha": alpha, "beta": beta, "gamma": gamma, "phi": phi}
 
 # %% ../nbs/src/ets.ipynb 15
+@njit(nogil=NOGIL, cache=CACHE)
 def admissible(alpha: float, beta: float, gamma: float, phi: float, m: int):
     if np.isnan(phi):
-        phi = 1
+        phi = 1.0
     if phi < 0.0 or phi > 1 + 1e-8:
         return False
     if np.isnan(gamma):
@@ -308,7 +308,7 @@ def admissible(alpha: float, beta: float, gamma: float, phi: float, m: int):
                 return False
     elif m > 1:  # seasonal model
         if np.isnan(beta):
-            beta = 0
+            beta = 0.0
         if gamma < max(1 - 1 / phi - alpha, 0) or gamma > 1 + 1 / phi - alpha:
             return False
         if alpha < 1 - 1 / phi - gamma * (1 - m + phi + phi * m) / (2 * phi * m):
@@ -320,9 +320,10 @@ def admissible(alpha: float, beta: float, gamma: float, phi: float, m: int):
         P[:2] = np.array(
             [phi * (1 - alpha - gamma), alpha + beta - alpha * phi + gamma - 1]
         )
-        P[2 : (m - 2 + 2)] = np.repeat(alpha + beta - alpha * phi, m - 2)
+        P[2 : (m - 2 + 2)] = alpha + beta - alpha * phi
         P[(m - 2 + 2) :] = np.array([alpha + beta - phi, 1])
-        roots = np.polynomial.polynomial.polyroots(P)
+        # np.roots takes the coefficients from the highest degree
+        roots = np.roots(P[::-1].astype(np.complex128))
         zeror = np.real(roots)
         zeroi = np.imag(roots)
         max_ = np.max(np.sqrt(zeror * zeror + zeroi * zeroi))
@@ -332,6 +333,7 @@ def admissible(alpha: float, beta: float, gamma: float, phi: float, m: int):
     return True
 
 # %% ../nbs/src/ets.ipynb 16
+@njit(nogil=NOGIL, cache=CACHE)
 def check_param(
     alpha: float,
     beta: float,
@@ -424,6 +426,9 @@ def initstate(y, m, trendtype, seasontype):
                 y_d = dict(seasonal=y / (coefs[0] + coefs[1] * X_fourier[:, 1]))
         else:
             # n is large enough to do a decomposition
+            # statsmodels is slow to import, so it's only loaded when needed
+            from statsmodels.tsa.seasonal import seasonal_decompose
+
             y_d = seasonal_decompose(
                 y, period=m, model="additive" if seasontype == "A" else "multiplicative"
             )
@@ -502,7 +507,7 @@ def pegelsresid_C(
 ):
     n = len(y)
     p = len(init_state)
-    x = np.full(p * (n + 1), fill_value=np.nan)
+    x = np.full(p * (n + 1), fill_value=np.nan, dtype=y.dtype)
     x[:p] = init_state
     e = np.full_like(y, fill_value=np.nan)
     if not damped:
@@ -713,7 +718,7 @@ def ets_target_fn(
     # size of state
     p = p_nstate + (1 if p_seasontype != 0 else 0)
     n = len(p_y)
-    state = np.zeros(p * (n + 1))
+    state = np.zeros(p * (n + 1), dtype=p_y.dtype)
     state[:p_nstate] = par[-p_nstate:]
     # Add extra state
     if p_seasontype != 0:
@@ -725,7 +730,7 @@ def ets_target_fn(
         if p_seasontype == 2 and state[start:].min() < 0:
             return np.inf
     amse = np.zeros(30)
-    e = np.zeros(n)
+    e = np.zeros(n, dtype=p_y.dtype)
     lik = etscalc(
         # we dont need to change these param
         p_y,
@@ -776,6 +781,7 @@ def ets_target_fn(
     return objval
 
 # %% ../nbs/src/ets.ipynb 29
+@njit(nogil=NOGIL, cache=CACHE)
 def optimize_ets_target_fn(
     x0,
     par,
@@ -792,8 +798,6 @@ def optimize_ets_target_fn(
     nmse,
     bounds,
     m,
-    pnames,
-    pnames2,
 ):
     alpha = par_noopt["alpha"] if np.isnan(par["alpha"]) else par["alpha"]
     if np.isnan(alpha):
@@ -884,7 +888,11 @@ def optimize_ets_target_fn(
     return res
 
 # %% ../nbs/src/ets.ipynb 30
-def etsmodel(
+etsfit = namedtuple("etsfit", "ok fit par amse e states lik n_params aic bic aicc")
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def etsmodel_fit(
     y: np.ndarray,
     m: int,
     errortype: str,
@@ -900,10 +908,7 @@ def etsmodel(
     opt_crit: str,
     nmse: int,
     bounds: str,
-    maxit: int = 2_000,
-    control=None,
-    seed=None,
-    trace: bool = False,
+    init_state: np.ndarray,
 ):
     if seasontype == "N":
         m = 1
@@ -916,7 +921,7 @@ def etsmodel(
     par_ = initparam(
         alpha, beta, gamma, phi, trendtype, seasontype, damped, lower, upper, m, bounds
     )
-    par_noopt = dict(alpha=alpha, beta=beta, gamma=gamma, phi=phi)
+    par_noopt = {"alpha": alpha, "beta": beta, "gamma": gamma, "phi": phi}
 
     if not np.isnan(par_["alpha"]):
         alpha = par_["alpha"]
@@ -928,34 +933,32 @@ def etsmodel(
         phi = par_["phi"]
     if not check_param(alpha, beta, gamma, phi, lower, upper, bounds, m):
         raise Exception("Parameters out of range")
-    # initialize state
-    init_state = initstate(y, m, trendtype, seasontype)
     nstate = len(init_state)
-    par_ = {key: val for key, val in par_.items() if not np.isnan(val)}
-    par = np.full(len(par_) + nstate, fill_value=np.nan)
-    par[: len(par_)] = list(par_.values())
-    par[len(par_) :] = init_state
+    # the parameters that aren't nan are optimized along with the initial states
+    smooth = np.array([par_["alpha"], par_["beta"], par_["gamma"], par_["phi"]])
+    keep = ~np.isnan(smooth)
+    npar = keep.sum()
+    par = np.full(npar + nstate, fill_value=np.nan)
+    par[:npar] = smooth[keep]
+    par[npar:] = init_state
     lower_ = np.full_like(par, fill_value=-np.inf)
     upper_ = np.full_like(par, fill_value=np.inf)
-    j = 0
-    for i, pr in enumerate(["alpha", "beta", "gamma", "phi"]):
-        if pr in par_.keys():
-            lower_[j] = lower[i]
-            upper_[j] = upper[i]
-            j += 1
-    lower = lower_
-    upper = upper_
+    lower_[:npar] = lower[keep]
+    upper_[:npar] = upper[keep]
     np_ = len(par)
     if np_ >= len(y) - 1:
-        return dict(
-            aic=np.inf,
-            bic=np.inf,
-            aicc=np.inf,
-            mse=np.inf,
-            amse=np.inf,
-            fit=None,
-            par=par,
-            states=init_state,
+        return etsfit(
+            False,
+            results(par, np.inf, 0, np.empty((0, np_))),
+            par,
+            np.empty(0),
+            np.empty(0, dtype=y.dtype),
+            np.empty((0, nstate), dtype=y.dtype),
+            np.inf,
+            np_,
+            np.inf,
+            np.inf,
+            np.inf,
         )
 
     fred = optimize_ets_target_fn(
@@ -968,24 +971,20 @@ def etsmodel(
         seasontype=seasontype,
         damped=damped,
         par_noopt=par_noopt,
-        lowerb=lower,
-        upperb=upper,
+        lowerb=lower_,
+        upperb=upper_,
         opt_crit=opt_crit,
         nmse=nmse,
         bounds=bounds,
         m=m,
-        pnames=par_.keys(),
-        pnames2=par_noopt.keys(),
     )
     fit_par = fred.x
-    init_state = fit_par[-nstate:]
+    fit_state = fit_par[-nstate:]
     if seasontype != "N":
-        init_state = np.hstack(
-            [
-                init_state,
-                m * (seasontype == "M")
-                - init_state[(1 + (trendtype != "N")) : nstate].sum(),
-            ]
+        fit_state = np.append(
+            fit_state,
+            m * (seasontype == "M")
+            - fit_state[(1 + (trendtype != "N")) : nstate].sum(),
         )
     j = 0
     if not np.isnan(fit_par[j]):
@@ -1006,7 +1005,7 @@ def etsmodel(
     amse, e, states, lik = pegelsresid_C(
         y,
         m,
-        init_state,
+        fit_state,
         errortype,
         trendtype,
         seasontype,
@@ -1025,11 +1024,38 @@ def etsmodel(
         aicc = aic + 2 * np_ * (np_ + 1) / (ny - np_ - 1)
     else:
         aicc = np.inf
+    fit_par = np.append(np.array([alpha, beta, gamma, phi]), fit_state)
+    return etsfit(True, fred, fit_par, amse, e, states, lik, np_, aic, bic, aicc)
 
-    mse = amse[0]
-    amse = np.mean(amse)
 
-    fit_par = np.concatenate([[alpha, beta, gamma, phi], init_state])
+def etsmodel_result(
+    y: np.ndarray,
+    m: int,
+    errortype: str,
+    trendtype: str,
+    seasontype: str,
+    damped: bool,
+    init_state: np.ndarray,
+    efit: etsfit,
+):
+    if seasontype == "N":
+        m = 1
+    if not efit.ok:
+        return dict(
+            aic=np.inf,
+            bic=np.inf,
+            aicc=np.inf,
+            mse=np.inf,
+            amse=np.inf,
+            fit=None,
+            par=efit.par,
+            states=init_state,
+        )
+    e = efit.e
+    np_ = efit.n_params
+    ny = len(y)
+    mse = efit.amse[0]
+    amse = np.mean(efit.amse)
     if errortype == "A":
         fits = y - e
     else:
@@ -1038,30 +1064,136 @@ def etsmodel(
     sigma2 = np.sum(e**2) / (ny - np_ - 1)
 
     return dict(
-        loglik=-0.5 * lik,
-        aic=aic,
-        bic=bic,
-        aicc=aicc,
+        loglik=-0.5 * efit.lik,
+        aic=efit.aic,
+        bic=efit.bic,
+        aicc=efit.aicc,
         mse=mse,
         amse=amse,
-        fit=fred,
+        fit=efit.fit,
         residuals=e,
         components=f"{errortype}{trendtype}{seasontype}{'D' if damped else 'N'}",
         m=m,
-        nstate=nstate,
+        nstate=len(init_state),
         fitted=fits,
-        states=states,
-        par=fit_par,
+        states=efit.states,
+        par=efit.par,
         sigma2=sigma2,
         n_params=np_,
     )
 
+
+def etsmodel(
+    y: np.ndarray,
+    m: int,
+    errortype: str,
+    trendtype: str,
+    seasontype: str,
+    damped: bool,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    phi: float,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    opt_crit: str,
+    nmse: int,
+    bounds: str,
+    maxit: int = 2_000,
+    control=None,
+    seed=None,
+    trace: bool = False,
+):
+    if seasontype == "N":
+        m = 1
+    # initialize state
+    init_state = initstate(y, m, trendtype, seasontype)
+    efit = etsmodel_fit(
+        y,
+        m,
+        errortype,
+        trendtype,
+        seasontype,
+        damped,
+        alpha,
+        beta,
+        gamma,
+        phi,
+        lower,
+        upper,
+        opt_crit,
+        nmse,
+        bounds,
+        init_state,
+    )
+    return etsmodel_result(
+        y, m, errortype, trendtype, seasontype, damped, init_state, efit
+    )
+
 # %% ../nbs/src/ets.ipynb 32
 @njit(nogil=NOGIL, cache=CACHE)
 def is_constant(x):
     return np.all(x[0] == x)
 
 # %% ../nbs/src/ets.ipynb 34
+@njit(nogil=NOGIL, cache=CACHE)
+def ets_search(
+    y,
+    m,
+    candidates,
+    init_states,
+    alpha,
+    beta,
+    gamma,
+    phi,
+    lower,
+    upper,
+    opt_crit,
+    nmse,
+    bounds,
+    ic,
+):
+    # fits the candidates in order and returns the index and the fit of the one
+    # with the lowest information criterion, or -1 if none could be fitted.
+    # each row of candidates has the error, trend and season types
+    # (0: N, 1: A, 2: M) and the damping of a model
+    best_idx = -1
+    best_ic = np.inf
+    best_fit = None
+    for i in range(candidates.shape[0]):
+        etype, ttype, stype, damped = candidates[i]
+        fit = etsmodel_fit(
+            y,
+            m,
+            "NAM"[etype],
+            "NAM"[ttype],
+            "NAM"[stype],
+            damped == 1,
+            alpha,
+            beta,
+            gamma,
+            phi,
+            lower,
+            upper,
+            opt_crit,
+            nmse,
+            bounds,
+            init_states[i],
+        )
+        if ic == "aic":
+            fit_ic = fit.aic
+        elif ic == "bic":
+            fit_ic = fit.bic
+        else:
+            fit_ic = fit.aicc
+        if not np.isnan(fit_ic):
+            if fit_ic < best_ic:
+                best_idx = i
+                best_ic = fit_ic
+                best_fit = fit
+    return best_idx, best_fit
+
+# %% ../nbs/src/ets.ipynb 36
 def ets_f(
     y,
     m,
@@ -1251,7 +1383,7 @@ def ets_f(
         damped = [True, False]
     else:
         damped = [damped]
-    best_ic = np.inf
+    candidates = []
     for etype in errortype:
         for ttype in trendtype:
             for stype in seasontype:
@@ -1274,39 +1406,47 @@ def ets_f(
                         continue
                     if stype != "N" and m == 1:
                         continue
-                    fit = etsmodel(
-                        y,
-                        m,
-                        etype,
-                        ttype,
-                        stype,
-                        dtype,
-                        alpha,
-                        beta,
-                        gamma,
-                        phi,
-                        lower=lower,
-                        upper=upper,
-                        opt_crit=opt_crit,
-                        nmse=nmse,
-                        bounds=bounds,
-                        maxit=maxit,
-                    )
-                    fit_ic = fit[ic]
-                    if not np.isnan(fit_ic):
-                        if fit_ic < best_ic:
-                            model = fit
-                            best_ic = fit_ic
-                            best_e = etype
-                            best_t = ttype
-                            best_s = stype
-                            best_d = dtype
-    if np.isinf(best_ic):
+                    candidates.append((etype, ttype, stype, dtype))
+    if not candidates:
+        raise Exception("no model able to be fitted")
+    # the initial states only depend on the trend and season types,
+    # the candidates are fitted in a single compiled call
+    init_states = {}
+    for _, ttype, stype, _ in candidates:
+        if (ttype, stype) not in init_states:
+            init_states[ttype, stype] = initstate(
+                y, m if stype != "N" else 1, ttype, stype
+            ).astype(np.float64)
+    codes = {"N": 0, "A": 1, "M": 2}
+    best_idx, efit = ets_search(
+        y,
+        m,
+        np.array(
+            [[codes[e], codes[t], codes[s], d] for e, t, s, d in candidates],
+            dtype=np.int64,
+        ),
+        List([init_states[t, s] for _, t, s, _ in candidates]),
+        alpha,
+        beta,
+        gamma,
+        phi,
+        lower,
+        upper,
+        opt_crit,
+        nmse,
+        bounds,
+        ic,
+    )
+    if best_idx < 0:
         raise Exception("no model able to be fitted")
+    best_e, best_t, best_s, best_d = candidates[best_idx]
+    model = etsmodel_result(
+        y, m, best_e, best_t, best_s, best_d, init_states[best_t, best_s], efit
+    )
     model["method"] = f"ETS({best_e},{best_t}{'d' if best_d else ''},{best_s})"
     return model
 
-# %% ../nbs/src/ets.ipynb 35
+# %% ../nbs/src/ets.ipynb 37
 def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     forecast = np.full(h, fill_value=np.nan)
     states = obj["states"][-1, :]
@@ -1316,8 +1456,8 @@ def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     etsforecast(x=states, m=m, trend=ttype, season=stype, phi=phi, h=h, f=forecast)
     return forecast
 
-# %% ../nbs/src/ets.ipynb 36
-# @njit(nogil=NOGIL, cache=CACHE)
+# %% ../nbs/src/ets.ipynb 38
+@njit(nogil=NOGIL, cache=CACHE)
 def _compute_sigmah(pf, h, sigma, cvals):
 
     theta = np.full(h, np.nan)
@@ -1336,131 +1476,85 @@ def _compute_sigmah(pf, h, sigma, cvals):
 
     return sigmah
 
-# %% ../nbs/src/ets.ipynb 37
+# %% ../nbs/src/ets.ipynb 39
+@njit(nogil=NOGIL, cache=CACHE)
 def _class3models(
-    h,
-    sigma,
-    last_state,
-    season_length,
-    error,
-    trend,
-    seasonality,
-    damped,
-    alpha,
-    beta,
-    gamma,
-    phi,
+    h, sigma, last_state, season_length, trend, damped, alpha, beta, gamma, phi
 ):
 
-    if damped == "N":
-        damped_val = False
-    else:
-        damped_val = True
-
     p = len(last_state)
 
-    if trend != "N":
-        H1 = np.array([[1, 1]])
-    else:
-        H1 = np.array([[1]])
-
-    H2 = np.concatenate((np.zeros(season_length - 1), np.array([1]))).reshape(
-        1, season_length
-    )
-
-    if trend == "N":
-        F1 = 1
-        G1 = alpha
-    else:
-        f1 = 1
-        if damped_val:
-            f1 = phi
-        F1 = np.array([[1, 1], [0, f1]])
+    if trend != NONE:
+        H1 = np.ones((1, 2))
+        f1 = phi if damped else 1.0
+        F1 = np.array([[1.0, 1.0], [0.0, f1]])
         G1 = np.array([[alpha, alpha], [beta, beta]])
-
-    f2_top = np.concatenate((np.zeros(season_length - 1), np.array([1]))).reshape(
-        1, season_length
-    )
-    f2_bottom = np.c_[
-        (
-            np.identity(season_length - 1),
-            np.zeros(season_length - 1).reshape(season_length - 1, 1),
-        )
-    ]
-    F2 = np.r_[f2_top, f2_bottom]
-
+    else:
+        H1 = np.ones((1, 1))
+        F1 = np.ones((1, 1))
+        G1 = np.full((1, 1), alpha)
+
+    H2 = np.zeros((1, season_length))
+    H2[0, season_length - 1] = 1.0
+    F2 = np.zeros((season_length, season_length))
+    F2[0, season_length - 1] = 1.0
+    for i in range(1, season_length):
+        F2[i, i - 1] = 1.0
     G2 = np.zeros((season_length, season_length))
     G2[0, season_length - 1] = gamma
-    Mh = np.matmul(
-        last_state[0 : (p - season_length)].reshape(
-            last_state[0 : (p - season_length)].shape[0], 1
-        ),
-        last_state[(p - season_length) : p].reshape(1, season_length),
+
+    Mh = np.outer(
+        last_state[0 : (p - season_length)], last_state[(p - season_length) : p]
     )
-    Vh = np.zeros((Mh.shape[0] * Mh.shape[1], Mh.shape[0] * Mh.shape[1]))
+    vecMh = Mh.flatten()
+    Mh2 = np.outer(vecMh, vecMh)
+    Vh = np.zeros((vecMh.size, vecMh.size))
     H21 = np.kron(H2, H1)
     F21 = np.kron(F2, F1)
     G21 = np.kron(G2, G1)
     K = np.kron(G2, F1) + np.kron(F2, G1)
-    mu = np.zeros(h)
+    H21t = np.ascontiguousarray(H21.T)
+    F21t = np.ascontiguousarray(F21.T)
+    G21t = np.ascontiguousarray(G21.T)
+    Kt = np.ascontiguousarray(K.T)
+    mu = (H1 @ (Mh @ np.ascontiguousarray(H2.T)))[0, 0]
     var = np.zeros(h)
 
     for i in range(0, h):
-        mu[i] = np.matmul(H1, np.matmul(Mh, np.transpose(H2)))
-        var[i] = (1 + sigma) * np.matmul(
-            H21, np.matmul(Vh, np.transpose(H21))
-        ) + sigma * mu[i] ** 2
-        vecMh = Mh.flatten()
-        exp1 = np.matmul(F21, np.matmul(Vh, np.transpose(F21)))
-        exp2 = np.matmul(F21, np.matmul(Vh, np.transpose(G21)))
-        exp3 = np.matmul(G21, np.matmul(Vh, np.transpose(F21)))
-        exp4 = np.matmul(
-            K,
-            np.matmul(Vh + (vecMh * vecMh.reshape(vecMh.shape[0], 1)), np.transpose(K)),
-        )
-        exp5 = np.matmul(
-            sigma * G21,
-            np.matmul(
-                3 * Vh + 2 * vecMh * vecMh.reshape(vecMh.shape[0], 1), np.transpose(G21)
-            ),
-        )
+        var[i] = (1 + sigma) * (H21 @ (Vh @ H21t))[0, 0] + sigma * mu**2
+        exp1 = F21 @ (Vh @ F21t)
+        exp2 = F21 @ (Vh @ G21t)
+        exp3 = G21 @ (Vh @ F21t)
+        exp4 = K @ ((Vh + Mh2) @ Kt)
+        exp5 = (sigma * G21) @ ((3 * Vh + 2 * Mh2) @ G21t)
         Vh = exp1 + sigma * (exp2 + exp3 + exp4 + exp5)
 
-    if trend == "N":
-        Mh = (
-            F1 * np.matmul(Mh, np.transpose(F2))
-            + G1 * np.matmul(Mh, np.transpose(G2)) * sigma
-        )
-    else:
-        Mh = (
-            np.matmul(F1, np.matmul(Mh, np.transpose(F2)))
-            + np.matmul(G1, np.matmul(Mh, np.transpose(G2))) * sigma
-        )
-
     return var
 
-# %% ../nbs/src/ets.ipynb 38
-def _compute_pred_intervals(model, forecasts, h, level):
-    sigma = model["sigma2"]
-    season_length = model["m"]
-    pf = forecasts["mean"]
-
-    model_type = model["components"]
-    steps = steps = np.arange(1, h + 1)
+# %% ../nbs/src/ets.ipynb 40
+@njit(nogil=NOGIL, cache=CACHE)
+def _ets_pred_intervals(
+    out,
+    pf,
+    z,
+    sigma,
+    last_state,
+    season_length,
+    error,
+    trend,
+    seasonality,
+    damped,
+    alpha,
+    beta,
+    gamma,
+    phi,
+):
+    # writes the lower bounds of the levels of z in the first rows of out
+    # and the upper bounds in the next ones. returns False for the models
+    # without closed form variances (classes 4 and 5)
+    h = pf.size
+    steps = np.arange(1, h + 1).astype(np.float64)
     hm = np.floor((h - 1) / season_length)
-    last_state = model["states"][-1]
-
-    # error, trend, and seasonality type
-    error = model_type[0]
-    trend = model_type[1]
-    seasonality = model_type[2]
-    damped = model_type[3]
-
-    # parameters
-    alpha = model["par"][0]
-    beta = model["par"][1]
-    gamma = model["par"][2]
-    phi = model["par"][3]
 
     exp1 = alpha**2 + alpha * beta * steps + (1 / 6) * beta**2 * steps * (2 * steps - 1)
     exp2 = (beta * phi * steps) / (1 - phi) ** 2
@@ -1468,41 +1562,39 @@ def _compute_pred_intervals(model, forecasts, h, level):
     exp4 = (beta * phi * (1 - phi**steps)) / ((1 - phi) ** 2 * (1 - phi**2))
     exp5 = 2 * alpha * (1 - phi**2) + beta * phi * (1 + 2 * phi - phi**steps)
 
-    compute_intervals = True
+    dvals = np.zeros(h)
+    for k in range(1, h + 1):
+        if k % season_length == 0:
+            dvals[k - 1] = 1
+    sum_phi = np.zeros(h)
+    for k in range(1, h + 1):
+        for j in range(1, k + 1):
+            sum_phi[k - 1] += phi**j
+
     # Class 1 models
-    if error == "A" and trend == "N" and seasonality == "N" and damped == "N":
+    if error == ADD and trend == NONE and seasonality == NONE and not damped:
         # Model ANN
-        sigmah = 1 + alpha**2 * (steps - 1)
-        sigmah = sigma * sigmah
-
-    elif error == "A" and trend == "A" and seasonality == "N" and damped == "N":
+        sigmah = sigma * (1 + alpha**2 * (steps - 1))
+    elif error == ADD and trend == ADD and seasonality == NONE and not damped:
         # Model AAN
-        sigmah = 1 + (steps - 1) * exp1
-        sigmah = sigma * sigmah
-
-    elif error == "A" and trend == "A" and seasonality == "N" and damped == "D":
+        sigmah = sigma * (1 + (steps - 1) * exp1)
+    elif error == ADD and trend == ADD and seasonality == NONE and damped:
         # Model AAdN
-        sigmah = 1 + alpha**2 * (steps - 1) + exp2 * exp3 - exp4 * exp5
-        sigmah = sigma * sigmah
-
-    elif error == "A" and trend == "N" and seasonality == "A" and damped == "N":
+        sigmah = sigma * (1 + alpha**2 * (steps - 1) + exp2 * exp3 - exp4 * exp5)
+    elif error == ADD and trend == NONE and seasonality == ADD and not damped:
         # Model ANA
-        sigmah = 1 + alpha**2 * (steps - 1) + gamma * hm * (2 * alpha + gamma)
-        sigmah = sigma * sigmah
-
-    elif error == "A" and trend == "A" and seasonality == "A" and damped == "N":
+        sigmah = sigma * (1 + alpha**2 * (steps - 1) + gamma * hm * (2 * alpha + gamma))
+    elif error == ADD and trend == ADD and seasonality == ADD and not damped:
         # Model AAA
         exp6 = 2 * alpha + gamma + beta * season_length * (hm + 1)
-        sigmah = 1 + (steps - 1) * exp1 + gamma * hm * exp6
-        sigmah = sigma * sigmah
-
-    elif error == "A" and trend == "A" and seasonality == "A" and damped == "D":
+        sigmah = sigma * (1 + (steps - 1) * exp1 + gamma * hm * exp6)
+    elif error == ADD and trend == ADD and seasonality == ADD and damped:
         # Model AAdA
         exp7 = (2 * beta * gamma * phi) / ((1 - phi) * (1 - phi**season_length))
         exp8 = hm * (1 - phi**season_length) - phi**season_length * (
             1 - phi ** (season_length * hm)
         )
-        sigmah = (
+        sigmah = sigma * (
             1
             + alpha**2 * (steps - 1)
             + exp2 * exp3
@@ -1510,127 +1602,114 @@ def _compute_pred_intervals(model, forecasts, h, level):
             + gamma * hm * (2 * alpha + gamma)
             + exp7 * exp8
         )
-        sigmah = sigma * sigmah
-
     # Class 2 models
-    elif error == "M" and trend == "N" and seasonality == "N" and damped == "N":
+    elif error == MULT and trend == NONE and seasonality == NONE and not damped:
         # Model MNN
-        cvals = np.full(h, alpha)
-        sigmah = _compute_sigmah(pf, h, sigma, cvals)
-
-    elif error == "M" and trend == "A" and seasonality == "N" and damped == "N":
+        sigmah = _compute_sigmah(pf, h, sigma, np.full(h, alpha))
+    elif error == MULT and trend == ADD and seasonality == NONE and not damped:
         # Model MAN
-        cvals = alpha + beta * steps
-        sigmah = _compute_sigmah(pf, h, sigma, cvals)
-
-    elif error == "M" and trend == "A" and seasonality == "N" and damped == "D":
+        sigmah = _compute_sigmah(pf, h, sigma, alpha + beta * steps)
+    elif error == MULT and trend == ADD and seasonality == NONE and damped:
         # Model MAdN
-        cvals = np.full(h, np.nan)
-        for k in range(1, h + 1):
-            sum_phi = 0
-            for j in range(1, k + 1):
-                sum_phi = sum_phi + phi**j
-            cvals[k - 1] = alpha + beta * sum_phi
-        sigmah = _compute_sigmah(pf, h, sigma, cvals)
-
-    elif error == "M" and trend == "N" and seasonality == "A" and damped == "N":
+        sigmah = _compute_sigmah(pf, h, sigma, alpha + beta * sum_phi)
+    elif error == MULT and trend == NONE and seasonality == ADD and not damped:
         # Model MNA
-        dvals = np.zeros(h)
-        for k in range(1, h + 1):
-            val = k % season_length
-            if val == 0:
-                dvals[k - 1] = 1
-        cvals = alpha + gamma * dvals
-        sigmah = _compute_sigmah(pf, h, sigma, cvals)
-
-    elif error == "M" and trend == "A" and seasonality == "A" and damped == "N":
+        sigmah = _compute_sigmah(pf, h, sigma, alpha + gamma * dvals)
+    elif error == MULT and trend == ADD and seasonality == ADD and not damped:
         # Model MAA
-        dvals = np.zeros(h)
-        for k in range(1, h + 1):
-            val = k % season_length
-            if val == 0:
-                dvals[k - 1] = 1
-        cvals = alpha * beta * steps + gamma * dvals
-        sigmah = _compute_sigmah(pf, h, sigma, cvals)
-
-    elif error == "M" and trend == "A" and seasonality == "A" and damped == "D":
+        sigmah = _compute_sigmah(pf, h, sigma, alpha * beta * steps + gamma * dvals)
+    elif error == MULT and trend == ADD and seasonality == ADD and damped:
         # Model MAdA
-        dvals = np.zeros(h)
-        for k in range(1, h + 1):
-            val = k % season_length
-            if val == 0:
-                dvals[k - 1] = 1
-        cvals = np.full(h, np.nan)
-        for k in range(1, h + 1):
-            sum_phi = 0
-            for j in range(1, k + 1):
-                sum_phi = sum_phi + phi**j
-            cvals[k - 1] = alpha + beta * sum_phi + gamma * dvals[k - 1]
-        sigmah = _compute_sigmah(pf, h, sigma, cvals)
-
-    elif error == "M" and seasonality == "M":
+        sigmah = _compute_sigmah(pf, h, sigma, alpha + beta * sum_phi + gamma * dvals)
+    elif error == MULT and seasonality == MULT:
         # Class 3 models
         sigmah = _class3models(
-            h,
-            sigma,
+            h, sigma, last_state, season_length, trend, damped, alpha, beta, gamma, phi
+        )
+    else:
+        return False
+
+    n_levels = z.size
+    for k in range(h):
+        se = math.sqrt(sigmah[k])
+        for i in range(n_levels):
+            out[i, k] = pf[k] - z[i] * se
+            out[n_levels + i, k] = pf[k] + z[i] * se
+    return True
+
+# %% ../nbs/src/ets.ipynb 41
+def _compute_pred_intervals(model, forecasts, h, level):
+    sigma = model["sigma2"]
+    season_length = model["m"]
+    last_state = model["states"][-1]
+    error, trend, seasonality = [switch(comp) for comp in model["components"][:3]]
+    damped = model["components"][3] != "N"
+    alpha, beta, gamma, phi = model["par"][:4]
+
+    z = _quantiles(level)
+    out = np.empty((2 * z.size, h))
+    if _ets_pred_intervals(
+        out,
+        forecasts["mean"],
+        z,
+        sigma,
+        last_state,
+        season_length,
+        error,
+        trend,
+        seasonality,
+        damped,
+        alpha,
+        beta,
+        gamma,
+        phi,
+    ):
+        return {
+            **{f"lo-{lv}": out[i] for i, lv in enumerate(level)},
+            **{f"hi-{lv}": out[len(level) + i] for i, lv in enumerate(level)},
+        }
+
+    # Classes 4 and 5 models
+    np.random.seed(1)
+    nsim = 5000
+    y_path = np.zeros([nsim, h])
+
+    if math.isnan(beta):
+        beta = 0
+    if math.isnan(gamma):
+        gamma = 0
+    if math.isnan(phi):
+        phi = 0
+
+    for k in range(nsim):
+        e = np.random.normal(0, np.sqrt(sigma), h)
+        yhat = np.zeros(h)
+        etssimulate(
             last_state,
             season_length,
             error,
             trend,
             seasonality,
-            damped,
             alpha,
             beta,
             gamma,
             phi,
+            h,
+            yhat,
+            e,
         )
+        y_path[k,] = yhat
 
-    else:
-        # Classes 4 and 5 models
-        np.random.seed(1)
-        compute_intervals = False
-        nsim = 5000
-        y_path = np.zeros([nsim, h])
-
-        if math.isnan(beta):
-            beta = 0
-        if math.isnan(gamma):
-            gamma = 0
-        if math.isnan(phi):
-            phi = 0
-
-        for k in range(nsim):
-            e = np.random.normal(0, np.sqrt(sigma), h)
-            yhat = np.zeros(h)
-            etssimulate(
-                last_state,
-                season_length,
-                switch(error),
-                switch(trend),
-                switch(seasonality),
-                alpha,
-                beta,
-                gamma,
-                phi,
-                h,
-                yhat,
-                e,
-            )
-            y_path[k,] = yhat
-
-        lower = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=0)
-        upper = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=0)
-        pi = {
-            **{f"lo-{lv}": lower[i] for i, lv in enumerate(level)},
-            **{f"hi-{lv}": upper[i] for i, lv in enumerate(level)},
-        }
-
-    if compute_intervals:
-        pi = _calculate_intervals(forecasts, level=level, h=h, sigmah=np.sqrt(sigmah))
+    lower = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=0)
+    upper = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=0)
+    pi = {
+        **{f"lo-{lv}": lower[i] for i, lv in enumerate(level)},
+        **{f"hi-{lv}": upper[i] for i, lv in enumerate(level)},
+    }
 
     return pi
 
-# %% ../nbs/src/ets.ipynb 39
+# %% ../nbs/src/ets.ipynb 42
 def forecast_ets(obj, h, level=None):
     fcst = pegelsfcast_C(h, obj)
     out = {"mean": fcst}
@@ -1641,6 +1720,44 @@ def forecast_ets(obj, h, level=None):
         out = {**out, **pi}
     return out
 
-# %% ../nbs/src/ets.ipynb 46
+# %% ../nbs/src/ets.ipynb 50
 def forward_ets(fitted_model, y):
     return ets_f(y=y, m=fitted_model["m"], model=fitted_model)
+
+# %% ../nbs/src/ets.ipynb 53
+def update_ets(fitted_model, y):
+    # runs the new observations through the recursions starting from the last state
+    errortype, trendtype, seasontype, damped = fitted_model["components"]
+    alpha, beta, gamma, phi = fitted_model["par"][:4]
+    _, e, states, _ = pegelsresid_C(
+        y=y,
+        m=fitted_model["m"],
+        init_state=fitted_model["states"][-1],
+        errortype=errortype,
+        trendtype=trendtype,
+        seasontype=seasontype,
+        damped=damped != "N",
+        alpha=alpha,
+        beta=beta,
+        gamma=gamma,
+        phi=phi,
+        nmse=1,
+    )
+    if errortype == "A":
+        fits = y - e
+    else:
+        # protect e == -1
+        aux_e = np.copy(e)
+        aux_e[aux_e == -1.0] = -1 + 1e-3
+        fits = y / (1 + aux_e)
+    sq_e = e**2
+    np_ = fitted_model["n_params"]
+    n_old = len(fitted_model["residuals"])
+    sse = fitted_model["sigma2"] * (n_old - np_ - 1) + sq_e[~np.isinf(sq_e)].sum()
+    return {
+        **fitted_model,
+        "residuals": np.append(fitted_model["residuals"], e),
+        "fitted": np.append(fitted_model["fitted"], fits),
+        "states": np.vstack([fitted_model["states"], states[1:]]),
+        "sigma2": sse / (n_old + len(y) - np_ - 1),
+    }
@@ -104,6 +104,10 @@ def garch_loglik(x0, x, p, q):
 # %% ../nbs/src/garch.ipynb 18
 def garch_model(x, p, q):
 
+    # the likelihood is optimized in double precision, the fitted values
+    # are kept in the precision of the serie
+    dtype = np.result_type(x.dtype, np.float32)
+    x = x.astype(np.float64)
     np.random.seed(1)
     x0 = np.repeat(0.1, p + q + 1)
     bnds = ((0, None),) * len(x0)
@@ -114,7 +118,7 @@ def garch_model(x, p, q):
 
     coeff = opt.x
     sigma2 = garch_sigma2(coeff, x, p, q)
-    fitted = np.full((len(x),), np.nan)
+    fitted = np.full((len(x),), np.nan, dtype=dtype)
 
     for k in range(p, len(x)):
         error = np.random.normal(loc=0, scale=1)
@@ -12,8 +12,6 @@ from coreforecast.exponentially_weighted import exponentially_weighted_mean
 from coreforecast.rolling import rolling_mean
 from numba import njit
 
-from .utils import _ensure_float
-
 # %% ../nbs/src/mfles.ipynb 4
 # utility functions
 def calc_mse(y_true, y_pred):
@@ -440,7 +438,10 @@ class MFLES:
         if cov_threshold == -1:
             cov_threshold = 10000
         n = len(y)
-        y = _ensure_float(y)
+        # fit in double precision, single precision changes the results noticeably,
+        # the per observation components are kept in the precision of the serie
+        dtype = np.result_type(y.dtype, np.float32)
+        y = y.astype(np.float64)
         self.exogenous_lr = exogenous_lr
         if multiplicative is None:
             if seasonal_period is None:
@@ -474,7 +475,7 @@ class MFLES:
             self.mean = y[-1]
             self.std = 0
             self.exo_model = [Zeros()]
-            return np.tile(y[-1], len(y))
+            return np.tile(y[-1], len(y)).astype(dtype)
         og_y = y
         self.og_y = og_y
         y = y.copy()
@@ -643,7 +644,16 @@ class MFLES:
         else:
             fitted = self.mean + (fitted * self.std)
         self.multiplicative = multiplicative
-        return fitted
+        for attr in (
+            "og_y",
+            "linear_component",
+            "seasonal_component",
+            "ses_component",
+            "median_component",
+            "exogenous_component",
+        ):
+            setattr(self, attr, getattr(self, attr).astype(dtype, copy=False))
+        return fitted.astype(dtype, copy=False)
 
     def predict(self, forecast_horizon, X=None):
         last_point = self.trend[1]
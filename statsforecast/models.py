@@ -11,6 +11,7 @@ __all__ = ['AutoARIMA', 'AutoETS', 'ETS', 'AutoCES', 'AutoTheta', 'ARIMA', 'Auto
 
 # %% ../nbs/src/core/models.ipynb 5
 import warnings
+from functools import lru_cache
 from math import trunc
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
@@ -19,27 +20,6 @@ from numba import njit
 from scipy.optimize import minimize
 from scipy.special import inv_boxcox
 
-from statsforecast.arima import (
-    Arima,
-    auto_arima_f,
-    fitted_arima,
-    forecast_arima,
-    forward_arima,
-    is_constant,
-)
-from .ces import auto_ces, forecast_ces, forward_ces
-from statsforecast.ets import (
-    _PHI_LOWER,
-    _PHI_UPPER,
-    ets_f,
-    forecast_ets,
-    forward_ets,
-)
-from .mfles import MFLES as _MFLES
-from .mstl import mstl
-from .theta import auto_theta, forecast_theta, forward_theta
-from .garch import garch_model, garch_forecast
-from .tbats import tbats_selection, tbats_forecast, _compute_sigmah
 from statsforecast.utils import (
     _calculate_sigma,
     _calculate_intervals,
@@ -55,7 +35,7 @@ from statsforecast.utils import (
     NOGIL,
 )
 
-# %% ../nbs/src/core/models.ipynb 9
+# %% ../nbs/src/core/models.ipynb 10
 def _add_fitted_pi(res, se, level):
     level = sorted(level)
     level = np.asarray(level)
@@ -68,7 +48,23 @@ def _add_fitted_pi(res, se, level):
     res = {**res, **lo, **hi}
     return res
 
-# %% ../nbs/src/core/models.ipynb 10
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _segment_sigma(residuals, indptr, dofs):
+    # standard deviation of the residuals of each serie
+    n_series = indptr.size - 1
+    sigma = np.zeros(n_series)
+    for i in range(n_series):
+        if dofs[i] <= 0:
+            continue
+        ssq = 0.0
+        for j in range(indptr[i], indptr[i + 1]):
+            if not np.isnan(residuals[j]):
+                ssq += residuals[j] ** 2
+        sigma[i] = np.sqrt(ssq / dofs[i])
+    return sigma
+
+# %% ../nbs/src/core/models.ipynb 11
 def _add_conformal_distribution_intervals(
     fcst: Dict,
     cs: np.ndarray,
@@ -97,7 +93,7 @@ def _add_conformal_distribution_intervals(
         fcst[col] = quantiles[i]
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 11
+# %% ../nbs/src/core/models.ipynb 12
 def _get_conformal_method(method: str):
     available_methods = {
         "conformal_distribution": _add_conformal_distribution_intervals,
@@ -110,9 +106,15 @@ def _get_conformal_method(method: str):
         )
     return available_methods[method]
 
-# %% ../nbs/src/core/models.ipynb 12
+# %% ../nbs/src/core/models.ipynb 13
 class _TS:
     uses_exog = False
+    # growth of the fit time with the length of the series (used for load balancing)
+    cost_exponent = 1.0
+    # whether fit runs in numba functions that release the GIL (requires
+    # NIXTLA_NUMBA_RELEASE_GIL), used by the threads backend. Models whose fit
+    # is made of numpy or scipy calls hold it.
+    releases_gil = False
 
     def new(self):
         b = type(self).__new__(type(self))
@@ -171,7 +173,15 @@ class _TS:
     def _add_predict_conformal_intervals(self, fcst, level):
         return self._add_conformal_intervals(fcst=fcst, y=None, X=None, level=level)
 
-# %% ../nbs/src/core/models.ipynb 17
+# %% ../nbs/src/core/models.ipynb 18
+# kept by the module instead of the models, so that it isn't pickled with them
+@lru_cache(maxsize=None)
+def _arima_cache():
+    from statsforecast.arima import ARIMACache
+
+    return ARIMACache()
+
+
 class AutoARIMA(_TS):
     r"""AutoARIMA model.
 
@@ -256,9 +266,24 @@ class AutoARIMA(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    parallel : bool
+        If True, the candidate models are fitted by a pool of processes.
+        The selected model is the same as with the serial search.
+        Meant for a few long series, with `n_jobs=1` in `StatsForecast`.
+    num_cores : Optional[int]
+        Number of processes used if `parallel=True`. If None, all the available cores are used.
+    reuse_cache : bool
+        If True, the results of the unit root tests and of the regression on the exogenous
+        variables are kept between calls to `fit` and `forecast`, e.g. across the windows of
+        `cross_validation`. They're keyed by their inputs, so they're only reused when these repeat.
+        They're kept in a cache of the process shared by these models, not in the fitted models.
+    selection_length : Optional[int]
+        If the series is longer, the model is selected with conditional sum-of-squares on its last `selection_length` observations and only the selected model is fitted on the whole series.
     """
 
     uses_exog = True
+    cost_exponent = 1.5
+    warm_start_: Optional[Dict] = None
 
     def __init__(
         self,
@@ -295,6 +320,10 @@ class AutoARIMA(_TS):
         season_length: int = 1,
         alias: str = "AutoARIMA",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        parallel: bool = False,
+        num_cores: Optional[int] = 2,
+        reuse_cache: bool = False,
+        selection_length: Optional[int] = None,
     ):
         self.d = d
         self.D = D
@@ -329,6 +358,13 @@ class AutoARIMA(_TS):
         self.season_length = season_length
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.parallel = parallel
+        self.num_cores = num_cores
+        self.reuse_cache = reuse_cache
+        self.selection_length = selection_length
+
+    def _cache(self):
+        return _arima_cache() if self.reuse_cache else None
 
     def fit(
         self,
@@ -352,6 +388,8 @@ class AutoARIMA(_TS):
         self :
             AutoARIMA fitted model.
         """
+        from statsforecast.arima import auto_arima_f
+
         with np.errstate(invalid="ignore"):
             self.model_ = auto_arima_f(
                 x=y,
@@ -377,6 +415,7 @@ class AutoARIMA(_TS):
                 approximation=self.approximation,
                 method=self.method,
                 truncate=self.truncate,
+                selection_length=self.selection_length,
                 xreg=X,
                 test=self.test,
                 test_kwargs=self.test_kwargs,
@@ -387,6 +426,10 @@ class AutoARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 period=self.season_length,
+                parallel=self.parallel,
+                num_cores=self.num_cores,
+                cache=self._cache(),
+                warm_start=self.warm_start_,
             )
 
         self._store_cs(y=y, X=X)
@@ -414,6 +457,8 @@ class AutoARIMA(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import forecast_arima
+
         fcst = forecast_arima(self.model_, h=h, xreg=X, level=level)
         mean = fcst["mean"]
         res = {"mean": mean}
@@ -443,6 +488,8 @@ class AutoARIMA(_TS):
         forecasts : dict
             Dictionary with entries `fitted` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import fitted_arima
+
         mean = fitted_arima(self.model_)
         res = {"fitted": mean}
         if level is not None:
@@ -485,6 +532,8 @@ class AutoARIMA(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import auto_arima_f, fitted_arima, forecast_arima
+
         with np.errstate(invalid="ignore"):
             mod = auto_arima_f(
                 x=y,
@@ -510,6 +559,7 @@ class AutoARIMA(_TS):
                 approximation=self.approximation,
                 method=self.method,
                 truncate=self.truncate,
+                selection_length=self.selection_length,
                 xreg=X,
                 test=self.test,
                 test_kwargs=self.test_kwargs,
@@ -520,6 +570,9 @@ class AutoARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 period=self.season_length,
+                parallel=self.parallel,
+                num_cores=self.num_cores,
+                cache=self._cache(),
             )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
@@ -572,6 +625,8 @@ class AutoARIMA(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import fitted_arima, forecast_arima, forward_arima
+
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
         with np.errstate(invalid="ignore"):
@@ -596,7 +651,53 @@ class AutoARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 33
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted AutoARIMA with new observations.
+
+        Runs the observations that follow the ones used in `fit` through the
+        Kalman filter without estimating the parameters again.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (k, ).
+        X : array-like
+            Optional exogenous of shape (k, n_x).
+
+        Returns
+        -------
+        self :
+            AutoARIMA updated model.
+        """
+        from statsforecast.arima import update_arima
+
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        with np.errstate(invalid="ignore"):
+            self.model_ = update_arima(self.model_, y=y, xreg=X, method=self.method)
+        return self
+
+    def warm_start(self):
+        r"""Copy of the model whose next fit starts from the fitted order and coefficients.
+
+        The order is only searched again if it can't be fitted.
+
+        Returns
+        -------
+        model :
+            AutoARIMA model to be fitted on a similar serie, e.g. the next window of a cross validation.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        model = self.new()
+        model.warm_start_ = self.model_
+        return model
+
+# %% ../nbs/src/core/models.ipynb 38
 class AutoETS(_TS):
     r"""Automatic Exponential Smoothing model.
 
@@ -640,6 +741,8 @@ class AutoETS(_TS):
         intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int = 1,
@@ -653,6 +756,8 @@ class AutoETS(_TS):
         self.model = model
         self.damped = damped
         if phi is not None:
+            from statsforecast.ets import _PHI_LOWER, _PHI_UPPER
+
             if not isinstance(phi, float):
                 raise ValueError("phi must be `None` or float.")
             if not _PHI_LOWER <= phi <= _PHI_UPPER:
@@ -683,6 +788,8 @@ class AutoETS(_TS):
         self :
             Exponential Smoothing fitted model.
         """
+        from statsforecast.ets import ets_f
+
         self.model_ = ets_f(
             y, m=self.season_length, model=self.model, damped=self.damped, phi=self.phi
         )
@@ -709,6 +816,8 @@ class AutoETS(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.ets import forecast_ets
+
         fcst = forecast_ets(self.model_, h=h, level=level)
         res = {"mean": fcst["mean"]}
         if level is None:
@@ -779,6 +888,8 @@ class AutoETS(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.ets import ets_f, forecast_ets
+
         mod = ets_f(
             y, m=self.season_length, model=self.model, damped=self.damped, phi=self.phi
         )
@@ -834,6 +945,8 @@ class AutoETS(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.ets import forecast_ets, forward_ets
+
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
         mod = forward_ets(self.model_, y=y)
@@ -858,7 +971,39 @@ class AutoETS(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 48
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted Exponential Smoothing with new observations.
+
+        Runs the observations that follow the ones used in `fit` through the
+        state-space equations without estimating the parameters again.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (k, ).
+        X : array-like
+            Optional exogenous of shape (k, n_x).
+
+        Returns
+        -------
+        self :
+            Exponential Smoothing updated model.
+        """
+        from statsforecast.ets import update_ets
+
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        self.model_ = update_ets(self.model_, y=y)
+        self.model_["actual_residuals"] = np.append(
+            self.model_["actual_residuals"], y - self.model_["fitted"][-y.size :]
+        )
+        return self
+
+# %% ../nbs/src/core/models.ipynb 54
 class ETS(AutoETS):
     @classmethod
     def _warn(cls):
@@ -887,7 +1032,7 @@ class ETS(AutoETS):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 53
+# %% ../nbs/src/core/models.ipynb 59
 class AutoCES(_TS):
     r"""Complex Exponential Smoothing model.
 
@@ -921,6 +1066,8 @@ class AutoCES(_TS):
         intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int = 1,
@@ -955,6 +1102,9 @@ class AutoCES(_TS):
         self :
             Complex Exponential Smoothing fitted model.
         """
+        from statsforecast.arima import is_constant
+        from statsforecast.ces import auto_ces
+
         if is_constant(y):
             model = Naive(
                 alias=self.alias, prediction_intervals=self.prediction_intervals
@@ -985,6 +1135,8 @@ class AutoCES(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.ces import forecast_ces
+
         fcst = forecast_ces(self.model_, h=h, level=level)
         res = {"mean": fcst["mean"]}
         if level is None:
@@ -1055,6 +1207,9 @@ class AutoCES(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import is_constant
+        from statsforecast.ces import auto_ces, forecast_ces
+
         if is_constant(y):
             model = Naive(
                 alias=self.alias, prediction_intervals=self.prediction_intervals
@@ -1115,6 +1270,8 @@ class AutoCES(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.ces import forecast_ces, forward_ces
+
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
         mod = forward_ces(self.model_, y=y)
@@ -1139,7 +1296,39 @@ class AutoCES(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 71
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted Complex Exponential Smoothing with new observations.
+
+        Runs the observations that follow the ones used in `fit` through the
+        state-space equations without estimating the parameters again.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (k, ).
+        X : array-like
+            Optional exogenous of shape (k, n_x).
+
+        Returns
+        -------
+        self :
+            Complex Exponential Smoothing updated model.
+        """
+        from statsforecast.ces import update_ces
+
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        self.model_ = update_ces(self.model_, y=y)
+        self.model_["actual_residuals"] = np.append(
+            self.model_["actual_residuals"], y - self.model_["fitted"][-y.size :]
+        )
+        return self
+
+# %% ../nbs/src/core/models.ipynb 78
 class AutoTheta(_TS):
     r"""AutoTheta model.
 
@@ -1165,8 +1354,13 @@ class AutoTheta(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default=200)
+        Number of sample paths used to compute the prediction intervals.
+        Fewer paths are faster but make the intervals noisier.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int = 1,
@@ -1174,12 +1368,14 @@ class AutoTheta(_TS):
         model: Optional[str] = None,
         alias: str = "AutoTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
     ):
         self.season_length = season_length
         self.decomposition_type = decomposition_type
         self.model = model
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.n_samples = n_samples
 
     def fit(
         self,
@@ -1203,6 +1399,8 @@ class AutoTheta(_TS):
         self :
             AutoTheta fitted model.
         """
+        from statsforecast.theta import auto_theta
+
         self.model_ = auto_theta(
             y=y,
             m=self.season_length,
@@ -1235,7 +1433,9 @@ class AutoTheta(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
-        fcst = forecast_theta(self.model_, h=h, level=level)
+        from statsforecast.theta import forecast_theta
+
+        fcst = forecast_theta(self.model_, h=h, level=level, n_samples=self.n_samples)
         if self.prediction_intervals is not None and level is not None:
             fcst = self._add_predict_conformal_intervals(fcst, level)
         return fcst
@@ -1294,13 +1494,15 @@ class AutoTheta(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.theta import auto_theta, forecast_theta
+
         mod = auto_theta(
             y=y,
             m=self.season_length,
             model=self.model,
             decomposition_type=self.decomposition_type,
         )
-        res = forecast_theta(mod, h, level=level)
+        res = forecast_theta(mod, h, level=level, n_samples=self.n_samples)
         if self.prediction_intervals is not None:
             res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
         if fitted:
@@ -1342,10 +1544,12 @@ class AutoTheta(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.theta import forecast_theta, forward_theta
+
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
         mod = forward_theta(self.model_, y=y)
-        res = forecast_theta(mod, h, level=level)
+        res = forecast_theta(mod, h, level=level, n_samples=self.n_samples)
         if self.prediction_intervals is not None:
             res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
         if fitted:
@@ -1356,7 +1560,42 @@ class AutoTheta(_TS):
             res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 87
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted AutoTheta with new observations.
+
+        Runs the observations that follow the ones used in `fit` through the
+        state-space equations without estimating the parameters again.
+        The seasonal indices of the decomposition and the trend of the static
+        models are the ones estimated in `fit`, so the forecasts can differ from
+        the ones of `forward` on the whole serie, which estimates them again.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (k, ).
+        X : array-like
+            Optional exogenous of shape (k, n_x).
+
+        Returns
+        -------
+        self :
+            AutoTheta updated model.
+        """
+        from statsforecast.theta import update_theta
+
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        self.model_ = update_theta(self.model_, y=y)
+        self.model_["fitted"] = np.append(
+            self.model_["fitted"], y - self.model_["residuals"][-y.size :]
+        )
+        return self
+
+# %% ../nbs/src/core/models.ipynb 96
 class ARIMA(_TS):
     r"""ARIMA model.
 
@@ -1407,6 +1646,7 @@ class ARIMA(_TS):
     """
 
     uses_exog = True
+    warm_start_: Optional[Dict] = None
 
     def __init__(
         self,
@@ -1457,6 +1697,11 @@ class ARIMA(_TS):
         self :
             Fitted model.
         """
+        from statsforecast.arima import Arima, warm_start_init
+
+        init = None
+        if self.warm_start_ is not None:
+            init = warm_start_init(self.warm_start_)
         with np.errstate(invalid="ignore"):
             self.model_ = Arima(
                 x=y,
@@ -1470,6 +1715,7 @@ class ARIMA(_TS):
                 biasadj=self.biasadj,
                 method=self.method,
                 fixed=self.fixed,
+                init=init,
             )
         self._store_cs(y=y, X=X)
         return self
@@ -1496,6 +1742,8 @@ class ARIMA(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import forecast_arima
+
         fcst = forecast_arima(self.model_, h=h, xreg=X, level=level)
         mean = fcst["mean"]
         res = {"mean": mean}
@@ -1525,6 +1773,8 @@ class ARIMA(_TS):
         forecasts : dict
             Dictionary with entries `fitted` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import fitted_arima
+
         mean = fitted_arima(self.model_)
         res = {"fitted": mean}
         if level is not None:
@@ -1567,6 +1817,8 @@ class ARIMA(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import Arima, fitted_arima, forecast_arima
+
         with np.errstate(invalid="ignore"):
             mod = Arima(
                 x=y,
@@ -1632,6 +1884,8 @@ class ARIMA(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.arima import fitted_arima, forecast_arima, forward_arima
+
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
         with np.errstate(invalid="ignore"):
@@ -1656,7 +1910,54 @@ class ARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 102
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        r"""Update the fitted ARIMA with new observations.
+
+        Runs the observations that follow the ones used in `fit` through the
+        Kalman filter without estimating the parameters again.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (k, ).
+        X : array-like
+            Optional exogenous of shape (k, n_x).
+
+        Returns
+        -------
+        self :
+            ARIMA updated model.
+        """
+        from statsforecast.arima import update_arima
+
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        with np.errstate(invalid="ignore"):
+            self.model_ = update_arima(self.model_, y=y, xreg=X, method=self.method)
+        return self
+
+    def warm_start(self):
+        r"""Copy of the model whose next fit starts from the fitted coefficients.
+
+        The fit converges to the optimum of the likelihood closest to these coefficients,
+        which can differ from the one of a fit from scratch when there are several local optima.
+
+        Returns
+        -------
+        model :
+            ARIMA model to be fitted on a similar serie, e.g. the next window of a cross validation.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        model = self.new()
+        model.warm_start_ = self.model_
+        return model
+
+# %% ../nbs/src/core/models.ipynb 116
 class AutoRegressive(ARIMA):
     r"""Simple Autoregressive model.
 
@@ -1728,7 +2029,7 @@ class AutoRegressive(ARIMA):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 117
+# %% ../nbs/src/core/models.ipynb 131
 @njit(nogil=NOGIL, cache=CACHE)
 def _ses_fcst_mse(x: np.ndarray, alpha: float) -> Tuple[float, float, np.ndarray]:
     r"""Perform simple exponential smoothing on a series.
@@ -1799,7 +2100,21 @@ def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
     n_elems = n_chunks * chunk_size
     return array[:n_elems].reshape(n_chunks, chunk_size).sum(axis=1)
 
-# %% ../nbs/src/core/models.ipynb 118
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _nonzero_intervals(x: np.ndarray) -> np.ndarray:
+    r"""Compute the intervals between non zero elements of a vector."""
+    out = np.empty(np.count_nonzero(x), dtype=x.dtype)
+    last = -1
+    j = 0
+    for i in range(x.size):
+        if x[i] != 0:
+            out[j] = i - last
+            last = i
+            j += 1
+    return out
+
+# %% ../nbs/src/core/models.ipynb 132
 def _ses(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1812,7 +2127,7 @@ def _ses(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 119
+# %% ../nbs/src/core/models.ipynb 133
 class SimpleExponentialSmoothing(_TS):
     r"""SimpleExponentialSmoothing model.
 
@@ -1838,6 +2153,8 @@ class SimpleExponentialSmoothing(_TS):
         intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         alpha: float,
@@ -1972,7 +2289,7 @@ class SimpleExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to " "compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 131
+# %% ../nbs/src/core/models.ipynb 145
 def _ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1985,7 +2302,7 @@ def _ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 132
+# %% ../nbs/src/core/models.ipynb 146
 class SimpleExponentialSmoothingOptimized(_TS):
     r"""SimpleExponentialSmoothing model.
 
@@ -2139,7 +2456,7 @@ class SimpleExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 144
+# %% ../nbs/src/core/models.ipynb 158
 def _seasonal_exponential_smoothing(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2163,7 +2480,7 @@ def _seasonal_exponential_smoothing(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 145
+# %% ../nbs/src/core/models.ipynb 159
 class SeasonalExponentialSmoothing(_TS):
     r"""SeasonalExponentialSmoothing model.
 
@@ -2195,6 +2512,8 @@ class SeasonalExponentialSmoothing(_TS):
         This is required for generating future prediction intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int,
@@ -2338,7 +2657,7 @@ class SeasonalExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 160
+# %% ../nbs/src/core/models.ipynb 174
 def _seasonal_ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2361,7 +2680,7 @@ def _seasonal_ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 161
+# %% ../nbs/src/core/models.ipynb 175
 class SeasonalExponentialSmoothingOptimized(_TS):
 
     def __init__(
@@ -2533,7 +2852,7 @@ class SeasonalExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 174
+# %% ../nbs/src/core/models.ipynb 188
 class Holt(AutoETS):
     r"""Holt's method.
 
@@ -2575,7 +2894,7 @@ class Holt(AutoETS):
             season_length, model, alias=alias, prediction_intervals=prediction_intervals
         )
 
-# %% ../nbs/src/core/models.ipynb 188
+# %% ../nbs/src/core/models.ipynb 202
 class HoltWinters(AutoETS):
     r"""Holt-Winters' method.
 
@@ -2615,7 +2934,7 @@ class HoltWinters(AutoETS):
             season_length, model, alias=alias, prediction_intervals=prediction_intervals
         )
 
-# %% ../nbs/src/core/models.ipynb 203
+# %% ../nbs/src/core/models.ipynb 217
 def _historic_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2627,9 +2946,22 @@ def _historic_average(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 204
-class HistoricAverage(_TS):
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _historic_average_batch(y, indptr, h, fitted):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        avg = y[start:end].mean()
+        mean[i * h : (i + 1) * h] = avg
+        if fitted:
+            fitted_vals[start:end] = avg
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 218
+class HistoricAverage(_TS):
     def __init__(
         self,
         alias: str = "HistoricAverage",
@@ -2803,9 +3135,67 @@ class HistoricAverage(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 217
-class Naive(_TS):
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""HistoricAverage predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
 
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        mean, fitted_vals = _historic_average_batch(
+            y, indptr, h, fitted or (level is not None)
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            sizes = np.diff(indptr)
+            sigma = _segment_sigma(y - fitted_vals, indptr, sizes - 1)
+            sigma = sigma * np.sqrt(1 + (1 / sizes))
+            sigmah = np.repeat(sigma, h)
+            res = {**res, **_calculate_intervals(res, level, sigmah.size, sigmah)}
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../nbs/src/core/models.ipynb 231
+@njit(nogil=NOGIL, cache=CACHE)
+def _naive_batch(y, indptr, h, fitted):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        mean[i * h : (i + 1) * h] = y[end - 1]
+        if fitted:
+            fitted_vals[start] = np.nan
+            fitted_vals[start + 1 : end] = y[start : end - 1]
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 232
+class Naive(_TS):
     def __init__(
         self,
         alias: str = "Naive",
@@ -3010,7 +3400,50 @@ class Naive(_TS):
         )
         return res
 
-# %% ../nbs/src/core/models.ipynb 233
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""Naive predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        mean, fitted_vals = _naive_batch(y, indptr, h, fitted or (level is not None))
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            sizes = np.diff(indptr)
+            sigma = _segment_sigma(y - fitted_vals, indptr, sizes - 1)
+            steps = np.arange(1, h + 1)
+            sigmah = (sigma[:, None] * np.sqrt(steps)).ravel()
+            res = {**res, **_calculate_intervals(res, level, sigmah.size, sigmah)}
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../nbs/src/core/models.ipynb 248
 def _random_walk_with_drift(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3029,9 +3462,28 @@ def _random_walk_with_drift(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 234
-class RandomWalkWithDrift(_TS):
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _random_walk_with_drift_batch(y, indptr, h, fitted):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start > 1:
+            slope = (y[end - 1] - y[start]) / (end - start - 1)
+        else:
+            slope = np.nan
+        for j in range(h):
+            mean[i * h + j] = slope * (j + 1) + y[end - 1]
+        if fitted:
+            fitted_vals[start] = np.nan
+            for t in range(start + 1, end):
+                fitted_vals[t] = slope + y[t - 1]
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 249
+class RandomWalkWithDrift(_TS):
     def __init__(
         self,
         alias: str = "RWD",
@@ -3205,9 +3657,80 @@ class RandomWalkWithDrift(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 249
-class SeasonalNaive(_TS):
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""RandomWalkWithDrift predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        mean, fitted_vals = _random_walk_with_drift_batch(
+            y, indptr, h, fitted or (level is not None)
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            sizes = np.diff(indptr)
+            sigma = _segment_sigma(y - fitted_vals, indptr, sizes - 1)
+            steps = np.arange(1, h + 1)
+            sigmah = sigma[:, None] * np.sqrt(
+                steps * (1 + steps / (sizes[:, None] - 1))
+            )
+            sigmah = sigmah.ravel()
+            res = {**res, **_calculate_intervals(res, level, sigmah.size, sigmah)}
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../nbs/src/core/models.ipynb 264
+@njit(nogil=NOGIL, cache=CACHE)
+def _seasonal_naive_batch(y, indptr, h, season_length, fitted):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        season_samples = min(season_length, n)
+        for j in range(h):
+            idx = j % season_length
+            if idx < season_samples:
+                mean[i * h + j] = y[end - season_samples + idx]
+            else:
+                mean[i * h + j] = np.nan
+        if fitted:
+            for t in range(n):
+                if t < season_length:
+                    fitted_vals[start + t] = np.nan
+                else:
+                    fitted_vals[start + t] = y[start + t - season_length]
+    return mean, fitted_vals
 
+# %% ../nbs/src/core/models.ipynb 265
+class SeasonalNaive(_TS):
     def __init__(
         self,
         season_length: int,
@@ -3391,7 +3914,57 @@ class SeasonalNaive(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 264
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""SeasonalNaive predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        sizes = np.diff(indptr)
+        if level is not None and fitted and (sizes <= self.season_length).any():
+            # `forecast` fails on these series, so they're left to the fallback model
+            raise ValueError(
+                "The fitted intervals need series longer than `season_length`."
+            )
+        mean, fitted_vals = _seasonal_naive_batch(
+            y, indptr, h, self.season_length, fitted or (level is not None)
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            sigma = _segment_sigma(y - fitted_vals, indptr, sizes - self.season_length)
+            k = np.floor((h - 1) / self.season_length)
+            sigmah = np.repeat(sigma * np.sqrt(k + 1), h)
+            res = {**res, **_calculate_intervals(res, level, sigmah.size, sigmah)}
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../nbs/src/core/models.ipynb 280
 def _window_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3406,9 +3979,20 @@ def _window_average(
     mean = _repeat_val(val=wavg, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 265
-class WindowAverage(_TS):
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _window_average_batch(y, indptr, h, window_size):
+    n_series = indptr.size - 1
+    mean = np.full(n_series * h, np.nan, dtype=np.float32)
+    for i in range(n_series):
+        end = indptr[i + 1]
+        if end - indptr[i] < window_size:
+            continue
+        mean[i * h : (i + 1) * h] = y[end - window_size : end].mean()
+    return mean
+
+# %% ../nbs/src/core/models.ipynb 281
+class WindowAverage(_TS):
     def __init__(
         self,
         window_size: int,
@@ -3534,13 +4118,52 @@ class WindowAverage(_TS):
         Parameters
         ----------
         y : numpy.array
-            Clean time series of shape (n, ).
+            Clean time series of shape (n, ).
+        h : int
+            Forecast horizon.
+        X : array-like
+            Optional insample exogenous of shape (t, n_x).
+        X_future : array-like
+            Optional exogenous of shape (h, n_x).
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
+        """
+        res = _window_average(y=y, h=h, fitted=fitted, window_size=self.window_size)
+        res = dict(res)
+        if level is None:
+            return res
+        level = sorted(level)
+        if self.prediction_intervals is not None:
+            res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
+        else:
+            raise Exception("You must pass `prediction_intervals` to compute them.")
+        return res
+
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""WindowAverage predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
         h : int
             Forecast horizon.
-        X : array-like
-            Optional insample exogenous of shape (t, n_x).
-        X_future : array-like
-            Optional exogenous of shape (h, n_x).
         level : List[float]
             Confidence levels (0-100) for prediction intervals.
         fitted : bool
@@ -3549,20 +4172,15 @@ class WindowAverage(_TS):
         Returns
         -------
         forecasts : dict
-            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
+            Same entries as `forecast`, with the values of all series stacked.
         """
-        res = _window_average(y=y, h=h, fitted=fitted, window_size=self.window_size)
-        res = dict(res)
-        if level is None:
-            return res
-        level = sorted(level)
-        if self.prediction_intervals is not None:
-            res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
-        else:
-            raise Exception("You must pass `prediction_intervals` to compute them.")
-        return res
+        if fitted:
+            raise NotImplementedError("return fitted")
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        return {"mean": _window_average_batch(y, indptr, h, self.window_size)}
 
-# %% ../nbs/src/core/models.ipynb 276
+# %% ../nbs/src/core/models.ipynb 292
 def _seasonal_window_average(
     y: np.ndarray,
     h: int,
@@ -3579,9 +4197,27 @@ def _seasonal_window_average(
     out = _repeat_val_seas(season_vals=season_avgs, h=h)
     return {"mean": out}
 
-# %% ../nbs/src/core/models.ipynb 277
-class SeasonalWindowAverage(_TS):
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _seasonal_window_average_batch(y, indptr, h, season_length, window_size):
+    n_series = indptr.size - 1
+    min_samples = season_length * window_size
+    mean = np.full(n_series * h, np.nan, dtype=np.float32)
+    season_avgs = np.empty(season_length)
+    for i in range(n_series):
+        end = indptr[i + 1]
+        if end - indptr[i] < min_samples:
+            continue
+        season_avgs[:] = 0.0
+        for t in range(min_samples):
+            season_avgs[t % season_length] += y[end - min_samples + t]
+        season_avgs /= window_size
+        for j in range(h):
+            mean[i * h + j] = season_avgs[j % season_length]
+    return mean
+
+# %% ../nbs/src/core/models.ipynb 293
+class SeasonalWindowAverage(_TS):
     def __init__(
         self,
         season_length: int,
@@ -3749,7 +4385,44 @@ class SeasonalWindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 289
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""SeasonalWindowAverage predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        if fitted:
+            raise NotImplementedError("return fitted")
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        mean = _seasonal_window_average_batch(
+            y, indptr, h, self.season_length, self.window_size
+        )
+        return {"mean": mean}
+
+# %% ../nbs/src/core/models.ipynb 306
 def _chunk_forecast(y, aggregation_level):
     lost_remainder_data = len(y) % aggregation_level
     y_cut = y[lost_remainder_data:]
@@ -3832,9 +4505,29 @@ def _adida(
         res["fitted"] = np.append(np.nan, sums_fitted / fitted_aggregation_levels)
     return res
 
-# %% ../nbs/src/core/models.ipynb 290
-class ADIDA(_TS):
 
+def _adida_batch(y, indptr, h, fitted):
+    n_series = indptr.size - 1
+    mean = np.zeros(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        y_i = y[start:end]
+        if fitted:
+            # the fitted values run the alpha search for every timestamp
+            res = _adida(y=y_i, h=1, fitted=True)
+            mean[i * h : (i + 1) * h] = res["mean"][0]
+            fitted_vals[start:end] = res["fitted"]
+            continue
+        if (y_i == 0).all():
+            continue
+        aggregation_level = round(_intervals(y_i).mean())
+        sums_forecast = _chunk_forecast(y_i, aggregation_level)
+        mean[i * h : (i + 1) * h] = sums_forecast / aggregation_level
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 307
+class ADIDA(_TS):
     def __init__(
         self,
         alias: str = "ADIDA",
@@ -3999,7 +4692,43 @@ class ADIDA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 302
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""ADIDA predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        mean, fitted_vals = _adida_batch(_ensure_float(y), indptr, h, fitted)
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/src/core/models.ipynb 319
 def _croston_classic(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4027,9 +4756,38 @@ def _croston_classic(
         out["fitted"] = ydf / yif
     return out
 
-# %% ../nbs/src/core/models.ipynb 303
-class CrostonClassic(_TS):
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _croston_classic_batch(y, indptr, h, fitted, factor=1.0):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        y_i = y[start:end]
+        yd = y_i[y_i > 0]
+        if not yd.size:
+            # no demand, use naive
+            mean[i * h : (i + 1) * h] = factor * y_i[-1]
+            if fitted:
+                fitted_vals[start] = np.nan
+                fitted_vals[start + 1 : end] = factor * y_i[:-1]
+            continue
+        ydp, _, ydf = _ses_fcst_mse(yd, 0.1)
+        yi = _nonzero_intervals(y_i)
+        yip, _, yif = _ses_fcst_mse(yi, 0.1)
+        if yip != 0.0:
+            mean[i * h : (i + 1) * h] = factor * ydp / yip
+        else:
+            mean[i * h : (i + 1) * h] = factor * ydp
+        if fitted:
+            ydf = _expand_fitted_demand(np.append(ydf, ydp), y_i)
+            yif = _expand_fitted_intervals(np.append(yif, yip), y_i)
+            fitted_vals[start:end] = factor * (ydf / yif)
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 320
+class CrostonClassic(_TS):
     def __init__(
         self,
         alias: str = "CrostonClassic",
@@ -4189,7 +4947,43 @@ class CrostonClassic(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 314
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""CrostonClassic predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        mean, fitted_vals = _croston_classic_batch(_ensure_float(y), indptr, h, fitted)
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/src/core/models.ipynb 331
 def _croston_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4231,9 +5025,35 @@ def _croston_optimized(
         out["fitted"] = ydf / yif
     return out
 
-# %% ../nbs/src/core/models.ipynb 315
-class CrostonOptimized(_TS):
 
+def _croston_optimized_batch(y, indptr, h, fitted):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        y_i = y[start:end]
+        if fitted:
+            # the fitted values run the alpha search for every timestamp
+            res = _croston_optimized(y=y_i, h=1, fitted=True)
+            mean[i * h : (i + 1) * h] = res["mean"][0]
+            fitted_vals[start:end] = res["fitted"]
+            continue
+        yd = y_i[y_i > 0]
+        if not yd.size:
+            # no demand, use naive
+            mean[i * h : (i + 1) * h] = y_i[-1]
+            continue
+        ydp, _ = _optimized_ses_forecast(yd)
+        yip, _ = _optimized_ses_forecast(_intervals(y_i))
+        if yip != 0.0:
+            mean[i * h : (i + 1) * h] = ydp / yip
+        else:
+            mean[i * h : (i + 1) * h] = ydp
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 332
+class CrostonOptimized(_TS):
     def __init__(
         self,
         alias: str = "CrostonOptimized",
@@ -4390,7 +5210,45 @@ class CrostonOptimized(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 326
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""CrostonOptimized predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        mean, fitted_vals = _croston_optimized_batch(
+            _ensure_float(y), indptr, h, fitted
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/src/core/models.ipynb 343
 def _croston_sba(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4402,9 +5260,8 @@ def _croston_sba(
         out["fitted"] *= 0.95
     return out
 
-# %% ../nbs/src/core/models.ipynb 327
+# %% ../nbs/src/core/models.ipynb 344
 class CrostonSBA(_TS):
-
     def __init__(
         self,
         alias: str = "CrostonSBA",
@@ -4566,7 +5423,45 @@ class CrostonSBA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 338
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""CrostonSBA predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        mean, fitted_vals = _croston_classic_batch(
+            _ensure_float(y), indptr, h, fitted, 0.95
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/src/core/models.ipynb 355
 def _imapa(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4600,9 +5495,32 @@ def _imapa(
         res["fitted"] = fitted_vals
     return res
 
-# %% ../nbs/src/core/models.ipynb 339
-class IMAPA(_TS):
 
+def _imapa_batch(y, indptr, h, fitted):
+    n_series = indptr.size - 1
+    mean = np.zeros(n_series * h, dtype=np.float32)
+    fitted_vals = np.empty(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        y_i = y[start:end]
+        if fitted:
+            # the fitted values run the alpha search for every timestamp
+            res = _imapa(y=y_i, h=1, fitted=True)
+            mean[i * h : (i + 1) * h] = res["mean"][0]
+            fitted_vals[start:end] = res["fitted"]
+            continue
+        if (y_i == 0).all():
+            continue
+        max_aggregation_level = round(_intervals(y_i).mean().item())
+        forecasts = np.empty(max_aggregation_level, np.float32)
+        for aggregation_level in range(1, max_aggregation_level + 1):
+            forecast = _chunk_forecast(y_i, aggregation_level)
+            forecasts[aggregation_level - 1] = forecast / aggregation_level
+        mean[i * h : (i + 1) * h] = forecasts.mean()
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 356
+class IMAPA(_TS):
     def __init__(
         self,
         alias: str = "IMAPA",
@@ -4763,7 +5681,43 @@ class IMAPA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 350
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""IMAPA predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        mean, fitted_vals = _imapa_batch(_ensure_float(y), indptr, h, fitted)
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/src/core/models.ipynb 367
 def _tsb(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4788,9 +5742,33 @@ def _tsb(
         res["fitted"] = ypft * ydft
     return res
 
-# %% ../nbs/src/core/models.ipynb 351
-class TSB(_TS):
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _tsb_batch(y, indptr, h, fitted, alpha_d, alpha_p):
+    n_series = indptr.size - 1
+    mean = np.zeros(n_series * h, dtype=np.float32)
+    fitted_vals = np.zeros(y.size if fitted else 0, dtype=np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        y_i = y[start:end]
+        if not np.any(y_i != 0):
+            if fitted:
+                fitted_vals[start] = np.nan
+            continue
+        yd = y_i[y_i > 0]
+        if not yd.size:
+            raise ValueError("TSB requires positive demand.")
+        yp = (y_i != 0).astype(np.int32)
+        ypf, _, ypft = _ses_fcst_mse(yp, alpha_p)
+        ydf, _, ydft = _ses_fcst_mse(yd, alpha_d)
+        mean[i * h : (i + 1) * h] = ypf * ydf
+        if fitted:
+            ydft = _expand_fitted_demand(np.append(ydft, ydf), y_i)
+            fitted_vals[start:end] = ypft * ydft
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 368
+class TSB(_TS):
     def __init__(
         self,
         alpha_d: float,
@@ -4961,7 +5939,45 @@ class TSB(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 363
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        r"""TSB predictions for several series at once.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series stacked in a single array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `y`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Same entries as `forecast`, with the values of all series stacked.
+        """
+        if level is not None:
+            raise ValueError("You must pass `prediction_intervals` to compute them.")
+        mean, fitted_vals = _tsb_batch(
+            _ensure_float(y), indptr, h, fitted, self.alpha_d, self.alpha_p
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/src/core/models.ipynb 381
 def _predict_mstl_components(mstl_ob, h, season_length):
     seasoncolumns = mstl_ob.filter(regex="seasonal*").columns
     nseasons = len(seasoncolumns)
@@ -4982,7 +5998,7 @@ def _predict_mstl_seas(mstl_ob, h, season_length):
     seascomp = _predict_mstl_components(mstl_ob, h, season_length)
     return seascomp.sum(axis=1)
 
-# %% ../nbs/src/core/models.ipynb 364
+# %% ../nbs/src/core/models.ipynb 382
 class MSTL(_TS):
     r"""MSTL model.
 
@@ -5070,6 +6086,8 @@ class MSTL(_TS):
         self :
             MSTL fitted model.
         """
+        from statsforecast.mstl import mstl
+
         self.model_ = mstl(
             x=y,
             period=self.season_length,
@@ -5172,6 +6190,8 @@ class MSTL(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.mstl import mstl
+
         model_ = mstl(
             x=y,
             period=self.season_length,
@@ -5232,6 +6252,8 @@ class MSTL(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.mstl import mstl
+
         if not hasattr(self.trend_forecaster, "model_"):
             raise Exception("You have to use the `fit` method first")
         model_ = mstl(
@@ -5259,7 +6281,7 @@ class MSTL(_TS):
         }
         return res
 
-# %% ../nbs/src/core/models.ipynb 380
+# %% ../nbs/src/core/models.ipynb 398
 class TBATS(_TS):
     r"""Trigonometric Box-Cox transform, ARMA errors, Trend and Seasonal components (TBATS) model.
 
@@ -5293,6 +6315,8 @@ class TBATS(_TS):
         Custom name of the model.
     """
 
+    cost_exponent = 1.5
+
     @_old_kw_to_pos(["seasonal_periods"], [1])
     def __init__(
         self,
@@ -5335,6 +6359,8 @@ class TBATS(_TS):
         self :
             TBATS model.
         """
+        from statsforecast.tbats import tbats_selection
+
         self.model_ = tbats_selection(
             y=y,
             seasonal_periods=self.season_length,
@@ -5364,6 +6390,8 @@ class TBATS(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.tbats import tbats_forecast, _compute_sigmah
+
         fcst = tbats_forecast(self.model_, h)
         res = {"mean": fcst["mean"]}
         if level is not None:
@@ -5440,6 +6468,8 @@ class TBATS(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.tbats import tbats_selection, tbats_forecast, _compute_sigmah
+
         mod = tbats_selection(
             y=y,
             seasonal_periods=self.season_length,
@@ -5471,7 +6501,7 @@ class TBATS(_TS):
             res_trans = res
         return res_trans
 
-# %% ../nbs/src/core/models.ipynb 388
+# %% ../nbs/src/core/models.ipynb 406
 class AutoTBATS(TBATS):
     r"""AutoTBATS model.
 
@@ -5530,7 +6560,7 @@ class AutoTBATS(TBATS):
             alias=alias,
         )
 
-# %% ../nbs/src/core/models.ipynb 398
+# %% ../nbs/src/core/models.ipynb 416
 class Theta(AutoTheta):
     r"""Standard Theta Method.
 
@@ -5550,6 +6580,9 @@ class Theta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default=200)
+        Number of sample paths used to compute the prediction intervals.
+        Fewer paths are faster but make the intervals noisier.
     """
 
     def __init__(
@@ -5558,6 +6591,7 @@ class Theta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "Theta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
     ):
         super().__init__(
             season_length=season_length,
@@ -5565,9 +6599,10 @@ class Theta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
         )
 
-# %% ../nbs/src/core/models.ipynb 412
+# %% ../nbs/src/core/models.ipynb 430
 class OptimizedTheta(AutoTheta):
     r"""Optimized Theta Method.
 
@@ -5587,6 +6622,9 @@ class OptimizedTheta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default=200)
+        Number of sample paths used to compute the prediction intervals.
+        Fewer paths are faster but make the intervals noisier.
     """
 
     def __init__(
@@ -5595,6 +6633,7 @@ class OptimizedTheta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "OptimizedTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
     ):
         super().__init__(
             season_length=season_length,
@@ -5602,9 +6641,10 @@ class OptimizedTheta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
         )
 
-# %% ../nbs/src/core/models.ipynb 426
+# %% ../nbs/src/core/models.ipynb 444
 class DynamicTheta(AutoTheta):
     r"""Dynamic Standard Theta Method.
 
@@ -5624,6 +6664,9 @@ class DynamicTheta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default=200)
+        Number of sample paths used to compute the prediction intervals.
+        Fewer paths are faster but make the intervals noisier.
     """
 
     def __init__(
@@ -5632,6 +6675,7 @@ class DynamicTheta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "DynamicTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
     ):
         super().__init__(
             season_length=season_length,
@@ -5639,9 +6683,10 @@ class DynamicTheta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
         )
 
-# %% ../nbs/src/core/models.ipynb 440
+# %% ../nbs/src/core/models.ipynb 458
 class DynamicOptimizedTheta(AutoTheta):
     r"""Dynamic Optimized Theta Method.
 
@@ -5661,6 +6706,9 @@ class DynamicOptimizedTheta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default=200)
+        Number of sample paths used to compute the prediction intervals.
+        Fewer paths are faster but make the intervals noisier.
     """
 
     def __init__(
@@ -5669,6 +6717,7 @@ class DynamicOptimizedTheta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "DynamicOptimizedTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
     ):
         super().__init__(
             season_length=season_length,
@@ -5676,9 +6725,10 @@ class DynamicOptimizedTheta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
         )
 
-# %% ../nbs/src/core/models.ipynb 455
+# %% ../nbs/src/core/models.ipynb 473
 class GARCH(_TS):
     r"""Generalized Autoregressive Conditional Heteroskedasticity (GARCH) model.
 
@@ -5751,6 +6801,8 @@ class GARCH(_TS):
         self :
             GARCH model.
         """
+        from statsforecast.garch import garch_model
+
         self.model_ = garch_model(y, p=self.p, q=self.q)
         self.model_["actual_residuals"] = y - self.model_["fitted"]
         self._store_cs(y, X)
@@ -5775,6 +6827,8 @@ class GARCH(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.garch import garch_forecast
+
         fcst = garch_forecast(self.model_, h)
         res = {"mean": fcst["mean"], "sigma2": fcst["sigma2"]}
         if level is None:
@@ -5843,6 +6897,8 @@ class GARCH(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
+        from statsforecast.garch import garch_model, garch_forecast
+
         mod = garch_model(y, p=self.p, q=self.q)
         fcst = garch_forecast(mod, h)
         keys = ["mean", "sigma2"]
@@ -5870,7 +6926,7 @@ class GARCH(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 468
+# %% ../nbs/src/core/models.ipynb 486
 class ARCH(GARCH):
     r"""Autoregressive Conditional Heteroskedasticity (ARCH) model.
 
@@ -5914,7 +6970,7 @@ class ARCH(GARCH):
         self.alias = alias
         super().__init__(p, q=0, alias=alias)
 
-# %% ../nbs/src/core/models.ipynb 479
+# %% ../nbs/src/core/models.ipynb 497
 class SklearnModel(_TS):
     r"""scikit-learn model wrapper
 
@@ -6120,7 +7176,7 @@ class SklearnModel(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 489
+# %% ../nbs/src/core/models.ipynb 507
 class MFLES(_TS):
     r"""MFLES model.
 
@@ -6249,6 +7305,8 @@ class MFLES(_TS):
         self.alias = alias
 
     def _fit(self, y: np.ndarray, X: Optional[np.ndarray]) -> Dict[str, Any]:
+        from statsforecast.mfles import MFLES as _MFLES
+
         model = _MFLES(verbose=self.verbose, robust=self.robust)
         fitted = model.fit(
             y=y,
@@ -6398,7 +7456,7 @@ class MFLES(_TS):
                 res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 497
+# %% ../nbs/src/core/models.ipynb 515
 class AutoMFLES(_TS):
     r"""AutoMFLES
 
@@ -6453,6 +7511,8 @@ class AutoMFLES(_TS):
         self.alias = alias
 
     def _fit(self, y: np.ndarray, X: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        from statsforecast.mfles import MFLES as _MFLES
+
         model = _MFLES(verbose=self.verbose)
         optim_params = model.optimize(
             y=y,
@@ -6597,7 +7657,7 @@ class AutoMFLES(_TS):
                 res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 501
+# %% ../nbs/src/core/models.ipynb 519
 class ConstantModel(_TS):
 
     def __init__(self, constant: float, alias: str = "ConstantModel"):
@@ -6780,7 +7840,7 @@ class ConstantModel(_TS):
         )
         return res
 
-# %% ../nbs/src/core/models.ipynb 515
+# %% ../nbs/src/core/models.ipynb 533
 class ZeroModel(ConstantModel):
 
     def __init__(self, alias: str = "ZeroModel"):
@@ -6795,7 +7855,7 @@ class ZeroModel(ConstantModel):
         """
         super().__init__(constant=0, alias=alias)
 
-# %% ../nbs/src/core/models.ipynb 529
+# %% ../nbs/src/core/models.ipynb 547
 class NaNModel(ConstantModel):
 
     def __init__(self, alias: str = "NaNModel"):
@@ -8,7 +8,6 @@ from typing import Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 
 # %% ../nbs/src/mstl.ipynb 4
 def mstl(
@@ -43,6 +42,9 @@ def mstl(
         )
     stl_kwargs = {"seasonal_deg": 0, **stl_kwargs}
     if msts[0] > 1:
+        # statsmodels is slow to import, so it's only loaded when needed
+        from statsmodels.tsa.seasonal import STL
+
         seas = np.zeros((len(msts), n))
         deseas = np.copy(x)
         if len(s_window) == 1:
@@ -50,7 +52,7 @@ def mstl(
         for j in range(iterate):
             for i, seas_ in enumerate(msts, start=0):
                 deseas = deseas + seas[i]
-                fit = sm.tsa.STL(
+                fit = STL(
                     deseas, period=seas_, seasonal=s_window[i], **stl_kwargs
                 ).fit()
                 seas[i] = fit.seasonal
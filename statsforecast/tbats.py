@@ -5,18 +5,16 @@ __all__ = ['tbats_model', 'tbats_selection', 'tbats_forecast']
 
 # %% ../nbs/src/tbats.ipynb 2
 import warnings
-from functools import partial
 from itertools import product
+from typing import Tuple
 
 import numpy as np
 import pandas as pd
-import scipy.linalg
 from coreforecast.scalers import boxcox, boxcox_lambda, inv_boxcox
 from numba import njit
-from numpy.polynomial.polynomial import Polynomial
-from scipy.optimize import minimize
 
 from .arima import auto_arima_f
+from .ets import results
 from .utils import NOGIL, CACHE
 
 # %% ../nbs/src/tbats.ipynb 7
@@ -338,6 +336,7 @@ def calcTBATSFaster(y_trans, w_transpose, g, F, x_nought):
     return yhat, e, x
 
 # %% ../nbs/src/tbats.ipynb 23
+@njit(nogil=NOGIL, cache=CACHE)
 def extract_params(
     params,
     use_boxcox,
@@ -394,6 +393,7 @@ def extract_params(
     )
 
 # %% ../nbs/src/tbats.ipynb 25
+@njit(nogil=NOGIL, cache=CACHE)
 def updateTBATSWMatrix(w_transpose, phi, tau, ar_coeffs, ma_coeffs, p, q):
     adjBeta = 0
 
@@ -401,19 +401,15 @@ def updateTBATSWMatrix(w_transpose, phi, tau, ar_coeffs, ma_coeffs, p, q):
         adjBeta = 1
         w_transpose[0, 1] = phi
 
-    if p != 0:
+    if ar_coeffs is not None:
         w_transpose[0, adjBeta + tau + 1 : adjBeta + tau + p + 1] = ar_coeffs
-        if q != 0:
-            w_transpose[0, adjBeta + tau + p + 1 : adjBeta + tau + p + q + 1] = (
-                ma_coeffs
-            )
-    elif q != 0:
-        # here p = 0
-        w_transpose[0, adjBeta + tau + 1 : adjBeta + tau + q + 1] = ma_coeffs
+    if ma_coeffs is not None:
+        w_transpose[0, adjBeta + tau + p + 1 : adjBeta + tau + p + q + 1] = ma_coeffs
 
     return w_transpose
 
 # %% ../nbs/src/tbats.ipynb 27
+@njit(nogil=NOGIL, cache=CACHE)
 def updateTBATSGMatrix(g, gamma_bold, alpha, beta, k_vector, gamma_one_v, gamma_two_v):
     # This function also updates gamma_bold
     adjBeta = 0
@@ -434,6 +430,7 @@ def updateTBATSGMatrix(g, gamma_bold, alpha, beta, k_vector, gamma_one_v, gamma_
     return g
 
 # %% ../nbs/src/tbats.ipynb 29
+@njit(nogil=NOGIL, cache=CACHE)
 def updateTBATSFMatrix(
     F, phi, alpha, beta, gamma_bold, ar_coeffs, ma_coeffs, p, q, tau
 ):
@@ -448,7 +445,7 @@ def updateTBATSFMatrix(
         if betaAdjust == 1:
             F[1, (betaAdjust + tau + 1) : (betaAdjust + tau + p + 1)] = beta * ar_coeffs
         if tau > 0:
-            B = np.dot(gamma_bold.reshape(-1, 1), ar_coeffs.reshape(1, -1))
+            B = np.outer(gamma_bold, ar_coeffs)
             F[
                 (1 + betaAdjust) : (betaAdjust + tau + 1),
                 (betaAdjust + tau + 1) : (betaAdjust + tau + p + 1),
@@ -465,7 +462,7 @@ def updateTBATSFMatrix(
                 beta * ma_coeffs
             )
         if tau > 0:
-            C = np.dot(gamma_bold.reshape(-1, 1), ma_coeffs.reshape(1, -1))
+            C = np.outer(gamma_bold, ma_coeffs)
             F[
                 (1 + betaAdjust) : (betaAdjust + tau + 1),
                 (betaAdjust + tau + p + 1) : (betaAdjust + tau + p + q + 1),
@@ -479,6 +476,7 @@ def updateTBATSFMatrix(
     return F
 
 # %% ../nbs/src/tbats.ipynb 31
+@njit(nogil=NOGIL, cache=CACHE)
 def checkAdmissibility(
     BoxCox_lambda, bc_lower_bound, bc_upper_bound, phi, ar_coeffs, ma_coeffs, D
 ):
@@ -493,26 +491,48 @@ def checkAdmissibility(
     if ar_coeffs is not None:
         ar_lags = np.where(np.abs(ar_coeffs) > 1e-08)[0]
         if len(ar_lags) > 0:
-            pval = max(ar_lags) + 1
-            poly_coeffs = [1] + [-coef for coef in ar_coeffs[:pval]]
-            roots = Polynomial(poly_coeffs).roots()
+            pval = ar_lags.max() + 1
+            poly_coeffs = np.empty(pval + 1, dtype=np.complex128)
+            poly_coeffs[0] = 1
+            poly_coeffs[1:] = -ar_coeffs[:pval]
+            roots = np.roots(poly_coeffs[::-1])
             if np.min(np.abs(roots)) < 1 + 1e-2:
                 return False
 
     if ma_coeffs is not None:
         ma_lags = np.where(np.abs(ma_coeffs) > 1e-08)[0]
         if len(ma_lags) > 0:
-            qval = max(ma_lags) + 1
-            poly_coeffs = [1] + list(ma_coeffs[:qval])
-            roots = Polynomial(poly_coeffs).roots()
+            qval = ma_lags.max() + 1
+            poly_coeffs = np.empty(qval + 1, dtype=np.complex128)
+            poly_coeffs[0] = 1
+            poly_coeffs[1:] = ma_coeffs[:qval]
+            roots = np.roots(poly_coeffs[::-1])
             if np.min(np.abs(roots)) < 1 + 1e-2:
                 return False
 
-    D_eigen_values = scipy.linalg.eig(D, right=False)
+    D_eigen_values = np.linalg.eigvals(D.astype(np.complex128))
 
-    return np.all(abs(D_eigen_values) < 1 + 1e-2)
+    return np.all(np.abs(D_eigen_values) < 1 + 1e-2)
 
 # %% ../nbs/src/tbats.ipynb 33
+@njit(nogil=NOGIL, cache=CACHE)
+def _boxcox(x, lmbda):
+    # same operations as coreforecast's boxcox, so that the optimizer
+    # follows the same path as when the likelihood called it
+    out = np.empty_like(x)
+    for i in range(x.size):
+        if lmbda < 0 and x[i] < 0:
+            out[i] = np.nan
+        elif abs(lmbda) < 1e-19:
+            out[i] = np.log(x[i])
+        elif x[i] > 0:
+            out[i] = np.expm1(lmbda * np.log(x[i])) / lmbda
+        else:
+            out[i] = (-1.0 - np.exp(lmbda * np.log(-x[i]))) / lmbda
+    return out
+
+
+@njit(nogil=NOGIL, cache=CACHE)
 def calcLikelihoodTBATS(
     params,
     use_boxcox,
@@ -558,8 +578,8 @@ def calcLikelihoodTBATS(
     )
 
     if use_boxcox:
-        x_nought = boxcox(x_nought_untransformed, BoxCox_lambda)
-        y_trans = boxcox(y, BoxCox_lambda)
+        x_nought = _boxcox(x_nought_untransformed, BoxCox_lambda)
+        y_trans = _boxcox(y, BoxCox_lambda)
     _, e, _ = calcTBATSFaster(y_trans, w_transpose, g, F, x_nought)
 
     n = len(y_trans)
@@ -577,9 +597,101 @@ def calcLikelihoodTBATS(
     ):
         return log_likelihood
     else:
-        return 10**20
+        return 1e20
 
-# %% ../nbs/src/tbats.ipynb 36
+# %% ../nbs/src/tbats.ipynb 35
+@njit(nogil=NOGIL, cache=CACHE)
+def nelder_mead_tbats(
+    x0: np.ndarray,
+    args: Tuple = (),
+    init_step: float = 0.05,
+    zero_pert: float = 0.00025,
+    alpha: float = 1.0,
+    gamma: float = 2.0,
+    rho: float = 0.5,
+    sigma: float = 0.5,
+    max_iter: int = 2_000,
+    xatol: float = 1e-4,
+    fatol: float = 1e-4,
+):
+    # Port of scipy's Nelder-Mead without bounds: same initial simplex, steps,
+    # sorting and xatol/fatol stopping rule, so that it takes the same steps as
+    # `scipy.optimize.minimize(method="Nelder-Mead")` on the same objective.
+    n = x0.size
+    simplex = np.empty((n + 1, n), dtype=np.float64)  # each row is x_j
+    simplex[:] = x0
+    for j in range(n):
+        if simplex[j + 1, j] != 0.0:
+            simplex[j + 1, j] *= 1 + init_step
+        else:
+            simplex[j + 1, j] = zero_pert
+    # array of the value of f
+    f_simplex = np.empty(n + 1, dtype=np.float64)
+    for j in range(n + 1):
+        f_simplex[j] = calcLikelihoodTBATS(simplex[j], *args)
+    # keep the simplex sorted by f, with ties in their current order like numpy
+    order_f = np.argsort(f_simplex, kind="mergesort")
+    simplex = simplex[order_f]
+    f_simplex = f_simplex[order_f]
+    it = 1
+    while it < max_iter:
+        # Check whether method should stop.
+        if (
+            np.max(np.abs(simplex[1:] - simplex[0])) <= xatol
+            and np.max(np.abs(f_simplex[0] - f_simplex[1:])) <= fatol
+        ):
+            break
+        # centroid of the n best points, summed in order
+        x_o = simplex[0].copy()
+        for j in range(1, n):
+            x_o += simplex[j]
+        x_o /= n
+        # Reflection
+        x_r = (1 + alpha) * x_o - alpha * simplex[-1]
+        f_r = calcLikelihoodTBATS(x_r, *args)
+        shrink = False
+        if f_r < f_simplex[0]:
+            # Expansion
+            x_e = (1 + alpha * gamma) * x_o - alpha * gamma * simplex[-1]
+            f_e = calcLikelihoodTBATS(x_e, *args)
+            if f_e < f_r:
+                simplex[-1] = x_e
+                f_simplex[-1] = f_e
+            else:
+                simplex[-1] = x_r
+                f_simplex[-1] = f_r
+        elif f_r < f_simplex[-2]:
+            simplex[-1] = x_r
+            f_simplex[-1] = f_r
+        elif f_r < f_simplex[-1]:
+            # outside contraction
+            x_oc = (1 + rho * alpha) * x_o - rho * alpha * simplex[-1]
+            f_oc = calcLikelihoodTBATS(x_oc, *args)
+            if f_oc <= f_r:
+                simplex[-1] = x_oc
+                f_simplex[-1] = f_oc
+            else:
+                shrink = True
+        else:
+            # inside contraction
+            x_ic = (1 - rho) * x_o + rho * simplex[-1]
+            f_ic = calcLikelihoodTBATS(x_ic, *args)
+            if f_ic < f_simplex[-1]:
+                simplex[-1] = x_ic
+                f_simplex[-1] = f_ic
+            else:
+                shrink = True
+        if shrink:
+            for j in range(1, n + 1):
+                simplex[j] = simplex[0] + sigma * (simplex[j] - simplex[0])
+                f_simplex[j] = calcLikelihoodTBATS(simplex[j], *args)
+        it += 1
+        order_f = np.argsort(f_simplex, kind="mergesort")
+        simplex = simplex[order_f]
+        f_simplex = f_simplex[order_f]
+    return results(simplex[0], f_simplex.min(), it, simplex)
+
+# %% ../nbs/src/tbats.ipynb 38
 def tbats_model_generator(
     y,
     seasonal_periods,
@@ -716,36 +828,32 @@ def tbats_model_generator(
     scale = np.array(scale)
     params = params / scale
 
-    objective_fn = partial(
-        calcLikelihoodTBATS,
-        use_boxcox=use_boxcox,
-        use_trend=use_trend,
-        use_damped_trend=use_damped_trend,
-        use_arma_errors=use_arma_errors,
-        y=y,
-        y_trans=y_trans,
-        seasonal_periods=seasonal_periods,
-        k_vector=k_vector,
-        tau=tau,
-        w_transpose=w_transpose,
-        F=F,
-        g=g,
-        gamma_bold=gamma_bold,
-        x_nought=x_nought,
-        x_nought_untransformed=x_nought_untransformed,
-        bc_lower_bound=bc_lower_bound,
-        bc_upper_bound=bc_upper_bound,
-        p=p,
-        q=q,
-        scale=scale,
-    )
-
     # Solve optimization problem
-    res = minimize(
-        objective_fn,
+    res = nelder_mead_tbats(
         params,
-        method="Nelder-Mead",
-        options={"maxiter": 100 * params.size**2},
+        args=(
+            use_boxcox,
+            use_trend,
+            use_damped_trend,
+            use_arma_errors,
+            y,
+            y_trans,
+            seasonal_periods,
+            k_vector,
+            tau,
+            w_transpose,
+            F,
+            g,
+            gamma_bold,
+            x_nought,
+            x_nought_untransformed,
+            bc_lower_bound,
+            bc_upper_bound,
+            p,
+            q,
+            scale,
+        ),
+        max_iter=100 * params.size**2,
     )
     optim_params = res.x * scale
 
@@ -803,7 +911,7 @@ def tbats_model_generator(
     sigma2 = np.sum(errors * errors) / len(y_trans)
 
     # Calculate log-likelihood
-    log_likelihood = res.fun
+    log_likelihood = res.fn
 
     # AIC
     kval = len(optim_params) + x_nought.shape[0]
@@ -838,7 +946,7 @@ def tbats_model_generator(
 
     return res
 
-# %% ../nbs/src/tbats.ipynb 38
+# %% ../nbs/src/tbats.ipynb 40
 def tbats_model(
     y,
     seasonal_periods,
@@ -919,7 +1027,7 @@ def tbats_model(
 
     return best_model
 
-# %% ../nbs/src/tbats.ipynb 40
+# %% ../nbs/src/tbats.ipynb 42
 def tbats_selection(
     y,
     seasonal_periods,
@@ -938,6 +1046,11 @@ def tbats_selection(
     # Sort seasonal periods
     seasonal_periods = np.sort(seasonal_periods)
 
+    # The models are compared by their likelihood, compute in double precision
+    # and keep the per observation arrays in the precision of the serie
+    dtype = np.result_type(y.dtype, np.float32)
+    y = y.astype(np.float64)
+
     # Check if there are missing values
     indices = np.where(np.isnan(y))[0]
     if len(indices) > 0:
@@ -1002,9 +1115,12 @@ def tbats_selection(
         if new_mod["aic"] < mod["aic"]:
             mod = new_mod
 
+    if "x" in mod:
+        for key in ("fitted", "errors", "x"):
+            mod[key] = mod[key].astype(dtype, copy=False)
     return mod
 
-# %% ../nbs/src/tbats.ipynb 42
+# %% ../nbs/src/tbats.ipynb 44
 def tbats_forecast(mod, h):  # this function is the same as bats_forecast
     fcst = np.zeros(h)
     xx = np.zeros((h, mod["x"].shape[1]))
@@ -1022,7 +1138,7 @@ def tbats_forecast(mod, h):  # this function is the same as bats_forecast
 
     return res
 
-# %% ../nbs/src/tbats.ipynb 43
+# %% ../nbs/src/tbats.ipynb 45
 def _compute_sigmah(obj, h):
     """
     Computes the sigmah requiered for prediction intervals
@@ -9,12 +9,16 @@ from typing import Tuple
 
 import numpy as np
 from numba import njit
-from scipy.stats import norm
-from statsmodels.tsa.seasonal import seasonal_decompose
-from statsmodels.tsa.stattools import acf
+from scipy.special import ndtri
 
 from .ets import restrict_to_bounds, results
-from .utils import _seasonal_naive, _repeat_val_seas, CACHE, NOGIL
+from statsforecast.utils import (
+    _seasonal_naive,
+    _repeat_val_seas,
+    _samples_quantiles,
+    CACHE,
+    NOGIL,
+)
 
 # %% ../nbs/src/theta.ipynb 4
 # Global variables
@@ -522,26 +526,33 @@ def thetamodel(
     )
 
 # %% ../nbs/src/theta.ipynb 28
+@njit(nogil=NOGIL, cache=CACHE)
 def compute_pi_samples(
     n, h, states, sigma, alpha, theta, mean_y, seed=0, n_samples=200
 ):
     samples = np.full((h, n_samples), fill_value=np.nan, dtype=np.float32)
     # states: level, meany, An, Bn, mu
-    smoothed, _, A, B, _ = states[-1]
+    smoothed = np.full(n_samples, states[-1, 0], dtype=np.float64)
+    A = np.full(n_samples, states[-1, 2], dtype=np.float64)
+    B = np.full(n_samples, states[-1, 3], dtype=np.float64)
+    mean_y = np.full(n_samples, mean_y, dtype=np.float64)
     np.random.seed(seed)
     for i in range(n, n + h):
-        samples[i - n] = smoothed + (1 - 1 / theta) * (
-            A * ((1 - alpha) ** i) + B * (1 - (1 - alpha) ** (i + 1)) / alpha
-        )
-        samples[i - n] += np.random.normal(scale=sigma, size=n_samples)
-        smoothed = alpha * samples[i - n] + (1 - alpha) * smoothed
-        mean_y = (i * mean_y + samples[i - n]) / (i + 1)
-        B = ((i - 1) * B + 6 * (samples[i - n] - mean_y) / (i + 1)) / (i + 2)
-        A = mean_y - B * (i + 2) / 2
+        for k in range(n_samples):
+            samples[i - n, k] = smoothed[k] + (1 - 1 / theta) * (
+                A[k] * ((1 - alpha) ** i) + B[k] * (1 - (1 - alpha) ** (i + 1)) / alpha
+            )
+            samples[i - n, k] += np.random.normal(0.0, sigma)
+            smoothed[k] = alpha * samples[i - n, k] + (1 - alpha) * smoothed[k]
+            mean_y[k] = (i * mean_y[k] + samples[i - n, k]) / (i + 1)
+            B[k] = ((i - 1) * B[k] + 6 * (samples[i - n, k] - mean_y[k]) / (i + 1)) / (
+                i + 2
+            )
+            A[k] = mean_y[k] - B[k] * (i + 2) / 2
     return samples
 
 # %% ../nbs/src/theta.ipynb 29
-def forecast_theta(obj, h, level=None):
+def forecast_theta(obj, h, level=None, n_samples=200):
     forecast = np.full(h, fill_value=np.nan)
     n = obj["n"]
     states = obj["states"]
@@ -569,12 +580,14 @@ def forecast_theta(obj, h, level=None):
             alpha=alpha,
             theta=theta,
             mean_y=mean_y,
+            n_samples=n_samples,
         )
-        for lv in level:
-            min_q = (100 - lv) / 200
-            max_q = min_q + lv / 100
-            res[f"lo-{lv}"] = np.quantile(samples, min_q, axis=1)
-            res[f"hi-{lv}"] = np.quantile(samples, max_q, axis=1)
+        min_q = (100 - np.asarray(level)) / 200
+        max_q = min_q + np.asarray(level) / 100
+        quantiles = _samples_quantiles(samples, np.hstack([min_q, max_q]))
+        for i, lv in enumerate(level):
+            res[f"lo-{lv}"] = quantiles[i]
+            res[f"hi-{lv}"] = quantiles[len(level) + i]
 
     if obj.get("decompose", False):
         seas_forecast = _repeat_val_seas(obj["seas_forecast"]["mean"], h=h)
@@ -585,7 +598,7 @@ def forecast_theta(obj, h, level=None):
                 res[key] = res[key] + seas_forecast
     return res
 
-# %% ../nbs/src/theta.ipynb 31
+# %% ../nbs/src/theta.ipynb 32
 def auto_theta(
     y,
     m,
@@ -621,12 +634,17 @@ def auto_theta(
     decompose = False
     # seasonal test
     if m >= 4 and len(y) >= 2 * m:
+        # statsmodels is slow to import, so it's only loaded when needed
+        from statsmodels.tsa.stattools import acf
+
         r = acf(y, nlags=m, fft=False)[1:]
         stat = np.sqrt((1 + 2 * np.sum(r[:-1] ** 2)) / len(y))
-        decompose = np.abs(r[-1]) / stat > norm.ppf(0.95)
+        decompose = np.abs(r[-1]) / stat > ndtri(0.95)
 
     data_positive = min(y) > 0
     if decompose:
+        from statsmodels.tsa.seasonal import seasonal_decompose
+
         # change decomposition type if data is not positive
         if decomposition_type == "multiplicative" and not data_positive:
             decomposition_type = "additive"
@@ -634,6 +652,8 @@ def auto_theta(
         if decomposition_type == "multiplicative" and any(y_decompose < 0.01):
             decomposition_type = "additive"
             y_decompose = seasonal_decompose(y, model="additive", period=m).seasonal
+        # statsmodels returns float64, keep the serie in its own precision
+        y_decompose = y_decompose.astype(y.dtype, copy=False)
         if decomposition_type == "additive":
             y = y - y_decompose
         else:
@@ -685,7 +705,7 @@ def auto_theta(
         model["seas_forecast"] = dict(seas_forecast)
     return model
 
-# %% ../nbs/src/theta.ipynb 41
+# %% ../nbs/src/theta.ipynb 42
 def forward_theta(fitted_model, y):
     m = fitted_model["m"]
     model = fitted_model["modeltype"]
@@ -700,3 +720,63 @@ def forward_theta(fitted_model, y):
         alpha=alpha,
         theta=theta,
     )
+
+# %% ../nbs/src/theta.ipynb 44
+@njit(nogil=NOGIL, cache=CACHE)
+def thetaupdatestates(states, n, y, modeltype, alpha, theta, e):
+    # states has the n fitted states followed by space for the new ones
+    for i in range(y.size):
+        thetaupdate(
+            states=states,
+            i=n + i,
+            modeltype=modeltype,
+            alpha=alpha,
+            theta=theta,
+            y=y[i],
+            usemu=0,
+        )
+        e[i] = y[i] - states[n + i, 4]
+
+
+def update_theta(fitted_model, y):
+    # the trend of the static models and the seasonal indices are the ones
+    # estimated in the fit
+    n = fitted_model["n"]
+    k = y.size
+    decompose = fitted_model.get("decompose", False)
+    if decompose:
+        seas_mean = fitted_model["seas_forecast"]["mean"]
+        seas = _repeat_val_seas(seas_mean, h=k)
+        if fitted_model["decomposition_type"] == "multiplicative":
+            y = y / seas
+        else:
+            y = y - seas
+    states = np.zeros((n + k, 5), dtype=np.float32)
+    states[:n] = fitted_model["states"]
+    e = np.full_like(y, fill_value=np.nan)
+    thetaupdatestates(
+        states=states,
+        n=n,
+        y=y,
+        modeltype=switch_theta(fitted_model["modeltype"]),
+        alpha=fitted_model["par"]["alpha"],
+        theta=fitted_model["par"]["theta"],
+        e=e,
+    )
+    model = {
+        **fitted_model,
+        "states": states,
+        "n": n + k,
+        "mean_y": (fitted_model["mean_y"] * n + y.sum()) / (n + k),
+    }
+    if decompose:
+        if fitted_model["decomposition_type"] == "multiplicative":
+            e = e * seas
+        else:
+            e = e + seas
+        model["seas_forecast"] = {
+            **fitted_model["seas_forecast"],
+            "mean": _repeat_val_seas(seas_mean, h=k + seas_mean.size)[k:],
+        }
+    model["residuals"] = np.append(fitted_model["residuals"], e)
+    return model
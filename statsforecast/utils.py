@@ -8,12 +8,13 @@ import inspect
 import math
 import os
 import warnings
-from functools import wraps
-from typing import Dict
+from functools import lru_cache, wraps
+from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
+from numba import njit
+from scipy.special import ndtri
 
 from utilsforecast.compat import DataFrame
 from utilsforecast.data import generate_series as utils_generate_series
@@ -294,18 +295,22 @@ def _ensure_float(x: np.ndarray) -> np.ndarray:
 
 # %% ../nbs/src/utils.ipynb 19
 # Functions used for calculating prediction intervals
-def _quantiles(level):
-    level = np.asarray(level)
-    z = norm.ppf(0.5 + level / 200)
+@lru_cache(maxsize=128)
+def _level_quantiles(level: Tuple) -> np.ndarray:
+    # the same levels are used for every serie, so they're only computed once
+    z = ndtri(0.5 + np.array(level) / 200)
+    z.flags.writeable = False
     return z
 
 
+def _quantiles(level):
+    return _level_quantiles(tuple(np.asarray(level).ravel().tolist()))
+
+
 def _calculate_intervals(out, level, h, sigmah):
-    z = _quantiles(np.asarray(level))
-    zz = np.repeat(z, h)
-    zz = zz.reshape(z.shape[0], h)
-    lower = out["mean"] - zz * sigmah
-    upper = out["mean"] + zz * sigmah
+    z = _quantiles(level)
+    lower = out["mean"] - z[:, None] * sigmah
+    upper = out["mean"] + z[:, None] * sigmah
     pred_int = {
         **{f"lo-{lv}": lower[i] for i, lv in enumerate(level)},
         **{f"hi-{lv}": upper[i] for i, lv in enumerate(level)},
@@ -313,6 +318,27 @@ def _calculate_intervals(out, level, h, sigmah):
     return pred_int
 
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _samples_quantiles(samples, probs):
+    # sorts the samples of each horizon once and interpolates
+    # linearly between the order statistics, like np.quantile
+    h, n_samples = samples.shape
+    out = np.empty((probs.size, h))
+    for j in range(h):
+        sorted_samples = np.sort(samples[j])
+        if np.isnan(sorted_samples[-1]):
+            out[:, j] = np.nan
+            continue
+        for i in range(probs.size):
+            pos = probs[i] * (n_samples - 1)
+            lo = int(math.floor(pos))
+            hi = min(lo + 1, n_samples - 1)
+            out[i, j] = sorted_samples[lo] + (pos - lo) * (
+                sorted_samples[hi] - sorted_samples[lo]
+            )
+    return out
+
+
 def _calculate_sigma(residuals, n):
     if n > 0:
         sigma = np.nansum(residuals**2)
@@ -322,7 +348,7 @@ def _calculate_sigma(residuals, n):
         sigma = 0
     return sigma
 
-# %% ../nbs/src/utils.ipynb 20
+# %% ../nbs/src/utils.ipynb 22
 class ConformalIntervals:
     """Class for storing conformal intervals metadata information."""
 
@@ -343,7 +369,7 @@ class ConformalIntervals:
         self.h = h
         self.method = method
 
-# %% ../nbs/src/utils.ipynb 21
+# %% ../nbs/src/utils.ipynb 23
 def _old_kw_to_pos(old_names, new_positions):
     def decorator(f):
         @wraps(f)